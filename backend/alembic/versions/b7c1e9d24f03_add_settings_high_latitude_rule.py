@@ -0,0 +1,30 @@
+"""add high-latitude rule to settings
+
+Revision ID: b7c1e9d24f03
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-17
+
+Adds a nullable ``high_latitude_rule`` column to the settings table: the
+Fajr/Isha rule a device uses when the twilight angle is never reached (see
+``src/calculations/high_latitude.py``). NULL keeps the engine default.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c1e9d24f03"
+down_revision: Union[str, None] = "a1b2c3d4e5f6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("settings") as batch_op:
+        batch_op.add_column(sa.Column("high_latitude_rule", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("settings") as batch_op:
+        batch_op.drop_column("high_latitude_rule")
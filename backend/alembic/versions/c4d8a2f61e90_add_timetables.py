@@ -0,0 +1,49 @@
+"""add persisted timetables
+
+Revision ID: c4d8a2f61e90
+Revises: b7c1e9d24f03
+Create Date: 2026-10-17
+
+Adds the ``timetables`` table: one year of prayer times per location and
+calculation configuration, stored as a float64 blob of UTC minutes. Entries
+are tagged with the engine version that built them and recomputed when it
+changes, so the table can be emptied at any time.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4d8a2f61e90"
+down_revision: Union[str, None] = "b7c1e9d24f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "timetables",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("lat_e4", sa.Integer(), nullable=False),
+        sa.Column("lon_e4", sa.Integer(), nullable=False),
+        sa.Column("method", sa.String(), nullable=False),
+        sa.Column("madhab", sa.String(), nullable=False),
+        sa.Column("shafaq", sa.String(), nullable=False),
+        sa.Column("precision", sa.String(), nullable=False),
+        sa.Column("high_latitude_rule", sa.String(), nullable=False),
+        sa.Column("year", sa.Integer(), nullable=False),
+        sa.Column("engine_version", sa.String(), nullable=False),
+        sa.Column("minutes", sa.LargeBinary(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "lat_e4", "lon_e4", "method", "madhab", "shafaq", "precision", "high_latitude_rule", "year",
+            name="uq_timetables_key",
+        ),
+    )
+    op.create_index("ix_timetables_engine_version", "timetables", ["engine_version"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_timetables_engine_version", table_name="timetables")
+    op.drop_table("timetables")
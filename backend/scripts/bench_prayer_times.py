@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark the prayer-time range engines.
+
+Compares the legacy ``compute_year`` (365 jobs on a ThreadPoolExecutor) with
+the chunked range engine, in-process and on a process pool, for one or more
+years at a single location.
+
+Usage:
+    uv run python scripts/bench_prayer_times.py --years 1 --workers 4
+    uv run python scripts/bench_prayer_times.py --years 10 --repeat 3
+"""
+import argparse
+import calendar
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.calculations.adhan_calc import PrayerTimes  # noqa: E402
+from src.calculations.batch import np  # noqa: E402
+
+PARIS = (48.8566, 2.3522)
+
+
+def legacy_year(pt: PrayerTimes, year: int, lat: float, lon: float):
+    """The pre-range-engine implementation of compute_year, kept as a baseline."""
+    with ThreadPoolExecutor() as ex:
+        futures = [
+            ex.submit(pt.compute, date(year, m, d), lat, lon)
+            for m in range(1, 13)
+            for d in range(1, calendar.monthrange(year, m)[1] + 1)
+        ]
+        return [f.result() for f in futures]
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--years", type=int, default=1, help="number of consecutive years (from 2025)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="process-pool size")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per engine; best time is reported")
+    parser.add_argument("--method", default="MWL")
+    args = parser.parse_args()
+
+    pt = PrayerTimes(args.method, "Shafi", "Europe/Paris")
+    years = range(2025, 2025 + args.years)
+    lat, lon = PARIS
+
+    engines = {
+        "legacy ThreadPoolExecutor": lambda: [legacy_year(pt, y, lat, lon) for y in years],
+        "range engine, in-process": lambda: [pt.compute_year(y, lat, lon) for y in years],
+        f"range engine, {args.workers} processes": lambda: list(pt.compute_range(
+            date(years[0], 1, 1), date(years[-1], 12, 31), lat, lon, workers=args.workers)),
+    }
+
+    print(f"numpy: {'yes' if np is not None else 'no (scalar fallback)'}, "
+          f"{args.years} year(s), best of {args.repeat}")
+    baseline = None
+    for name, fn in engines.items():
+        elapsed = best_of(fn, args.repeat)
+        baseline = baseline or elapsed
+        print(f"{name:<32} {elapsed * 1000:9.1f} ms  x{baseline / elapsed:5.1f}")
+
+
+if __name__ == "__main__":
+    main()
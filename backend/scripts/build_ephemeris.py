@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Build the memory-mapped solar ephemeris table used by PrayerTimes.
+
+Samples ``PrayerTimes.sun_position`` (declination + equation of time) every
+6 hours from 1900 to 2100 and writes a compact float64 table (~4.7 MB) that
+the engine maps lazily and interpolates instead of evaluating trigonometry.
+Without the file, the engine silently uses the analytic formulas.
+
+Usage:
+    uv run python scripts/build_ephemeris.py
+    uv run python scripts/build_ephemeris.py --out /tmp/ephemeris.bin --step 0.125
+
+Rebuild whenever ``PrayerTimes.sun_position`` changes.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from src.calculations.adhan_calc import PrayerTimes  # noqa: E402
+from src.calculations.ephemeris import DEFAULT_PATH, DEFAULT_STEP_DAYS, build_table  # noqa: E402
+
+FIRST_YEAR, LAST_YEAR = 1900, 2100
+# Events are solved up to ~2.5 days after 0h UT (next-day sunrise plus
+# refinement); interpolation needs one extra sample on each side.
+MARGIN_BEFORE_DAYS, MARGIN_AFTER_DAYS = 2, 4
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--out", default=str(DEFAULT_PATH), help="output file")
+    parser.add_argument("--step", type=float, default=DEFAULT_STEP_DAYS, help="sample step in days (must divide 1)")
+    args = parser.parse_args()
+
+    jd_start = PrayerTimes.julian_day(FIRST_YEAR, 1, 1) - MARGIN_BEFORE_DAYS
+    jd_end = PrayerTimes.julian_day(LAST_YEAR, 12, 31) + MARGIN_AFTER_DAYS
+    count = build_table(args.out, PrayerTimes.sun_position, jd_start, jd_end, args.step)
+    size_mb = os.path.getsize(args.out) / 1e6
+    print(f"Wrote {count} samples ({size_mb:.1f} MB) to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
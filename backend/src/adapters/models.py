@@ -1,7 +1,7 @@
 import base64
 import json
 from datetime import date
-from sqlalchemy import Integer, Float, String, LargeBinary, ForeignKey, Date, Boolean, JSON
+from sqlalchemy import Integer, Float, String, LargeBinary, ForeignKey, Date, Boolean, JSON, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.adapters.base.sql_repository_base import Base
 
@@ -108,6 +108,7 @@ class SettingsTable(Base):
     enable_scheduler: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     selected_method: Mapped[str | None] = mapped_column(String, nullable=True)
     force_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+    high_latitude_rule: Mapped[str | None] = mapped_column(String, nullable=True)
 
     # Foreign keys
     city_id: Mapped[int | None] = mapped_column(ForeignKey("cities.id"))
@@ -136,6 +137,7 @@ class SettingsTable(Base):
             "enable_scheduler": self.enable_scheduler,
             "selected_method": self.selected_method,
             "force_date": self.force_date,
+            "high_latitude_rule": self.high_latitude_rule,
             "city_id": self.city_id,
             "device_id": self.device_id,
             "audio_id": self.audio_id,
@@ -150,3 +152,31 @@ class SettingsTable(Base):
 
     def __repr__(self):
         return f"<Settings(id={self.id}, volume={self.volume}, scheduler={self.enable_scheduler})>"
+
+
+class TimetableTable(Base):
+    """One persisted year of prayer times (see ``src/services/timetable_service.py``)."""
+
+    __tablename__ = "timetables"
+    __table_args__ = (
+        UniqueConstraint(
+            "lat_e4", "lon_e4", "method", "madhab", "shafaq", "precision", "high_latitude_rule", "year",
+            name="uq_timetables_key",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    # Coordinates in 1e-4 degree units, so the key compares exactly.
+    lat_e4: Mapped[int] = mapped_column(Integer, nullable=False)
+    lon_e4: Mapped[int] = mapped_column(Integer, nullable=False)
+    method: Mapped[str] = mapped_column(String, nullable=False)
+    madhab: Mapped[str] = mapped_column(String, nullable=False)
+    shafaq: Mapped[str] = mapped_column(String, nullable=False)
+    precision: Mapped[str] = mapped_column(String, nullable=False)
+    high_latitude_rule: Mapped[str] = mapped_column(String, nullable=False)
+    year: Mapped[int] = mapped_column(Integer, nullable=False)
+    engine_version: Mapped[str] = mapped_column(String, nullable=False, index=True)
+    minutes: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    def __repr__(self):
+        return f"<Timetable({self.lat_e4 / 1e4}, {self.lon_e4 / 1e4}, {self.method}, {self.year})>"
@@ -1,4 +1,5 @@
 from .postgres_city_repository import PostgresCityRepository
 from .postgres_device_repository import PostgresDeviceRepository
 from .postgres_settings_repository import PostgresSettingsRepository
-from .postgres_audio_repository import PostgresAudioRepository
\ No newline at end of file
+from .postgres_audio_repository import PostgresAudioRepository
+from .postgres_timetable_repository import PostgresTimetableRepository
\ No newline at end of file
@@ -0,0 +1,8 @@
+from src.adapters.sqlite import SQLiteTimetableRepository
+
+
+class PostgresTimetableRepository(SQLiteTimetableRepository):
+    """PostgreSQL implementation of TimetableRepository."""
+    def __init__(self, dsn: str):
+        """Initialize with PostgreSQL connection string."""
+        super().__init__(dsn)
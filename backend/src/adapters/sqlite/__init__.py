@@ -1,4 +1,5 @@
 from .sqlite_city_repository import SQLiteCityRepository
 from .sqlite_device_repository import SQLiteDeviceRepository
 from .sqlite_settings_repository import SQLiteSettingsRepository
-from .sqlite_audio_repository import SQLiteAudioRepository
\ No newline at end of file
+from .sqlite_audio_repository import SQLiteAudioRepository
+from .sqlite_timetable_repository import SQLiteTimetableRepository
\ No newline at end of file
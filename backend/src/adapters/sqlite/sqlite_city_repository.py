@@ -85,6 +85,22 @@ class SQLiteCityRepository(SQLRepositoryBase, CityRepository):
                 return City(**city.get_dict())
         return None
 
+    def get_cities_by_ids(self, city_ids: List[int]) -> List[City]:
+        """Retrieve many cities by ID, in request order. Unknown IDs are skipped."""
+        found: dict[int, City] = {}
+        unique_ids = list(dict.fromkeys(city_ids))
+        with self.session_maker() as session:
+            # Chunked to stay under SQLite's bound-parameter limit.
+            for i in range(0, len(unique_ids), 500):
+                rows = (
+                    session.query(CityTable.id, CityTable.name, CityTable.lat, CityTable.lon, CityTable.country)
+                    .filter(CityTable.id.in_(unique_ids[i:i + 500]))
+                    .all()
+                )
+                for r in rows:
+                    found[r.id] = City(id=r.id, name=r.name, lat=r.lat, lon=r.lon, country=r.country)
+        return [found[city_id] for city_id in city_ids if city_id in found]
+
     def add_city(self, city: City) -> None:
         """Add a new city record."""
         with self.session_maker() as session:
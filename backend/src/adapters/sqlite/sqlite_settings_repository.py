@@ -87,6 +87,7 @@ class SQLiteSettingsRepository(SQLRepositoryBase, SettingsRepository):
                     existing_setting.enable_scheduler = setting.enable_scheduler
                     existing_setting.selected_method = setting.selected_method
                     existing_setting.force_date = setting.force_date
+                    existing_setting.high_latitude_rule = setting.high_latitude_rule
                     existing_setting.city_id = setting.city_id
                     existing_setting.device_id = setting.device_id if setting.device_id else existing_setting.device_id  # keep this!
                     existing_setting.audio_id = setting.audio_id
@@ -100,6 +101,7 @@ class SQLiteSettingsRepository(SQLRepositoryBase, SettingsRepository):
                         enable_scheduler=setting.enable_scheduler,
                         selected_method=setting.selected_method,
                         force_date=setting.force_date,
+                        high_latitude_rule=setting.high_latitude_rule,
                         city_id=setting.city_id,
                         device_id=setting.device_id,
                         audio_id=setting.audio_id
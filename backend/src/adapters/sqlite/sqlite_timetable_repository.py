@@ -0,0 +1,63 @@
+from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from src.adapters.base import SQLRepositoryBase
+from src.domain import TimetableRepository
+from src.domain.models import Timetable, TimetableKey
+from src.adapters.models import TimetableTable
+
+
+def _key_columns(key: TimetableKey) -> dict:
+    return {
+        "lat_e4": round(key.lat * 1e4),
+        "lon_e4": round(key.lon * 1e4),
+        "method": key.method,
+        "madhab": key.madhab,
+        "shafaq": key.shafaq,
+        "precision": key.precision,
+        "high_latitude_rule": key.high_latitude_rule,
+        "year": key.year,
+    }
+
+
+class SQLiteTimetableRepository(SQLRepositoryBase, TimetableRepository):
+    """SQLite implementation of TimetableRepository."""
+
+    def __init__(self, db_path: str = "sqlite:///src/data/cities.db"):
+        super().__init__(db_path)
+
+    def get_timetable(self, key: TimetableKey) -> Optional[Timetable]:
+        with self.session_maker() as session:
+            row = session.query(TimetableTable).filter_by(**_key_columns(key)).first()
+            if row:
+                return Timetable(key=key, engine_version=row.engine_version, minutes=row.minutes)
+        return None
+
+    def save_timetable(self, timetable: Timetable) -> None:
+        columns = _key_columns(timetable.key)
+        values = {"engine_version": timetable.engine_version, "minutes": timetable.minutes}
+        with self.session_maker() as session:
+            if self._update(session, columns, values):
+                return
+            session.add(TimetableTable(**columns, **values))
+            try:
+                session.commit()
+            except IntegrityError:
+                # Another writer inserted the same key since the lookup: replace its row.
+                session.rollback()
+                self._update(session, columns, values)
+
+    @staticmethod
+    def _update(session, columns: dict, values: dict) -> bool:
+        updated = session.query(TimetableTable).filter_by(**columns).update(values, synchronize_session=False)
+        session.commit()
+        return bool(updated)
+
+    def delete_stale(self, engine_version: str) -> int:
+        with self.session_maker() as session:
+            deleted = (
+                session.query(TimetableTable)
+                .filter(TimetableTable.engine_version != engine_version)
+                .delete(synchronize_session=False)
+            )
+            session.commit()
+            return deleted
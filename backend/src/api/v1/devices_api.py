@@ -22,7 +22,7 @@ repos = RepositoryContainer()
 soco_service = SoCoService()
 freebox_service = FreeboxService()
 bluetooth_service = BluetoothService()
-device_service = DeviceService(repos.device_repo, repos.setting_repo)
+device_service = DeviceService(repos.device_repo, repos.setting_repo, timetable_repository=repos.timetable_repo)
 
 router = APIRouter()
 
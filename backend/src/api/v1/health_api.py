@@ -5,6 +5,7 @@ from pathlib import Path
 
 from fastapi import APIRouter, Response
 
+from src.calculations.adhan_calc import PrayerTimes
 from src.core.repository_factory import RepositoryContainer
 from src.utils.version import get_version
 
@@ -68,3 +69,9 @@ def get_logs():
 @router.get("/db_health")
 def db_health():
     return repos.get_repos_health()
+
+
+@router.get("/ephemeris_cache")
+def ephemeris_cache():
+    """Hit/miss counters of the solar ephemeris cache shared by all prayer-time computations."""
+    return PrayerTimes.ephemeris_cache_info()
@@ -1,6 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Optional, Any
 
+from src.calculations.high_latitude import RULE_PATTERN
+
 
 class CityResponse(BaseModel):
     id: int
@@ -45,6 +47,7 @@ class SettingResponse(BaseModel):
     enable_scheduler: bool
     selected_method: Optional[str] = None
     force_date: Optional[str] = None  # You could also use datetime.date if preferred
+    high_latitude_rule: Optional[str] = None
     city_id: Optional[int] = None
     device_id: Optional[int] = None
     audio_id: Optional[int] = None
@@ -62,6 +65,7 @@ class SettingRequest(BaseModel):
     enable_scheduler: bool
     selected_method: Optional[str] = None
     force_date: Optional[str] = None
+    high_latitude_rule: Optional[str] = Field(default=None, pattern=RULE_PATTERN)
     city_id: Optional[int] = None
     device_id: Optional[int] = None
     audio_id: Optional[int] = None
@@ -73,6 +77,7 @@ class SettingRequest(BaseModel):
             "enable_scheduler": self.enable_scheduler,
             "selected_method": self.selected_method,
             "force_date": self.force_date,
+            "high_latitude_rule": self.high_latitude_rule,
             "city_id": self.city_id,
             "device_id": self.device_id,
             "audio_id": self.audio_id,
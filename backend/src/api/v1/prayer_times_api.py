@@ -1,23 +1,67 @@
+import json
+from calendar import monthrange
 from datetime import date, datetime
-from typing import Annotated, List, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Iterable, Iterator, List, Optional
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 
+from src.calculations.adhan_calc import PRAYER_METHODS
 from src.calculations.calendar import Gregorian
+from src.calculations.calendar.locales import LANGUAGE_PATTERN
+from src.calculations.high_latitude import DEFAULT_RULE, RULE_PATTERN
+from src.core.json_response import dumps, json_response, negotiate_encoding
+from src.core.repository_factory import RepositoryContainer
+from src.core.response_cache import ResponseCache
+from src.domain.models import City
 from src.schemas.log_config import LogConfig
-from src.schemas.prayer_times import PrayerTimesResponse
+from src.schemas.prayer_times import PrayerBatchRequest, PrayerGridRequest, PrayerTimesResponse
 from src.services.adhan_service import (
+    DEFAULT_LANGUAGE,
+    DayQuery,
+    device_current_time,
     get_available_methods,
+    get_high_latitude_rules,
+    get_hijri_range,
+    get_method_comparison,
     get_month_prayer_times,
+    get_prayer_grid,
     get_prayer_times,
+    get_prayer_times_batch,
     get_year_prayer_times,
+    grid_axis_size,
+    grid_points,
+    iter_prayer_times,
 )
+from src.services.calendar_service import CALENDAR_PATTERN, get_month_calendar
+from src.services.cities_service import CityService
+from src.services.env_service import EnvService
+from src.services.export_service import EXPORT_FORMAT_PATTERN, MEDIA_TYPES, export_lines, iter_export_chunks
+from src.services.ics_service import ICS_WINDOW_MONTHS, MAX_ICS_WINDOW_MONTHS, get_prayer_calendar
+from src.services.timetable_service import TimetableService
 from src.utils.date_utils import get_tz
 
 logger = LogConfig.get_logger()
 METHOD = "France"
 MADHAB = "Shafi"
 TZ = get_tz()
+MIN_YEAR, MAX_YEAR = 1900, 2100
+PRECISION = "standard"
+PRECISION_PATTERN = "^(standard|high)$"
+# locations x days per grid request (~10 MB of JSON at the cap).
+MAX_GRID_CELLS = 100_000
+MAX_HIJRI_RANGE_DAYS = 20 * 366
+MAX_BATCH_QUERIES = 1000
+# locations x days per export; streamed, so this only bounds the work per request.
+MAX_EXPORT_CELLS = 2_000_000
+# Payloads for an explicit date never change (for one engine version); those
+# for "today" do at midnight, so clients must revalidate them.
+CACHE_CONTROL_FIXED = "public, max-age=86400"
+CACHE_CONTROL_TODAY = "no-cache"
+# Calendar feeds change when their window moves to a new month.
+CACHE_CONTROL_ICS = "public, max-age=3600"
+DEVICE_TIME_HEADER = "X-Device-Current-Time"
 router = APIRouter()
 
 
@@ -33,6 +77,7 @@ def parse_date(s: Optional[str]) -> date:
 
 @router.get("/prayer-times", response_model=PrayerTimesResponse)
 def prayer_times(
+    request: Request,
     lat: Annotated[float, Query(...)],
     lon: Annotated[float, Query(...)],
     day: Annotated[
@@ -42,44 +87,397 @@ def prayer_times(
     method: Annotated[str, Query()] = METHOD,
     madhab: Annotated[str, Query()] = MADHAB,
     tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN, description="Hijri label language.")] = DEFAULT_LANGUAGE,
 ):
     # Utilisation de la constante TZ par défaut si tz est None
     effective_tz = tz if tz else TZ
     d = parse_date(day)
-    return get_prayer_times(d, lat, lon, method, madhab, effective_tz)
+    return _cached_json(
+        request,
+        ("day", d.isoformat(), lat, lon, method, madhab, effective_tz, precision, high_latitude_rule, language),
+        lambda: get_prayer_times(
+            d, lat, lon, method, madhab, effective_tz, precision, high_latitude_rule,
+            timetables=_timetable_service(), language=language,
+        ),
+        fixed=day is not None,
+    )
 
 
 @router.get("/prayer-times/month", response_model=List[PrayerTimesResponse])
 def prayer_times_month(
+    request: Request,
     lat: Annotated[float, Query(...)],
     lon: Annotated[float, Query(...)],
-    year: Annotated[Optional[int], Query(ge=1900, le=2100)] = None,
+    year: Annotated[Optional[int], Query(ge=MIN_YEAR, le=MAX_YEAR)] = None,
     month: Annotated[Optional[int], Query(ge=1, le=12)] = None,
     method: Annotated[str, Query()] = METHOD,
     madhab: Annotated[str, Query()] = MADHAB,
     tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN, description="Hijri label language.")] = DEFAULT_LANGUAGE,
 ):
     now = date.today()
     y = year if year is not None else now.year
     m = month if month is not None else now.month
     effective_tz = tz if tz else TZ
 
-    return get_month_prayer_times(y, m, lat, lon, method, madhab, effective_tz)
+    return _cached_json(
+        request,
+        ("month", y, m, lat, lon, method, madhab, effective_tz, precision, high_latitude_rule, language),
+        lambda: get_month_prayer_times(
+            y, m, lat, lon, method, madhab, effective_tz, precision, high_latitude_rule,
+            timetables=_timetable_service(), language=language,
+        ),
+        fixed=year is not None and month is not None,
+    )
 
 
 @router.get("/prayer-times/year", response_model=List[PrayerTimesResponse])
 def prayer_times_year(
+    request: Request,
     lat: Annotated[float, Query(...)],
     lon: Annotated[float, Query(...)],
-    year: Annotated[Optional[int], Query(ge=1900, le=2100)] = None,
+    year: Annotated[Optional[int], Query(ge=MIN_YEAR, le=MAX_YEAR)] = None,
     method: Annotated[str, Query()] = METHOD,
     madhab: Annotated[str, Query()] = MADHAB,
     tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN, description="Hijri label language.")] = DEFAULT_LANGUAGE,
 ):
     y = year if year is not None else date.today().year
     effective_tz = tz if tz else TZ
 
-    return get_year_prayer_times(y, lat, lon, method, madhab, effective_tz)
+    return _cached_json(
+        request,
+        ("year", y, lat, lon, method, madhab, effective_tz, precision, high_latitude_rule, language),
+        lambda: get_year_prayer_times(
+            y, lat, lon, method, madhab, effective_tz, precision, high_latitude_rule,
+            timetables=_timetable_service(), language=language,
+        ),
+        fixed=year is not None,
+    )
+
+
+def _json_array(items: Iterable[dict]) -> Iterator[str]:
+    """Serialize items as a JSON array, one element at a time."""
+    yield "["
+    for i, item in enumerate(items):
+        yield ("," if i else "") + json.dumps(item, ensure_ascii=False)
+    yield "]"
+
+
+@router.get("/prayer-times/range")
+def prayer_times_range(
+    lat: Annotated[float, Query(...)],
+    lon: Annotated[float, Query(...)],
+    start: Annotated[str, Query(description="First date, YYYY-MM-DD.")],
+    end: Annotated[str, Query(description="Last date (inclusive), YYYY-MM-DD.")],
+    method: Annotated[str, Query()] = METHOD,
+    madhab: Annotated[str, Query()] = MADHAB,
+    tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN, description="Hijri label language.")] = DEFAULT_LANGUAGE,
+):
+    """Stream daily prayer times for an arbitrary range as a JSON array.
+
+    Days are computed and sent as the client reads them, so multi-year
+    timetables don't have to be built in memory first.
+    """
+    first, last = parse_date(start), parse_date(end)
+    if last < first:
+        raise HTTPException(400, "end must be on or after start")
+    if first.year < MIN_YEAR or last.year > MAX_YEAR:
+        raise HTTPException(400, f"Dates must be within {MIN_YEAR}-{MAX_YEAR}")
+    effective_tz = tz if tz else TZ
+    days = iter_prayer_times(
+        first, last, lat, lon, method, madhab, effective_tz,
+        precision=precision, high_latitude_rule=high_latitude_rule,
+        timetables=_timetable_service(), language=language,
+    )
+    return StreamingResponse(
+        _json_array(days), media_type="application/json", headers={DEVICE_TIME_HEADER: device_current_time()}
+    )
+
+
+@router.get("/prayer-times/export")
+def prayer_times_export(
+    start: Annotated[str, Query(description="First date, YYYY-MM-DD.")],
+    end: Annotated[str, Query(description="Last date (inclusive), YYYY-MM-DD.")],
+    fmt: Annotated[str, Query(alias="format", pattern=EXPORT_FORMAT_PATTERN)] = "ndjson",
+    city_ids: Annotated[Optional[List[int]], Query(description="Cities to export, in this order.")] = None,
+    lat: Annotated[Optional[float], Query(description="Also export this location.")] = None,
+    lon: Annotated[Optional[float], Query()] = None,
+    method: Annotated[str, Query()] = METHOD,
+    madhab: Annotated[str, Query()] = MADHAB,
+    tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN, description="Hijri label language.")] = DEFAULT_LANGUAGE,
+):
+    """Stream a flat timetable (one row per location and day) as NDJSON or CSV.
+
+    Rows are computed a month at a time while the client reads them, so
+    memory stays flat and the first bytes go out right away, even for
+    decades of data.
+    """
+    first, last = parse_date(start), parse_date(end)
+    if last < first:
+        raise HTTPException(400, "end must be on or after start")
+    if first.year < MIN_YEAR or last.year > MAX_YEAR:
+        raise HTTPException(400, f"Dates must be within {MIN_YEAR}-{MAX_YEAR}")
+    if (lat is None) != (lon is None):
+        raise HTTPException(400, "Provide both lat and lon, or neither")
+    n_locations = len(city_ids or []) + (lat is not None)
+    if not n_locations:
+        raise HTTPException(400, "Provide city_ids and/or lat and lon")
+    if n_locations * ((last - first).days + 1) > MAX_EXPORT_CELLS:
+        raise HTTPException(400, f"Export too large: at most {MAX_EXPORT_CELLS} location-days per request")
+    locations: List[City] = []
+    if city_ids:
+        locations = _city_service().get_cities_by_ids(city_ids)
+        missing = sorted(set(city_ids) - {c.id for c in locations})
+        if missing:
+            raise HTTPException(404, f"Unknown city ids: {missing}")
+    if lat is not None:
+        locations.append(City(lat=lat, lon=lon))
+    chunks = iter_export_chunks(
+        first, last, locations, method, madhab, tz or TZ, precision, high_latitude_rule, language
+    )
+    return StreamingResponse(
+        export_lines(fmt, chunks),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="prayer-times_{first}_{last}.{fmt}"'},
+    )
+
+
+@lru_cache(maxsize=1)
+def _city_service() -> CityService:
+    return CityService(RepositoryContainer().city_repo)
+
+
+@lru_cache(maxsize=1)
+def _timetable_service() -> TimetableService:
+    return TimetableService(RepositoryContainer().timetable_repo, persist=False)
+
+
+@lru_cache(maxsize=1)
+def _settings_repo():
+    return RepositoryContainer().setting_repo
+
+
+@lru_cache(maxsize=1)
+def _response_cache() -> ResponseCache:
+    EnvService.load_env()
+    return ResponseCache(EnvService.get("RESPONSE_CACHE_DIR", ""))
+
+
+def _cached_json(request: Request, key: tuple, build: Callable[[], Any], fixed: bool) -> Response:
+    """Serve ``build()`` as JSON through the response cache, honouring conditional requests.
+
+    ``key`` must hold every resolved input of the payload. The live device
+    time travels in a header so the body stays cacheable; it is only sent
+    with "no-cache" responses, which are revalidated on every use, so a
+    shared cache never replays a stale one with a day-long max-age.
+    """
+    return _cached_response(
+        request, key, lambda: dumps(build()), "application/json",
+        CACHE_CONTROL_FIXED if fixed else CACHE_CONTROL_TODAY,
+        None if fixed else {DEVICE_TIME_HEADER: device_current_time()},
+    )
+
+
+def _cached_response(
+    request: Request, key: tuple, build: Callable[[], bytes], media_type: str, cache_control: str,
+    headers: Optional[dict] = None,
+) -> Response:
+    """Serve the body ``build()`` returns through the response cache, with validators and compression."""
+    cache_key = ResponseCache.key_for(*key)
+    entry = _response_cache().get_or_build(cache_key, build, media_type)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), len(entry.body))
+    headers = {
+        "ETag": entry.etag_for(encoding),
+        "Last-Modified": entry.last_modified_http,
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding",
+        **(headers or {}),
+    }
+    if entry.not_modified(request.headers.get("if-none-match"), request.headers.get("if-modified-since"), encoding):
+        return Response(status_code=304, headers=headers)
+    if encoding is not None:
+        headers["Content-Encoding"] = encoding
+    return Response(_response_cache().body_for(cache_key, entry, encoding), media_type=entry.media_type,
+                    headers=headers)
+
+
+def _grid_locations(request: PrayerGridRequest, days: int) -> List[City]:
+    locations: List[City] = []
+    if request.city_ids:
+        if len(request.city_ids) * days > MAX_GRID_CELLS:
+            raise HTTPException(400, f"Grid too large: at most {MAX_GRID_CELLS} location-days per request")
+        locations = _city_service().get_cities_by_ids(request.city_ids)
+        missing = sorted(set(request.city_ids) - {c.id for c in locations})
+        if missing:
+            raise HTTPException(404, f"Unknown city ids: {missing}")
+    if request.grid:
+        g = request.grid
+        if g.lat_max < g.lat_min or g.lon_max < g.lon_min:
+            raise HTTPException(400, "grid max bounds must be >= min bounds")
+        n_points = grid_axis_size(g.lat_min, g.lat_max, g.step) * grid_axis_size(g.lon_min, g.lon_max, g.step)
+        if (len(locations) + n_points) * days > MAX_GRID_CELLS:
+            raise HTTPException(400, f"Grid too large: at most {MAX_GRID_CELLS} location-days per request")
+        locations += grid_points(g.lat_min, g.lat_max, g.lon_min, g.lon_max, g.step)
+    if not locations:
+        raise HTTPException(400, "Provide city_ids and/or grid")
+    return locations
+
+
+@router.post("/prayer-times/grid")
+def prayer_times_grid(request: PrayerGridRequest, http_request: Request):
+    """Prayer times for many cities or grid points over a date range, in one pass.
+
+    Returns a columnar payload: ``dates``, ``locations`` and, per prayer,
+    ``times[prayer][location_index][date_index]`` as local "HH:MM:SS",
+    compressed when the client accepts it.
+    """
+    if request.end < request.start:
+        raise HTTPException(400, "end must be on or after start")
+    if request.start.year < MIN_YEAR or request.end.year > MAX_YEAR:
+        raise HTTPException(400, f"Dates must be within {MIN_YEAR}-{MAX_YEAR}")
+    locations = _grid_locations(request, (request.end - request.start).days + 1)
+    return json_response(http_request, get_prayer_grid(
+        request.start,
+        request.end,
+        locations,
+        request.method or METHOD,
+        request.madhab or MADHAB,
+        request.tz or TZ,
+        request.precision,
+        request.high_latitude_rule,
+    ))
+
+
+@router.post("/prayer-times/batch", response_model=List[PrayerTimesResponse])
+def prayer_times_batch(request: PrayerBatchRequest, http_request: Request):
+    """Many ``/prayer-times`` queries in one call, answered in request order.
+
+    Identical queries are computed once, and the locations of queries
+    sharing a date and a configuration are evaluated together in one
+    vectorized pass of the engine.
+    """
+    if not request.queries:
+        raise HTTPException(400, "Provide at least one query")
+    if len(request.queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(400, f"Batch too large: at most {MAX_BATCH_QUERIES} queries per request")
+    unknown = sorted({q.method for q in request.queries if q.method and q.method.upper() not in PRAYER_METHODS})
+    if unknown:
+        raise HTTPException(400, f"Unknown methods: {unknown}")
+    today = date.today()
+    queries = [
+        DayQuery(
+            q.day or today, q.lat, q.lon, q.method or METHOD, q.madhab or MADHAB, q.tz or TZ,
+            q.precision, q.high_latitude_rule, q.language or DEFAULT_LANGUAGE,
+        )
+        for q in request.queries
+    ]
+    results = get_prayer_times_batch(queries)
+    return json_response(http_request, results, {DEVICE_TIME_HEADER: device_current_time()})
+
+
+@router.get("/prayer-times/compare")
+def prayer_times_compare(
+    request: Request,
+    lat: Annotated[float, Query(...)],
+    lon: Annotated[float, Query(...)],
+    day: Annotated[
+        Optional[str],
+        Query(description="Date in YYYY-MM-DD format. Defaults to today. Ignored when month is set."),
+    ] = None,
+    year: Annotated[Optional[int], Query(ge=MIN_YEAR, le=MAX_YEAR)] = None,
+    month: Annotated[Optional[int], Query(ge=1, le=12, description="Compare a whole month.")] = None,
+    methods: Annotated[Optional[List[str]], Query(description="Methods to compare. Defaults to all.")] = None,
+    madhab: Annotated[str, Query()] = MADHAB,
+    tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+):
+    """Method x prayer matrix for a day or a month, computed in a single pass."""
+    unknown = [m for m in methods or [] if m.upper() not in PRAYER_METHODS]
+    if unknown:
+        raise HTTPException(400, f"Unknown methods: {unknown}")
+    effective_tz = tz if tz else TZ
+    if month is not None:
+        y = year or date.today().year
+        start = date(y, month, 1)
+        end = date(y, month, monthrange(y, month)[1])
+    else:
+        start = end = parse_date(day)
+        if not MIN_YEAR <= start.year <= MAX_YEAR:
+            raise HTTPException(400, f"Dates must be within {MIN_YEAR}-{MAX_YEAR}")
+    return json_response(
+        request,
+        get_method_comparison(start, end, lat, lon, methods, madhab, effective_tz, precision, high_latitude_rule),
+    )
+
+
+@router.get("/prayer-times/calendar.ics")
+def prayer_times_ics(
+    request: Request,
+    city_id: Annotated[Optional[int], Query(description="Feed for this city.")] = None,
+    device_id: Annotated[Optional[int], Query(description="Feed for this device's city, method and rule.")] = None,
+    lat: Annotated[Optional[float], Query()] = None,
+    lon: Annotated[Optional[float], Query()] = None,
+    method: Annotated[str, Query()] = METHOD,
+    madhab: Annotated[str, Query()] = MADHAB,
+    tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+    months: Annotated[int, Query(ge=1, le=MAX_ICS_WINDOW_MONTHS, description="Months in the feed.")] = ICS_WINDOW_MONTHS,
+):
+    """iCalendar subscription of the daily prayers, from the current month on.
+
+    Give exactly one of ``city_id``, ``device_id`` (its settings override
+    ``method`` and ``high_latitude_rule``) or ``lat``/``lon``. Month event
+    blocks are rendered once and the feed is served with ETag and
+    Last-Modified, so polling clients mostly get a 304.
+    """
+    if (lat is None) != (lon is None):
+        raise HTTPException(400, "Provide both lat and lon, or neither")
+    if sum(x is not None for x in (city_id, device_id, lat)) != 1:
+        raise HTTPException(400, "Provide exactly one of city_id, device_id or lat and lon")
+    name = ""
+    if device_id is not None:
+        settings = _settings_repo().get_setting_by_device_id(device_id=device_id)
+        if not (settings and settings.city):
+            raise HTTPException(404, f"No city configured for device {device_id}")
+        city = settings.city
+        lat, lon, name = (city.get(k) if isinstance(city, dict) else getattr(city, k, None) for k in ("lat", "lon", "name"))
+        if lat is None or lon is None:
+            raise HTTPException(404, f"No city configured for device {device_id}")
+        name = name or ""
+        method = settings.selected_method or method
+        high_latitude_rule = settings.high_latitude_rule or high_latitude_rule
+    elif city_id is not None:
+        city = _city_service().get_city_by_id(city_id)
+        if city is None:
+            raise HTTPException(404, f"Unknown city id: {city_id}")
+        lat, lon, name = city.lat, city.lon, city.name
+    effective_tz = tz if tz else TZ
+    today = date.today()
+    return _cached_response(
+        request,
+        ("ics", today.year, today.month, months, lat, lon, method, madhab, effective_tz, precision,
+         high_latitude_rule, name),
+        lambda: get_prayer_calendar(
+            today, lat, lon, method, madhab, effective_tz, precision, high_latitude_rule, name, months
+        ),
+        "text/calendar; charset=utf-8",
+        CACHE_CONTROL_ICS,
+    )
 
 
 @router.get("/available-methods", response_model=List[dict])
@@ -87,16 +485,81 @@ def available_methods():
     return get_available_methods()
 
 
+@router.get("/high-latitude-rules", response_model=List[dict])
+def high_latitude_rules():
+    return get_high_latitude_rules()
+
+
 @router.get("/to_hijri_date")
 def to_hijri_date(
     day: Annotated[
         Optional[str],
         Query(description="Date in YYYY-MM-DD format. Defaults to today."),
     ] = None,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN)] = DEFAULT_LANGUAGE,
 ):
     d = parse_date(day)
-    hijri_date = Gregorian.fromdate(d).to_hijri()
     return {
         "date": d.isoformat(),
-        "hijri_date": f"{hijri_date.day_name(language='ar')} {hijri_date.day} {hijri_date.month_name(language='ar')} {hijri_date.year}",
+        "hijri_date": Gregorian.fromdate(d).to_hijri().label(language),
     }
+
+
+@router.get("/hijri/range")
+def hijri_date_range(
+    request: Request,
+    start: Annotated[str, Query(description="First date, YYYY-MM-DD.")],
+    end: Annotated[str, Query(description="Last date (inclusive), YYYY-MM-DD.")],
+):
+    """Hijri (Umm al-Qura) dates of every day in a range, in one call.
+
+    Columnar payload: ``year[i]``, ``month[i]`` and ``day[i]`` are the Hijri
+    date of ``dates[i]``.
+    """
+    first, last = parse_date(start), parse_date(end)
+    if last < first:
+        raise HTTPException(400, "end must be on or after start")
+    if (last - first).days >= MAX_HIJRI_RANGE_DAYS:
+        raise HTTPException(400, f"Range too large: at most {MAX_HIJRI_RANGE_DAYS} days per request")
+    try:
+        return json_response(request, get_hijri_range(first, last))
+    except OverflowError as e:
+        raise HTTPException(400, str(e))
+
+
+@router.get("/calendar/month")
+def calendar_month(
+    request: Request,
+    calendar: Annotated[str, Query(pattern=CALENDAR_PATTERN)] = "hijri",
+    year: Annotated[Optional[int], Query(description="Hijri or Gregorian year. Defaults to the current one.")] = None,
+    month: Annotated[Optional[int], Query(ge=1, le=12)] = None,
+    language: Annotated[str, Query(pattern=LANGUAGE_PATTERN)] = DEFAULT_LANGUAGE,
+    week_start: Annotated[int, Query(ge=1, le=7, description="ISO weekday the grid starts on (1 = Monday).")] = 1,
+    lat: Annotated[Optional[float], Query(description="Add prayer times for this location.")] = None,
+    lon: Annotated[Optional[float], Query()] = None,
+    method: Annotated[str, Query()] = METHOD,
+    madhab: Annotated[str, Query()] = MADHAB,
+    tz: Annotated[Optional[str], Query()] = None,
+    precision: Annotated[str, Query(pattern=PRECISION_PATTERN)] = PRECISION,
+    high_latitude_rule: Annotated[str, Query(pattern=RULE_PATTERN)] = DEFAULT_RULE,
+):
+    """Month calendar grid with Gregorian/Hijri pairs, optionally with prayer times.
+
+    ``offset`` blank cells precede the first day; ``days[i]`` holds both
+    dates, the weekday, the Hijri label and month-start markers, and
+    ``times[i]`` its prayer times when ``lat``/``lon`` are given.
+    """
+    if (lat is None) != (lon is None):
+        raise HTTPException(400, "Provide both lat and lon, or neither")
+    today = date.today()
+    if year is None or month is None:
+        current = Gregorian.fromdate(today).to_hijri() if calendar == "hijri" else today
+        year = year if year is not None else current.year
+        month = month if month is not None else current.month
+    try:
+        return json_response(request, get_month_calendar(
+            calendar, year, month, language, week_start, lat, lon, method, madhab, tz or TZ,
+            precision, high_latitude_rule, timetables=_timetable_service(),
+        ))
+    except (OverflowError, ValueError) as e:
+        raise HTTPException(400, str(e))
@@ -0,0 +1,63 @@
+from functools import lru_cache
+from typing import List
+
+from fastapi import APIRouter, HTTPException
+
+from src.core.repository_factory import RepositoryContainer
+from src.domain.models import City
+from src.schemas.qibla import QiblaRequest, QiblaResult, SunTrackRequest
+from src.services.qibla_service import QiblaService
+
+MAX_QIBLA_LOCATIONS = 10_000
+# locations x samples per sun-track request (~100 locations at a 1 minute step).
+MAX_SUN_TRACK_SAMPLES = 150_000
+router = APIRouter()
+
+
+@lru_cache(maxsize=1)
+def _qibla_service() -> QiblaService:
+    return QiblaService(RepositoryContainer().city_repo)
+
+
+def _locations(request: QiblaRequest, samples: int = 1, limit: int = MAX_QIBLA_LOCATIONS) -> List[City]:
+    count = len(request.city_ids or []) + len(request.locations or [])
+    if not count:
+        raise HTTPException(400, "Provide city_ids and/or locations")
+    if count * samples > limit:
+        raise HTTPException(400, f"Too many locations: at most {limit // samples} per request")
+    locations: List[City] = []
+    if request.city_ids:
+        locations, missing = _qibla_service().resolve(request.city_ids)
+        if missing:
+            raise HTTPException(404, f"Unknown city ids: {missing}")
+    locations += [City(lat=c.lat, lon=c.lon) for c in request.locations or []]
+    return locations
+
+
+@router.post("/qibla", response_model=List[QiblaResult])
+def qibla(request: QiblaRequest):
+    """Qibla bearing (degrees from true north) and distance to the Kaaba, for many locations.
+
+    Results follow the request order: ``city_ids`` first, then ``locations``.
+    """
+    return _qibla_service().get_qibla(_locations(request))
+
+
+@router.post("/qibla/sun-track")
+def sun_track(request: SunTrackRequest):
+    """Sun altitude and azimuth over a UTC day, for many locations.
+
+    Columnar payload: ``altitude[i][j]`` / ``azimuth[i][j]`` (degrees) of
+    ``locations[i]`` at ``minutes[j]`` UTC minutes from midnight.
+    """
+    samples = -(-1440 // request.step_minutes)
+    locations = _locations(request, samples, MAX_SUN_TRACK_SAMPLES)
+    tracks = _qibla_service().get_sun_tracks(locations, request.day, request.step_minutes)
+    return {
+        "day": request.day.isoformat(),
+        "step_minutes": request.step_minutes,
+        "minutes": tracks[0].minutes,
+        "locations": [c.get_dict() for c in locations],
+        "altitude": [[round(v, 2) for v in t.altitude] for t in tracks],
+        "azimuth": [[round(v, 2) for v in t.azimuth] for t in tracks],
+    }
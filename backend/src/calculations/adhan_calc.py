@@ -3,21 +3,28 @@
 Astronomical engine ported 1:1 from the canonical Swift implementation
 (`qibla/Data/Services/AstroEngine.swift`). Keep the two in sync: any change to
 the algorithm here should be mirrored there, and the golden vectors in
-`tests/unit/test_calc.py` guard against drift.
+`tests/unit/test_calc.py` guard against drift. The vectorized twins in
+`batch.py` (used by `PrayerTimes.compute_batch`) must follow the same changes.
 """
 
 import calendar
 import math
-from concurrent.futures import ThreadPoolExecutor
+from array import array
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from datetime import date, datetime, time, timedelta, timezone
-from typing import Optional, Union
+from functools import lru_cache
+from datetime import date, datetime, time, timedelta, timezone, tzinfo
+from typing import Iterator, NamedTuple, Optional, Union
 
 try:
     from zoneinfo import ZoneInfo
 except ImportError:  # pragma: no cover - Python < 3.9
     ZoneInfo = None
 
+from . import batch, ephemeris, high_latitude, moonsight, range_engine, vsop87
+from .batch import np
 from .moonsight import Fajr as MSFajr
 from .moonsight import Isha as MSIsha
 
@@ -26,8 +33,28 @@ ORDERED_KEYS = [
     "Sunset", "Maghrib", "Isha", "Midnight", "Firstthird", "Lastthird",
 ]
 SCHEDULABLE_KEYS = ["Fajr", "Dhuhr", "Asr", "Maghrib", "Isha"]
+_KEY_INDEX = {k: i for i, k in enumerate(ORDERED_KEYS)}
+# Time-of-day format of the columnar (grid) payloads.
+HMS_FORMAT = "%H:%M:%S"
 
 SUN_ZENITH = 90.8333  # standard sunrise/sunset zenith (refraction + solar radius)
+# Bump whenever a change alters computed times: persisted timetables built by
+# another engine version are treated as stale and recomputed.
+ENGINE_VERSION = "2026.10.1"
+# Days of UTC offsets memoized per PrayerTimes instance before the table is reset.
+LOCAL_CLOCK_CACHE_DAYS = 4096
+# Shared PrayerTimes instances kept by PrayerTimes.for_config.
+PRAYER_TIMES_REGISTRY_SIZE = 128
+# Days kept by each instance's result cache, and the coordinate rounding of its
+# keys (4 decimals ~ 11 m, i.e. well under a second of prayer time).
+RESULT_CACHE_SIZE = 1024
+COORD_DECIMALS = 4
+# Entries kept by the shared sun-position cache (a few hundred bytes each).
+EPHEMERIS_CACHE_SIZE = 16384
+# precision="high": solutions are iterated until a step moves them by less
+# than HIGH_PRECISION_TOLERANCE_MIN (0.1 s), at most HIGH_PRECISION_MAX_STEPS times.
+HIGH_PRECISION_TOLERANCE_MIN = 0.1 / 60.0
+HIGH_PRECISION_MAX_STEPS = 8
 
 # -----------------------------
 # Method configuration types
@@ -91,24 +118,85 @@ PRAYER_METHODS: dict[str, MethodConfig] = {
     "CUSTOM":   MethodConfig("Custom method", 18.0, _angle(18.0)),
 }
 
+# Sentinel for "not computed yet" where None is a meaningful value.
+_UNSET = object()
+
 
 # -----------------------------
 # PrayerTimes
 # -----------------------------
 class PrayerTimes:
+    """Prayer-time engine for one method / madhab / timezone configuration.
+
+    Instances are immutable and safe to share across threads; prefer
+    ``PrayerTimes.for_config`` to reuse one per configuration.
+    """
+
+    __slots__ = ("method", "cfg", "madhab", "tz", "shafaq", "high_latitude_rule", "asr_factor",
+                 "_high_lat", "_clock", "_results", "_results_lock")
+
+    precision = "standard"
+    # Batch-engine ephemeris and refinement steps (see HighPrecisionPrayerTimes).
+    _batch_sun = staticmethod(batch.sun_position)
+    _batch_steps = 1
+
     def __init__(self, method: str = "France", madhab: str = "Shafi",
-                 tz: str = "Europe/Paris", shafaq: str = "general"):
+                 tz: str = "Europe/Paris", shafaq: str = "general",
+                 high_latitude_rule: str = high_latitude.DEFAULT_RULE):
         method = method.upper()
         if method not in PRAYER_METHODS:
             raise ValueError(f"Unknown method '{method}'")
+        rule = high_latitude.get_rule(high_latitude_rule)
 
-        self.method = method
-        self.cfg = PRAYER_METHODS[method]
-        self.madhab = madhab
-        self.tz = tz
-        self.shafaq = shafaq  # only used for moonsighting
+        _set = object.__setattr__
+        _set(self, "method", method)
+        _set(self, "cfg", PRAYER_METHODS[method])
+        _set(self, "madhab", madhab)
+        _set(self, "tz", tz)
+        _set(self, "shafaq", shafaq)  # only used for moonsighting
+        # Fallback for Fajr / Isha when the twilight angle is never reached.
+        _set(self, "high_latitude_rule", high_latitude_rule)
+        _set(self, "_high_lat", rule)
         # Shafi: shadow factor 1, Hanafi: 2.
-        self.asr_factor = 1.0 if madhab.lower().startswith("sh") else 2.0
+        _set(self, "asr_factor", 1.0 if madhab.lower().startswith("sh") else 2.0)
+        # Resolve the zone once; None means UTC output (or no zoneinfo, reported on use).
+        clock = None
+        if tz and (ZoneInfo is not None or not isinstance(tz, str)):
+            clock = _LocalClock(ZoneInfo(tz) if isinstance(tz, str) else tz)
+        _set(self, "_clock", clock)
+        _set(self, "_results", OrderedDict())
+        _set(self, "_results_lock", threading.Lock())
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Rebuild from the configuration; caches are per-process.
+        return type(self), (self.method, self.madhab, self.tz, self.shafaq, self.high_latitude_rule)
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(method={self.method!r}, madhab={self.madhab!r}, "
+                f"tz={self.tz!r}, shafaq={self.shafaq!r}, high_latitude_rule={self.high_latitude_rule!r})")
+
+    @classmethod
+    def for_config(cls, method: str = "France", madhab: str = "Shafi",
+                   tz: str = "Europe/Paris", shafaq: str = "general",
+                   precision: str = "standard",
+                   high_latitude_rule: str = high_latitude.DEFAULT_RULE) -> "PrayerTimes":
+        """Return the shared instance for a configuration.
+
+        Instances live in an LRU-bounded registry, so per-request callers
+        (month/year loops, the scheduler) stop re-resolving the method, Asr
+        factor and timezone, and share the per-instance result cache.
+        ``precision`` is "standard" or "high" (``HighPrecisionPrayerTimes``);
+        ``high_latitude_rule`` is a key of ``high_latitude.HIGH_LATITUDE_RULES``.
+        """
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}'")
+        return _shared_instance(method.upper(), madhab, tz, shafaq, precision, high_latitude_rule)
 
     # -----------------------------
     # Astronomy primitives
@@ -141,6 +229,30 @@ class PrayerTimes:
             eqt += 24
         return dec_rad, eqt * 60.0
 
+    @staticmethod
+    def _ephemeris(jd: float) -> tuple[float, float]:
+        """``sun_position`` through the shared ephemeris cache.
+
+        Served from the precomputed table (``ephemeris.py``) when it is
+        installed, from the analytic formulas otherwise.
+        """
+        return _cached_sun_position(jd)
+
+    @staticmethod
+    def ephemeris_cache_info() -> dict:
+        """Hit/miss counters of the shared ephemeris cache."""
+        info = _cached_sun_position.cache_info()
+        return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
+
+    @staticmethod
+    def ephemeris_cache_clear() -> None:
+        _cached_sun_position.cache_clear()
+
+    def _transit(self, jd0: float, longitude: float) -> float:
+        """Solar noon in UTC minutes, from the equation of time at 0h UT."""
+        _, eqt_min = self._ephemeris(jd0)
+        return 720.0 - 4.0 * longitude - eqt_min
+
     @staticmethod
     def _hour_angle(lat_rad: float, dec_rad: float, zenith_deg: float) -> Optional[float]:
         z_rad = math.radians(zenith_deg)
@@ -160,26 +272,26 @@ class PrayerTimes:
         Returns UTC minutes from midnight, or None when the sun never reaches
         the zenith (high latitude / polar day or night).
         """
-        dec0, _ = self.sun_position(jd0)
+        dec0, _ = self._ephemeris(jd0)
         h0 = self._hour_angle(lat_rad, dec0, zenith)
         if h0 is None:
             return None
         t = noon_utc + h0 * 4.0 * direction
-        dec_try, _ = self.sun_position(jd0 + t / 1440.0)
+        dec_try, _ = self._ephemeris(jd0 + t / 1440.0)
         h1 = self._hour_angle(lat_rad, dec_try, zenith)
         if h1 is not None:
             t = noon_utc + h1 * 4.0 * direction
         return t
 
     def _compute_asr(self, lat_rad: float, jd0: float, noon_utc: float) -> Optional[float]:
-        dec, _ = self.sun_position(jd0 + noon_utc / 1440.0)
+        dec, _ = self._ephemeris(jd0 + noon_utc / 1440.0)
         alt = math.atan(1.0 / (self.asr_factor + math.tan(abs(lat_rad - dec))))
         cosh = self._asr_cosh(lat_rad, dec, alt)
         if cosh is None:
             return None
         asr_utc = noon_utc + math.degrees(math.acos(cosh)) * 4.0
 
-        dec_try, _ = self.sun_position(jd0 + asr_utc / 1440.0)
+        dec_try, _ = self._ephemeris(jd0 + asr_utc / 1440.0)
         alt_try = math.atan(1.0 / (self.asr_factor + math.tan(abs(lat_rad - dec_try))))
         cosh_try = self._asr_cosh(lat_rad, dec_try, alt_try)
         if cosh_try is not None:
@@ -201,13 +313,16 @@ class PrayerTimes:
                            sunrise_utc, sunset_utc, night_fallback):
         if self.cfg.moonsighting:
             lat_deg = math.degrees(lat_rad)
-            fajr_utc = sunrise_utc - MSFajr(base_date, lat_deg).minutes_before_sunrise()
-            isha_utc = sunset_utc + MSIsha(base_date, lat_deg, self.shafaq).minutes_after_sunset()
+            fajr_utc = sunrise_utc - moonsight.fajr_minutes(base_date, lat_deg) if sunrise_utc is not None else None
+            isha_utc = (
+                sunset_utc + moonsight.isha_minutes(base_date, lat_deg, self.shafaq) if sunset_utc is not None else None
+            )
             return fajr_utc, isha_utc
 
-        fajr_utc = self._refine_angle(lat_rad, jd0, noon_utc, 90.0 + float(self.cfg.fajr), -1)
+        angle = float(self.cfg.fajr)
+        fajr_utc = self._refine_angle(lat_rad, jd0, noon_utc, 90.0 + angle, -1)
         if fajr_utc is None and sunrise_utc is not None:
-            fajr_utc = sunrise_utc - night_fallback / 7.0  # 1/7-of-night high-latitude rule
+            fajr_utc = self._high_latitude(sunrise_utc, lat_rad, jd0, noon_utc, angle, -1, night_fallback)
 
         kind, value = self.cfg.isha
         if kind == "mins":
@@ -215,15 +330,28 @@ class PrayerTimes:
         else:
             isha_utc = self._refine_angle(lat_rad, jd0, noon_utc, 90.0 + value, 1)
             if isha_utc is None and sunset_utc is not None:
-                isha_utc = sunset_utc + night_fallback / 7.0
+                isha_utc = self._high_latitude(sunset_utc, lat_rad, jd0, noon_utc, value, 1, night_fallback)
         return fajr_utc, isha_utc
 
+    def _high_latitude(self, base_utc: float, lat_rad: float, jd0: float, noon_utc: float,
+                       angle: float, direction: int, night: float) -> float:
+        """Fajr (direction -1, from sunrise) or Isha (+1, from sunset) under the high-latitude rule."""
+        rule = self._high_lat
+        if rule.latitude is not None:
+            limit = math.radians(rule.latitude)
+            near = max(-limit, min(limit, lat_rad))
+            if near != lat_rad:
+                t = self._refine_angle(near, jd0, noon_utc, 90.0 + angle, direction)
+                if t is not None:
+                    return t
+        return base_utc + direction * rule.portion(night, angle)
+
     def _compute_maghrib(self, lat_rad, jd0, noon_utc, sunset_utc) -> float:
         kind = self.cfg.maghrib[0]
         if kind == "sunset":
             return sunset_utc
         if kind == "mins":
-            return sunset_utc + self.cfg.maghrib[1]
+            return sunset_utc + self.cfg.maghrib[1] if sunset_utc is not None else None
         # angle
         maghrib_utc = self._refine_angle(lat_rad, jd0, noon_utc, 90.0 + self.cfg.maghrib[1], 1)
         return maghrib_utc if maghrib_utc is not None else sunset_utc
@@ -234,13 +362,11 @@ class PrayerTimes:
     def _to_local_datetime(self, base_date: date, minutes_utc: Optional[float]) -> Optional[datetime]:
         if minutes_utc is None:
             return None
-        dt_utc = datetime.combine(base_date, time(0, 0), tzinfo=timezone.utc) + timedelta(minutes=minutes_utc)
-        if not self.tz:
-            return dt_utc
-        if ZoneInfo is None:
+        if self._clock is not None:
+            return self._clock.to_local(base_date, minutes_utc)
+        if self.tz:
             raise RuntimeError("zoneinfo required for tz-aware output; run Python 3.9+")
-        tz = ZoneInfo(self.tz) if isinstance(self.tz, str) else self.tz
-        return dt_utc.astimezone(tz)
+        return datetime.combine(base_date, time(0, 0), tzinfo=timezone.utc) + timedelta(minutes=minutes_utc)
 
     @staticmethod
     def _format(dt: Optional[datetime]) -> Optional[str]:
@@ -260,7 +386,32 @@ class PrayerTimes:
         Returns a dict keyed by ORDERED_KEYS with formatted local-time strings
         (or None when an event does not occur, e.g. polar conditions).
         """
-        return {k: self._format(v) for k, v in self.compute_datetimes(base_date, latitude, longitude).items()}
+        return self.format_times(self.compute_datetimes(base_date, latitude, longitude))
+
+    @classmethod
+    def format_times(cls, times: dict[str, Optional[datetime]]) -> dict[str, Optional[str]]:
+        """Format a ``compute_datetimes`` result the way ``compute`` does."""
+        return {k: cls._format(v) for k, v in times.items()}
+
+    def compute_cached(self, base_date: date, latitude: float,
+                       longitude: float) -> dict[str, Optional[datetime]]:
+        """``compute_datetimes`` through this instance's bounded result cache.
+
+        Coordinates are rounded to COORD_DECIMALS before computing, so nearby
+        requests for the same city share an entry.
+        """
+        key = (base_date, round(latitude, COORD_DECIMALS), round(longitude, COORD_DECIMALS))
+        with self._results_lock:
+            times = self._results.get(key)
+            if times is not None:
+                self._results.move_to_end(key)
+                return dict(times)
+        times = self.compute_datetimes(*key)
+        with self._results_lock:
+            self._results[key] = times
+            if len(self._results) > RESULT_CACHE_SIZE:
+                self._results.popitem(last=False)
+        return dict(times)
 
     def compute_datetimes(self, base_date: date, latitude: float,
                           longitude: float) -> dict[str, Optional[datetime]]:
@@ -270,53 +421,108 @@ class PrayerTimes:
         avoids re-parsing formatted strings and the DST/day-boundary bugs that
         come with naive ``datetime`` reconstruction.
         """
+        return self.localize(base_date, self._compute_utc(base_date, latitude, longitude))
+
+    def localize(self, base_date: date, times_utc: dict[str, Optional[float]]) -> dict[str, Optional[datetime]]:
+        """UTC minutes from ``base_date`` midnight -> timezone-aware datetimes (None stays None)."""
+        return {k: self._to_local_datetime(base_date, v) for k, v in times_utc.items()}
+
+    def compute_day(self, base_date: date, latitude: float, longitude: float) -> "PrayerDay":
+        """``compute_datetimes`` as a compact ``PrayerDay`` (localized on access)."""
+        times_utc = self._compute_utc(base_date, latitude, longitude)
+        return PrayerDay(self, base_date, tuple(_nan_if_none(times_utc[k]) for k in ORDERED_KEYS))
+
+    def compute_days(self, start: date, end: date, lat: float, lon: float) -> "PrayerRange":
+        """Every day in [start, end] at one location, as a compact ``PrayerRange``.
+
+        Computed on the batch engine when NumPy is installed, on the scalar
+        one otherwise.
+        """
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        if np is not None:
+            times_utc = self.compute_batch_utc(dates, lat, lon)
+            return PrayerRange(self, start, array("d", np.concatenate([times_utc[k] for k in ORDERED_KEYS]).tobytes()))
+        days = [self._compute_utc(d, lat, lon) for d in dates]
+        return PrayerRange(self, start, array("d", (_nan_if_none(day[k]) for k in ORDERED_KEYS for day in days)))
+
+    def compute_grid_days(self, start: date, end: date, latitudes, longitudes) -> list["PrayerRange"]:
+        """``compute_days`` for many locations in one pass of the grid engine (one range per location)."""
+        if np is None:
+            return [self.compute_days(start, end, la, lo) for la, lo in zip(latitudes, longitudes)]
+        dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        times_utc = self.compute_grid_utc(dates, latitudes, longitudes)
+        # (keys, locations, days) -> one key-major block per location.
+        stacked = np.ascontiguousarray(np.stack([times_utc[k] for k in ORDERED_KEYS], axis=1))
+        return [PrayerRange(self, start, array("d", row.tobytes())) for row in stacked]
+
+    def compute_year_utc(self, year: int, lat: float, lon: float) -> array:
+        """One year of UTC minutes at one location, as a flat ``array('d')``.
+
+        This is ``compute_days(...).minutes`` for the whole year (see
+        ``PrayerRange`` for the layout), the unit persisted by the timetable
+        cache.
+        """
+        return self.compute_days(date(year, 1, 1), date(year, 12, 31), lat, lon).minutes
+
+    def _compute_utc(self, base_date: date, latitude: float,
+                     longitude: float) -> dict[str, Optional[float]]:
+        """Scalar engine: UTC minutes from ``base_date`` midnight, keyed by ORDERED_KEYS."""
+        return self._method_times(base_date, self._solar_day(base_date, latitude, longitude))
+
+    def _solar_day(self, base_date: date, latitude: float, longitude: float) -> "_SolarDay":
+        """Events that do not depend on the method: noon, sunrise, sunset and Asr."""
         lat_rad = math.radians(latitude)
         jd0 = self.julian_day(base_date.year, base_date.month, base_date.day)
-        _, eqt_min = self.sun_position(jd0)
-        noon_utc = 720.0 - 4.0 * longitude - eqt_min
+        noon_utc = self._transit(jd0, longitude)
 
         sunrise_utc = self._refine_angle(lat_rad, jd0, noon_utc, SUN_ZENITH, -1)
         sunset_utc = self._refine_angle(lat_rad, jd0, noon_utc, SUN_ZENITH, 1)
 
-        # Night length used for high-latitude Fajr/Isha fallback (uses same-day sunrise).
+        # Night length used by the high-latitude Fajr/Isha rules (uses same-day sunrise).
         if sunrise_utc is not None and sunset_utc is not None:
             night_fallback = sunrise_utc + (1440.0 - sunset_utc)
         else:
             night_fallback = 0.0
 
-        dhuhr_utc = noon_utc
         asr_utc = self._compute_asr(lat_rad, jd0, noon_utc)
         if asr_utc is None:
             asr_utc = noon_utc + 150.0
+        return _SolarDay(lat_rad, jd0, longitude, noon_utc, sunrise_utc, sunset_utc, night_fallback, asr_utc)
 
+    def _method_times(self, base_date: date, solar: "_SolarDay", sunrise_next=_UNSET) -> dict[str, Optional[float]]:
+        """This method's events on top of a ``_solar_day``, keyed by ORDERED_KEYS."""
+        lat_rad, jd0, noon_utc = solar.lat_rad, solar.jd0, solar.noon_utc
         fajr_utc, isha_utc = self._compute_fajr_isha(
-            base_date, lat_rad, jd0, noon_utc, sunrise_utc, sunset_utc, night_fallback
+            base_date, lat_rad, jd0, noon_utc, solar.sunrise_utc, solar.sunset_utc, solar.night_fallback
         )
-        maghrib_utc = self._compute_maghrib(lat_rad, jd0, noon_utc, sunset_utc)
+        maghrib_utc = self._compute_maghrib(lat_rad, jd0, noon_utc, solar.sunset_utc)
 
         times_utc = {
             "Imsak": fajr_utc - 10.0 if fajr_utc is not None else None,
             "Fajr": fajr_utc,
-            "Sunrise": sunrise_utc,
-            "Dhuhr": dhuhr_utc,
-            "Asr": asr_utc,
-            "Sunset": sunset_utc,
+            "Sunrise": solar.sunrise_utc,
+            "Dhuhr": noon_utc,
+            "Asr": solar.asr_utc,
+            "Sunset": solar.sunset_utc,
             "Maghrib": maghrib_utc,
             "Isha": isha_utc,
         }
-        times_utc.update(self._night_marks(lat_rad, jd0, longitude, fajr_utc, sunset_utc))
+        times_utc.update(self._night_marks(lat_rad, jd0, solar.longitude, fajr_utc, solar.sunset_utc,
+                                           sunrise_next))
+        return {k: times_utc.get(k) for k in ORDERED_KEYS}
 
-        return {
-            k: self._to_local_datetime(base_date, times_utc.get(k))
-            for k in ORDERED_KEYS
-        }
+    def _next_sunrise(self, lat_rad: float, jd0: float, longitude: float) -> Optional[float]:
+        """The following day's sunrise, in UTC minutes from that day's midnight."""
+        noon_next = self._transit(jd0 + 1.0, longitude)
+        return self._refine_angle(lat_rad, jd0 + 1.0, noon_next, SUN_ZENITH, -1)
 
-    def _night_marks(self, lat_rad, jd0, longitude, fajr_utc, sunset_utc) -> dict:
+    def _night_marks(self, lat_rad, jd0, longitude, fajr_utc, sunset_utc, sunrise_next=_UNSET) -> dict:
         """Midnight and the night thirds, in UTC minutes.
 
         Night spans Sunset to the next day's Sunrise (standard) or to Fajr
         (jafari). Using the next day's recomputed sunrise — not today's + 24h —
-        keeps the midpoint accurate as day length changes.
+        keeps the midpoint accurate as day length changes. ``sunrise_next``
+        may be passed in when it is already known.
         """
         if sunset_utc is None:
             return {"Midnight": None, "Firstthird": None, "Lastthird": None}
@@ -324,9 +530,8 @@ class PrayerTimes:
         if self.cfg.midnight == "jafari" and fajr_utc is not None:
             night = (fajr_utc + 1440.0) - sunset_utc
         else:
-            _, eqt_next = self.sun_position(jd0 + 1.0)
-            noon_next = 720.0 - 4.0 * longitude - eqt_next
-            sunrise_next = self._refine_angle(lat_rad, jd0 + 1.0, noon_next, SUN_ZENITH, -1)
+            if sunrise_next is _UNSET:
+                sunrise_next = self._next_sunrise(lat_rad, jd0, longitude)
             if sunrise_next is None:
                 return {"Midnight": None, "Firstthird": None, "Lastthird": None}
             night = (sunrise_next + 1440.0) - sunset_utc
@@ -337,19 +542,531 @@ class PrayerTimes:
             "Lastthird": sunset_utc + 2.0 * night / 3.0,
         }
 
+    def compare_methods(self, base_date: date, lat: float, lon: float,
+                        methods=None) -> dict[str, dict[str, Optional[datetime]]]:
+        """Compute one day under several methods (all of PRAYER_METHODS by default).
+
+        Returns ``{method: compute_datetimes-style dict}``. Noon, sunrise,
+        sunset, Asr and the next day's sunrise do not depend on the method,
+        so they are solved once and each method only adds its own Fajr, Isha,
+        Maghrib and night marks. Every method uses this instance's madhab,
+        timezone, shafaq, precision and high-latitude rule.
+        """
+        solar = self._solar_day(base_date, lat, lon)
+        sunrise_next = self._next_sunrise(solar.lat_rad, solar.jd0, lon)
+        matrix = {}
+        for method in (methods if methods is not None else PRAYER_METHODS):
+            pt = PrayerTimes.for_config(method, self.madhab, self.tz, self.shafaq, self.precision,
+                                        self.high_latitude_rule)
+            times_utc = pt._method_times(base_date, solar, sunrise_next=sunrise_next)
+            matrix[pt.method] = {k: self._to_local_datetime(base_date, v) for k, v in times_utc.items()}
+        return matrix
+
+    # -----------------------------
+    # Batch compute (vectorized)
+    # -----------------------------
+    def compute_batch(self, dates, latitudes, longitudes) -> list[dict[str, Optional[datetime]]]:
+        """Compute prayer times for many (date, location) pairs in one pass.
+
+        ``latitudes`` / ``longitudes`` are sequences aligned with ``dates``, or
+        scalars shared by every date. Returns one ``compute_datetimes``-style
+        dict per pair, in input order. Runs on the NumPy engine when it is
+        installed and falls back to the scalar path otherwise.
+        """
+        dates = list(dates)
+        if np is None:
+            lats = _broadcast(latitudes, len(dates))
+            lons = _broadcast(longitudes, len(dates))
+            return [self.compute_datetimes(d, la, lo) for d, la, lo in zip(dates, lats, lons)]
+
+        times_utc = self.compute_batch_utc(dates, latitudes, longitudes)
+        columns = [(k, times_utc[k].tolist()) for k in ORDERED_KEYS]
+        return [
+            {k: self._to_local_datetime(d, None if math.isnan(col[i]) else col[i]) for k, col in columns}
+            for i, d in enumerate(dates)
+        ]
+
+    def compute_batch_utc(self, dates, latitudes, longitudes) -> dict:
+        """Vectorized ``_compute_utc``: one float64 array of UTC minutes per key.
+
+        Each array is aligned with ``dates``; NaN marks an event that does not
+        occur (the scalar path's None).
+        """
+        if np is None:
+            raise RuntimeError("numpy required for the batch engine; use compute_datetimes")
+        dates = list(dates)
+        jd0 = np.array([self.julian_day(d.year, d.month, d.day) for d in dates], dtype=float)
+        lat = np.broadcast_to(np.asarray(latitudes, dtype=float), jd0.shape)
+        lon = np.broadcast_to(np.asarray(longitudes, dtype=float), jd0.shape)
+        return self._batch_utc(dates, jd0, lat, lon)
+
+    def compute_grid(self, dates, latitudes, longitudes) -> dict[str, list[list[Optional[datetime]]]]:
+        """Compute every (location, date) pair of a regional timetable in one pass.
+
+        ``latitudes`` / ``longitudes`` are aligned sequences of locations.
+        Returns, per key of ORDERED_KEYS, one row per location holding one
+        timezone-aware datetime (or None) per date.
+        """
+        dates = list(dates)
+        if np is None:
+            rows = [[self._compute_utc(d, la, lo) for d in dates] for la, lo in zip(latitudes, longitudes)]
+            return {
+                k: [[self._to_local_datetime(d, day[k]) for d, day in zip(dates, row)] for row in rows]
+                for k in ORDERED_KEYS
+            }
+        times_utc = self.compute_grid_utc(dates, latitudes, longitudes)
+        return {
+            k: [
+                [self._to_local_datetime(d, None if math.isnan(m) else m) for d, m in zip(dates, row)]
+                for row in times_utc[k].tolist()
+            ]
+            for k in ORDERED_KEYS
+        }
+
+    def compute_grid_utc(self, dates, latitudes, longitudes) -> dict:
+        """Vectorized ``_compute_utc`` over locations x dates.
+
+        Returns one float64 array of shape (n_locations, n_dates) per key.
+        Declination and equation of time at 0h UT do not depend on the
+        location, so they are evaluated once per date and broadcast.
+        """
+        if np is None:
+            raise RuntimeError("numpy required for the batch engine; use compute_grid")
+        dates = list(dates)
+        jd0 = np.array([self.julian_day(d.year, d.month, d.day) for d in dates], dtype=float)[np.newaxis, :]
+        lat = np.asarray(latitudes, dtype=float).reshape(-1, 1)
+        lon = np.asarray(longitudes, dtype=float).reshape(-1, 1)
+        shape = (lat.shape[0], jd0.shape[1])
+        return {k: np.broadcast_to(v, shape) for k, v in self._batch_utc(dates, jd0, lat, lon).items()}
+
+    def _batch_utc(self, dates, jd0, lat, lon) -> dict:
+        # jd0 / lat / lon only need to broadcast together: aligned 1-D arrays
+        # for compute_batch_utc, a row of dates against a column of locations
+        # for compute_grid_utc.
+        lat_rad = np.radians(lat)
+
+        # Declination / equation of time at 0h UT are shared by every event of the day.
+        dec0, noon_utc = self._batch_transit(jd0, lon)
+
+        sunrise_utc = self._batch_angle(lat_rad, jd0, noon_utc, SUN_ZENITH, -1, dec0)
+        sunset_utc = self._batch_angle(lat_rad, jd0, noon_utc, SUN_ZENITH, 1, dec0)
+        night_fallback = np.where(
+            np.isnan(sunrise_utc) | np.isnan(sunset_utc), 0.0, sunrise_utc + (1440.0 - sunset_utc)
+        )
+
+        asr_utc = batch.compute_asr(lat_rad, jd0, noon_utc, self.asr_factor, self._batch_sun, self._batch_steps)
+        asr_utc = np.where(np.isnan(asr_utc), noon_utc + 150.0, asr_utc)
+
+        fajr_utc, isha_utc = self._batch_fajr_isha(
+            dates, lat_rad, jd0, noon_utc, dec0, sunrise_utc, sunset_utc, night_fallback
+        )
+        maghrib_utc = self._batch_maghrib(lat_rad, jd0, noon_utc, dec0, sunset_utc)
+
+        times_utc = {
+            "Imsak": fajr_utc - 10.0,
+            "Fajr": fajr_utc,
+            "Sunrise": sunrise_utc,
+            "Dhuhr": noon_utc,
+            "Asr": asr_utc,
+            "Sunset": sunset_utc,
+            "Maghrib": maghrib_utc,
+            "Isha": isha_utc,
+        }
+        times_utc.update(self._batch_night_marks(lat_rad, jd0, lon, fajr_utc, sunset_utc))
+        return {k: times_utc[k] for k in ORDERED_KEYS}
+
+    def _batch_transit(self, jd0, lon):
+        """Declination at 0h UT and solar-noon UTC minutes, as arrays."""
+        dec0, eqt_min = self._batch_sun(jd0)
+        noon_utc = 720.0 - 4.0 * lon - eqt_min
+        for _ in range(self._batch_steps - 1):
+            _, eqt_min = self._batch_sun(jd0 + noon_utc / 1440.0)
+            noon_utc = 720.0 - 4.0 * lon - eqt_min
+        return dec0, noon_utc
+
+    def _batch_angle(self, lat_rad, jd0, noon_utc, zenith: float, direction: int, dec0):
+        return batch.refine_angle(lat_rad, jd0, noon_utc, zenith, direction, dec0,
+                                  self._batch_sun, self._batch_steps)
+
+    def _batch_fajr_isha(self, dates, lat_rad, jd0, noon_utc, dec0,
+                         sunrise_utc, sunset_utc, night_fallback):
+        if self.cfg.moonsighting:
+            # Season-day index per date for each hemisphere, then pick by latitude sign.
+            lat_deg = np.degrees(lat_rad)
+            north = np.array([moonsight.season_day(d, 0.0) for d in dates]).reshape(np.shape(jd0))
+            south = np.array([moonsight.season_day(d, -1.0) for d in dates]).reshape(np.shape(jd0))
+            dyy = np.where(lat_deg >= 0, north, south)
+            fajr_mins = batch.moonsighting_minutes(*moonsight.fajr_coefficients(lat_deg), dyy)
+            isha_mins = batch.moonsighting_minutes(*moonsight.isha_coefficients(lat_deg, self.shafaq), dyy)
+            return sunrise_utc - fajr_mins, sunset_utc + isha_mins
+
+        angle = float(self.cfg.fajr)
+        fajr_utc = self._batch_angle(lat_rad, jd0, noon_utc, 90.0 + angle, -1, dec0)
+        fajr_utc = self._batch_high_latitude(fajr_utc, sunrise_utc, lat_rad, jd0, noon_utc, dec0,
+                                             angle, -1, night_fallback)
+
+        kind, value = self.cfg.isha
+        if kind == "mins":
+            return fajr_utc, sunset_utc + value
+        isha_utc = self._batch_angle(lat_rad, jd0, noon_utc, 90.0 + value, 1, dec0)
+        isha_utc = self._batch_high_latitude(isha_utc, sunset_utc, lat_rad, jd0, noon_utc, dec0,
+                                             value, 1, night_fallback)
+        return fajr_utc, isha_utc
+
+    def _batch_high_latitude(self, event_utc, base_utc, lat_rad, jd0, noon_utc, dec0,
+                             angle: float, direction: int, night):
+        """Vectorized ``_high_latitude``, filling the NaN entries of ``event_utc``."""
+        missing = np.isnan(event_utc) & ~np.isnan(base_utc)
+        if not missing.any():
+            return event_utc
+        rule = self._high_lat
+        fallback = base_utc + direction * rule.portion(night, angle)
+        if rule.latitude is not None:
+            limit = math.radians(rule.latitude)
+            # Locations inside the limit are solved again at their own latitude and stay NaN.
+            near = self._batch_angle(np.clip(lat_rad, -limit, limit), jd0, noon_utc, 90.0 + angle, direction, dec0)
+            fallback = np.where(np.isnan(near), fallback, near)
+        return np.where(missing, fallback, event_utc)
+
+    def _batch_maghrib(self, lat_rad, jd0, noon_utc, dec0, sunset_utc):
+        kind = self.cfg.maghrib[0]
+        if kind == "sunset":
+            return sunset_utc
+        if kind == "mins":
+            return sunset_utc + self.cfg.maghrib[1]
+        maghrib_utc = self._batch_angle(lat_rad, jd0, noon_utc, 90.0 + self.cfg.maghrib[1], 1, dec0)
+        return np.where(np.isnan(maghrib_utc), sunset_utc, maghrib_utc)
+
+    def _batch_night_marks(self, lat_rad, jd0, lon, fajr_utc, sunset_utc) -> dict:
+        dec_next, noon_next = self._batch_transit(jd0 + 1.0, lon)
+        sunrise_next = self._batch_angle(lat_rad, jd0 + 1.0, noon_next, SUN_ZENITH, -1, dec_next)
+        night = (sunrise_next + 1440.0) - sunset_utc
+        if self.cfg.midnight == "jafari":
+            night = np.where(np.isnan(fajr_utc), night, (fajr_utc + 1440.0) - sunset_utc)
+        return {
+            "Midnight": sunset_utc + night / 2.0,
+            "Firstthird": sunset_utc + night / 3.0,
+            "Lastthird": sunset_utc + 2.0 * night / 3.0,
+        }
+
+    def iter_range(self, start: date, end: date, lat: float,
+                   lon: float) -> Iterator[tuple[date, dict[str, Optional[datetime]]]]:
+        """Lazily yield ``(date, compute_datetimes-style dict)`` for each day in [start, end].
+
+        Days are computed one at a time as the caller consumes them, so a
+        multi-year range runs in constant memory.
+        """
+        day = start
+        while day <= end:
+            yield day, self.compute_datetimes(day, lat, lon)
+            day += timedelta(days=1)
+
     def compute_month(self, year: int, month: int, lat: float, lon: float):
         """Compute prayer times for every day of a month (list of (iso_date, times))."""
+        start = date(year, month, 1)
+        end = date(year, month, calendar.monthrange(year, month)[1])
+        return [(d.isoformat(), self.format_times(times)) for d, times in self.iter_range(start, end, lat, lon)]
+
+    def compute_year(self, year: int, lat: float, lon: float, workers: Optional[int] = None):
+        """Compute prayer times for a whole year (list of formatted dicts, in date order)."""
+        days = self.compute_range(date(year, 1, 1), date(year, 12, 31), lat, lon, workers=workers)
+        return [self.format_times(times) for _, times in days]
+
+    def compute_range(self, start: date, end: date, lat: float, lon: float,
+                      workers: Optional[int] = None,
+                      chunk_days: int = range_engine.DEFAULT_CHUNK_DAYS):
+        """Stream ``(date, compute_datetimes-style dict)`` for every day in [start, end].
+
+        The range is computed in chunks on the batch engine; ``workers`` > 1
+        spreads chunks over a process pool. Days are yielded in order.
+        """
+        return range_engine.compute_range(self, start, end, lat, lon, workers, chunk_days)
+
+
+class HighPrecisionPrayerTimes(PrayerTimes):
+    """``precision="high"``: VSOP87 apparent Sun and iterated solutions.
+
+    Same methods and API as ``PrayerTimes``; only the astronomy changes. The
+    Sun comes from ``vsop87`` (nutation, aberration and Delta T included)
+    instead of the low-precision formulas, and solar noon, every hour-angle
+    event and Asr are iterated to within HIGH_PRECISION_TOLERANCE_MIN rather
+    than refined once. The series are evaluated once per day and
+    interpolated, so the extra cost is mostly the additional iterations.
+    """
+
+    __slots__ = ()
+
+    precision = "high"
+    _batch_sun = staticmethod(vsop87.sun_position_array)
+    _batch_steps = 4
+
+    _ephemeris = staticmethod(vsop87.sun_position)
+
+    def _transit(self, jd0: float, longitude: float) -> float:
+        noon_utc = super()._transit(jd0, longitude)
+        for _ in range(HIGH_PRECISION_MAX_STEPS):
+            _, eqt_min = self._ephemeris(jd0 + noon_utc / 1440.0)
+            noon_next = 720.0 - 4.0 * longitude - eqt_min
+            if abs(noon_next - noon_utc) < HIGH_PRECISION_TOLERANCE_MIN:
+                return noon_next
+            noon_utc = noon_next
+        return noon_utc
+
+    def _refine_angle(self, lat_rad: float, jd0: float, noon_utc: float,
+                      zenith: float, direction: int) -> Optional[float]:
+        t = super()._refine_angle(lat_rad, jd0, noon_utc, zenith, direction)
+        for _ in range(HIGH_PRECISION_MAX_STEPS if t is not None else 0):
+            dec, _ = self._ephemeris(jd0 + t / 1440.0)
+            h = self._hour_angle(lat_rad, dec, zenith)
+            if h is None:
+                break
+            t_next = noon_utc + h * 4.0 * direction
+            if abs(t_next - t) < HIGH_PRECISION_TOLERANCE_MIN:
+                return t_next
+            t = t_next
+        return t
+
+    def _compute_asr(self, lat_rad: float, jd0: float, noon_utc: float) -> Optional[float]:
+        t = super()._compute_asr(lat_rad, jd0, noon_utc)
+        for _ in range(HIGH_PRECISION_MAX_STEPS if t is not None else 0):
+            dec, _ = self._ephemeris(jd0 + t / 1440.0)
+            alt = math.atan(1.0 / (self.asr_factor + math.tan(abs(lat_rad - dec))))
+            cosh = self._asr_cosh(lat_rad, dec, alt)
+            if cosh is None:
+                break
+            t_next = noon_utc + math.degrees(math.acos(cosh)) * 4.0
+            if abs(t_next - t) < HIGH_PRECISION_TOLERANCE_MIN:
+                return t_next
+            t = t_next
+        return t
+
+
+PRECISIONS: dict[str, type] = {"standard": PrayerTimes, "high": HighPrecisionPrayerTimes}
+
+
+@lru_cache(maxsize=PRAYER_TIMES_REGISTRY_SIZE)
+def _shared_instance(method: str, madhab: str, tz, shafaq: str, precision: str,
+                     high_latitude_rule: str) -> PrayerTimes:
+    return PRECISIONS[precision](method, madhab, tz, shafaq, high_latitude_rule)
+
+
+class _SolarDay(NamedTuple):
+    """Method-independent events of one day at one location (UTC minutes)."""
+
+    lat_rad: float
+    jd0: float
+    longitude: float
+    noon_utc: float
+    sunrise_utc: Optional[float]
+    sunset_utc: Optional[float]
+    night_fallback: float
+    asr_utc: float
+
+
+class PrayerDay(Mapping):
+    """One day of prayer times, held as UTC minutes and localized on access.
+
+    A read-only mapping of ORDERED_KEYS to timezone-aware datetimes (None when
+    the event does not occur), interchangeable with a ``compute_datetimes``
+    dict, but holding 11 floats instead of 11 datetimes: values are built
+    only when read. ``strings()`` is the ``compute`` view.
+    """
+
+    __slots__ = ("date", "_utc", "_pt")
+
+    def __init__(self, pt: PrayerTimes, base_date: date, utc):
+        # ``utc`` is aligned with ORDERED_KEYS; NaN marks a missing event.
+        self.date = base_date
+        self._utc = utc
+        self._pt = pt
+
+    def __getitem__(self, key: str) -> Optional[datetime]:
+        return self._pt._to_local_datetime(self.date, self.utc(key))
+
+    def __iter__(self):
+        return iter(ORDERED_KEYS)
+
+    def __len__(self) -> int:
+        return len(ORDERED_KEYS)
+
+    def __repr__(self) -> str:
+        return f"PrayerDay({self.date.isoformat()}, {self.strings()})"
+
+    def utc(self, key: str) -> Optional[float]:
+        """UTC minutes from midnight of ``date``, or None."""
+        value = self._utc[_KEY_INDEX[key]]
+        return None if math.isnan(value) else value
+
+    def datetimes(self) -> dict[str, Optional[datetime]]:
+        return {k: self[k] for k in ORDERED_KEYS}
+
+    def strings(self, fmt: Optional[str] = None) -> dict[str, Optional[str]]:
+        """Formatted local times; ``fmt`` defaults to the ``compute`` format."""
+        if fmt is None:
+            return {k: self._pt._format(self[k]) for k in ORDERED_KEYS}
+        return {k: _strftime(self[k], fmt) for k in ORDERED_KEYS}
+
+
+class PrayerRange(Sequence):
+    """Consecutive days at one location, as a struct of arrays of UTC minutes.
+
+    ``minutes`` is one flat ``array('d')`` in ORDERED_KEYS-major order: event
+    ``k`` of day ``i`` is at ``ORDERED_KEYS.index(k) * len(self) + i``, NaN
+    where the event does not occur. A year costs ~32 KB instead of ~4,000
+    datetimes; items are ``PrayerDay`` views built on access, and the
+    per-key accessors localize and format straight from the arrays.
+    """
+
+    __slots__ = ("start", "minutes", "_pt")
+
+    def __init__(self, pt: PrayerTimes, start: date, minutes: array):
+        if len(minutes) % len(ORDERED_KEYS):
+            raise ValueError("minutes must hold one value per key and day")
+        self.start = start
+        self.minutes = minutes
+        self._pt = pt
+
+    def __len__(self) -> int:
+        return len(self.minutes) // len(ORDERED_KEYS)
+
+    def __getitem__(self, i: int) -> PrayerDay:
+        n = len(self)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("PrayerRange index out of range")
+        return PrayerDay(self._pt, self.start + timedelta(days=i), self.minutes[i::n])
+
+    def __repr__(self) -> str:
+        return f"PrayerRange({self.start.isoformat()}, {len(self)} days)"
+
+    def dates(self) -> list[date]:
+        return [self.start + timedelta(days=i) for i in range(len(self))]
+
+    def utc(self, key: str) -> array:
+        """UTC minutes of ``key`` for every day (NaN where it does not occur)."""
+        n = len(self)
+        j = _KEY_INDEX[key] * n
+        return self.minutes[j:j + n]
+
+    def datetimes(self, key: str) -> list[Optional[datetime]]:
+        to_local = self._pt._to_local_datetime
+        start = self.start.toordinal()
         return [
-            (date(year, month, d).isoformat(), self.compute(date(year, month, d), lat, lon))
-            for d in range(1, calendar.monthrange(year, month)[1] + 1)
+            None if m != m else to_local(date.fromordinal(start + i), m)
+            for i, m in enumerate(self.utc(key))
         ]
 
-    def compute_year(self, year: int, lat: float, lon: float):
-        """Compute prayer times for a whole year, in parallel."""
-        with ThreadPoolExecutor() as ex:
-            futures = [
-                ex.submit(self.compute, date(year, m, d), lat, lon)
-                for m in range(1, 13)
-                for d in range(1, calendar.monthrange(year, m)[1] + 1)
-            ]
-            return [f.result() for f in futures]
+    def strings(self, key: str, fmt: Optional[str] = None) -> list[Optional[str]]:
+        """Formatted local times of ``key`` for every day.
+
+        ``"%H:%M:%S"`` is formatted from the local second of the day without
+        building datetimes, except on days next to a DST transition.
+        """
+        if fmt is None:
+            return [self._pt._format(dt) for dt in self.datetimes(key)]
+        clock = self._pt._clock
+        if fmt != HMS_FORMAT or clock is None:
+            return [_strftime(dt, fmt) for dt in self.datetimes(key)]
+        to_local = self._pt._to_local_datetime
+        start = self.start.toordinal()
+        out: list[Optional[str]] = []
+        for i, m in enumerate(self.utc(key)):
+            if m != m:
+                out.append(None)
+                continue
+            s = clock.wall_seconds(start + i, m)
+            if s is None:
+                out.append(to_local(date.fromordinal(start + i), m).strftime(HMS_FORMAT))
+            else:
+                out.append(f"{s // 3600:02d}:{s // 60 % 60:02d}:{s % 60:02d}")
+        return out
+
+
+def _nan_if_none(value: Optional[float]) -> float:
+    return math.nan if value is None else value
+
+
+def _strftime(dt: Optional[datetime], fmt: str) -> Optional[str]:
+    return dt.strftime(fmt) if dt else None
+
+
+class _LocalClock:
+    """UTC minutes -> local datetime, with a memoized per-day UTC offset table.
+
+    Away from DST transitions a local time is just the day's UTC midnight
+    shifted by a constant offset, so it is built with plain datetime
+    arithmetic. The offset is sampled once per UTC midnight and shared by
+    every event (and neighbouring day) that needs it; only days near a
+    transition go through ``astimezone``.
+    """
+
+    __slots__ = ("tz", "_offsets", "_bases")
+
+    def __init__(self, tz: tzinfo):
+        self.tz = tz
+        self._offsets: dict[int, timedelta] = {}
+        self._bases: dict[int, Optional[datetime]] = {}
+
+    def _offset(self, ordinal: int) -> timedelta:
+        offset = self._offsets.get(ordinal)
+        if offset is None:
+            if len(self._offsets) >= LOCAL_CLOCK_CACHE_DAYS:
+                self._offsets.clear()
+            midnight = datetime.fromordinal(ordinal).replace(tzinfo=timezone.utc)
+            offset = self._offsets[ordinal] = midnight.astimezone(self.tz).utcoffset()
+        return offset
+
+    def _base(self, ordinal: int) -> Optional[datetime]:
+        """Local wall time of the day's UTC midnight, or None near a transition."""
+        base = self._bases.get(ordinal, _UNSET)
+        if base is not _UNSET:
+            return base
+        if len(self._bases) >= LOCAL_CLOCK_CACHE_DAYS:
+            self._bases.clear()
+        # Events fall between the previous and the second-next UTC day. One
+        # extra day each side keeps wall times made ambiguous by a fall-back
+        # (fold=1) on the astimezone path.
+        offsets = {self._offset(o) for o in range(ordinal - 2, ordinal + 4)}
+        base = None
+        if len(offsets) == 1:
+            base = datetime.fromordinal(ordinal).replace(tzinfo=self.tz) + offsets.pop()
+        self._bases[ordinal] = base
+        return base
+
+    def wall_seconds(self, ordinal: int, minutes_utc: float) -> Optional[int]:
+        """Local second of the day of an event (what ``%H:%M:%S`` shows), or None near a transition."""
+        base = self._base(ordinal)
+        if base is None or not -1440.0 <= minutes_utc < 4320.0:
+            return None
+        # Same rounding as ``base + timedelta(minutes=...)``; offsets are whole seconds.
+        delta = timedelta(minutes=minutes_utc)
+        return (base.hour * 3600 + base.minute * 60 + base.second + delta.days * 86400 + delta.seconds) % 86400
+
+    def to_local(self, base_date: date, minutes_utc: float) -> datetime:
+        base = self._base(base_date.toordinal())
+        if base is not None and -1440.0 <= minutes_utc < 4320.0:
+            return base + timedelta(minutes=minutes_utc)
+        dt_utc = datetime.combine(base_date, time(0, 0), tzinfo=timezone.utc) + timedelta(minutes=minutes_utc)
+        return dt_utc.astimezone(self.tz)
+
+
+@lru_cache(maxsize=EPHEMERIS_CACHE_SIZE)
+def _cached_sun_position(jd: float) -> tuple[float, float]:
+    # The ephemeris depends only on jd, so every device, city and method that
+    # computes the same day shares the midnight/next-day entries, and repeated
+    # computations for one location (scheduler refreshes) hit on every event.
+    # lru_cache is thread-safe and keeps its own hit/miss counters.
+    table = ephemeris.get_table()
+    if table is not None:
+        position = table.lookup(jd)
+        if position is not None:
+            return position
+    return PrayerTimes.sun_position(jd)
+
+
+def _broadcast(values, n: int) -> list:
+    """Expand a scalar to ``n`` copies; pass sequences through as a list."""
+    if isinstance(values, (int, float)):
+        return [values] * n
+    return list(values)
@@ -0,0 +1,100 @@
+"""NumPy kernels for batch prayer-time computation.
+
+Array twins of the scalar astronomy primitives on ``PrayerTimes``
+(``sun_position``, ``_hour_angle``, ``_refine_angle``, ``_compute_asr``).
+Each function mirrors its scalar counterpart step for step so the two paths
+agree to floating-point noise; keep them in sync. Events that do not occur
+(polar day/night, unreachable twilight) are NaN here instead of None.
+
+NumPy is optional: ``np`` is None when it is not installed and callers fall
+back to the scalar engine.
+"""
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional speed-up
+    np = None
+
+
+def sun_position(jd):
+    """Vectorized ``PrayerTimes.sun_position``: (declination_rad, eqt_minutes)."""
+    d = jd - 2451545.0
+    g = np.radians((357.529 + 0.98560028 * d) % 360.0)
+    q = (280.459 + 0.98564736 * d) % 360.0
+    L = np.radians((q + 1.915 * np.sin(g) + 0.020 * np.sin(2 * g)) % 360.0)
+    e = np.radians(23.439 - 0.00000036 * d)
+    ra_deg = np.degrees(np.arctan2(np.cos(e) * np.sin(L), np.cos(L))) % 360.0
+    ra_hours = ra_deg / 15.0
+    dec_rad = np.arcsin(np.sin(e) * np.sin(L))
+    eqt = q / 15.0 - ra_hours
+    eqt = np.where(eqt > 12, eqt - 24, eqt)
+    eqt = np.where(eqt < -12, eqt + 24, eqt)
+    return dec_rad, eqt * 60.0
+
+
+def hour_angle(lat_rad, dec_rad, zenith_deg: float):
+    """Vectorized ``PrayerTimes._hour_angle`` (degrees, NaN when unreachable)."""
+    z_rad = np.radians(zenith_deg)
+    denom = np.cos(lat_rad) * np.cos(dec_rad)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cosh = (np.cos(z_rad) - np.sin(lat_rad) * np.sin(dec_rad)) / denom
+        valid = (np.abs(denom) >= 1e-15) & (cosh >= -1.0) & (cosh <= 1.0)
+        return np.where(valid, np.degrees(np.arccos(np.where(valid, cosh, 0.0))), np.nan)
+
+
+def refine_angle(lat_rad, jd0, noon_utc, zenith: float, direction: int, dec0=None,
+                 sun=sun_position, iterations: int = 1):
+    """Vectorized ``PrayerTimes._refine_angle``: UTC minutes, NaN when unreachable.
+
+    ``dec0`` may be passed in when the midnight declination is already known,
+    so the shared ephemeris is evaluated once per date rather than per event.
+    ``sun`` / ``iterations`` select the ephemeris and the number of
+    refinement steps (one for the standard engine).
+    """
+    if dec0 is None:
+        dec0, _ = sun(jd0)
+    h0 = hour_angle(lat_rad, dec0, zenith)
+    t = noon_utc + h0 * 4.0 * direction
+    for _ in range(iterations):
+        dec_try, _ = sun(jd0 + t / 1440.0)
+        h1 = hour_angle(lat_rad, dec_try, zenith)
+        t = np.where(np.isnan(h1), t, noon_utc + h1 * 4.0 * direction)
+    return t
+
+
+def _asr_cosh(lat_rad, dec, alt):
+    denom = np.cos(lat_rad) * np.cos(dec)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cosh = (np.sin(alt) - np.sin(lat_rad) * np.sin(dec)) / denom
+        valid = (np.abs(denom) >= 1e-15) & (cosh >= -1.0) & (cosh <= 1.0)
+        return np.where(valid, cosh, np.nan)
+
+
+def compute_asr(lat_rad, jd0, noon_utc, asr_factor: float, sun=sun_position, iterations: int = 1):
+    """Vectorized ``PrayerTimes._compute_asr``: UTC minutes, NaN when unreachable."""
+    dec, _ = sun(jd0 + noon_utc / 1440.0)
+    alt = np.arctan(1.0 / (asr_factor + np.tan(np.abs(lat_rad - dec))))
+    cosh = _asr_cosh(lat_rad, dec, alt)
+    asr_utc = noon_utc + np.degrees(np.arccos(cosh)) * 4.0
+
+    for _ in range(iterations):
+        dec_try, _ = sun(jd0 + asr_utc / 1440.0)
+        alt_try = np.arctan(1.0 / (asr_factor + np.tan(np.abs(lat_rad - dec_try))))
+        cosh_try = _asr_cosh(lat_rad, dec_try, alt_try)
+        asr_utc = np.where(np.isnan(cosh_try), asr_utc, noon_utc + np.degrees(np.arccos(cosh_try)) * 4.0)
+    return asr_utc
+
+
+def moonsighting_minutes(a, b, c, d, dyy):
+    """Vectorized ``moonsight.interpolate``, rounded to whole minutes like the scalar path."""
+    return np.round(np.select(
+        [dyy < 91, dyy < 137, dyy < 183, dyy < 229, dyy < 275],
+        [
+            a + (b - a) / 91 * dyy,
+            b + (c - b) / 46 * (dyy - 91),
+            c + (d - c) / 46 * (dyy - 137),
+            d + (c - d) / 46 * (dyy - 183),
+            c + (b - c) / 46 * (dyy - 229),
+        ],
+        b + (a - b) / 91 * (dyy - 275),
+    ))
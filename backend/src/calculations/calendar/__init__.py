@@ -3,6 +3,6 @@
 https://github.com/dralshehri/hijridate
 """
 
-from .hijri import Gregorian, Hijri
+from .hijri import Gregorian, Hijri, HijriArrays, hijri_labels, hijri_range, to_hijri_arrays, to_hijri_many
 
-__all__ = ["Gregorian", "Hijri"]
\ No newline at end of file
+__all__ = ["Gregorian", "Hijri", "HijriArrays", "hijri_labels", "hijri_range", "to_hijri_arrays", "to_hijri_many"]
\ No newline at end of file
@@ -1,11 +1,128 @@
 """Main module of the HijriDate package."""
 
 import datetime
-
-from bisect import bisect
+from array import array
+from functools import lru_cache
+from typing import Iterable, NamedTuple
 
 from . import helpers, locales, um_qura as ummalqura
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is an optional speed-up
+    np = None
+
+# Packed Hijri dates in the day table: year << 9 | month << 5 | day.
+_YEAR_SHIFT = 9
+_MONTH_SHIFT = 5
+_MONTH_MASK = 0xF
+_DAY_MASK = 0x1F
+
+_MIN_ORDINAL = helpers.jdn_to_ordinal(helpers.rjd_to_jdn(ummalqura.MONTH_STARTS[0]))
+"""Gregorian ordinal of the first supported day."""
+
+
+@lru_cache(maxsize=1)
+def day_table() -> array:
+    """Packed Hijri date of every supported day, indexed by ordinal - first ordinal.
+
+    Built on first use from ``MONTH_STARTS`` (~56k days, ~220 KB).
+    """
+    month_starts = ummalqura.MONTH_STARTS
+    table = array("i")
+    for index in range(len(month_starts) - 1):
+        months = index + ummalqura.HIJRI_OFFSET
+        base = ((months // 12 + 1) << _YEAR_SHIFT) | ((months % 12 + 1) << _MONTH_SHIFT)
+        table.extend(range(base + 1, base + 1 + month_starts[index + 1] - month_starts[index]))
+    return table
+
+
+def _unpack(packed: int) -> tuple[int, int, int]:
+    return packed >> _YEAR_SHIFT, (packed >> _MONTH_SHIFT) & _MONTH_MASK, packed & _DAY_MASK
+
+
+class HijriArrays(NamedTuple):
+    """Parallel year, month and day arrays (NumPy int arrays, or ``array('i')`` without NumPy)."""
+
+    years: "np.ndarray | array"
+    months: "np.ndarray | array"
+    days: "np.ndarray | array"
+
+
+def to_hijri_arrays(ordinals: Iterable[int]) -> HijriArrays:
+    """Convert many Gregorian ordinals (``date.toordinal()``) to parallel Hijri arrays.
+
+    No per-day objects are built. With NumPy the month of every day is found
+    with one ``searchsorted`` over ``MONTH_STARTS``; otherwise each day is
+    read from ``day_table``.
+
+    Raises:
+        OverflowError: When a date is out of supported Gregorian range.
+    """
+    if np is None:
+        table = day_table()
+        years, months, days = array("i"), array("i"), array("i")
+        for ordinal in ordinals:
+            index = ordinal - _MIN_ORDINAL
+            if not 0 <= index < len(table):
+                Gregorian.fromordinal(ordinal)._check_range()
+            year, month, day = _unpack(table[index])
+            years.append(year)
+            months.append(month)
+            days.append(day)
+        return HijriArrays(years, months, days)
+    if not isinstance(ordinals, np.ndarray):
+        ordinals = np.fromiter(ordinals, dtype=np.int64)
+    month_starts = np.frombuffer(ummalqura.MONTH_STARTS, dtype=np.int32)
+    rjd = helpers.jdn_to_rjd(helpers.ordinal_to_jdn(ordinals))
+    if len(rjd) and (rjd.min() < month_starts[0] or rjd.max() >= month_starts[-1]):
+        bad = ordinals[(rjd < month_starts[0]) | (rjd >= month_starts[-1])][0]
+        Gregorian.fromordinal(int(bad))._check_range()
+    index = np.searchsorted(month_starts, rjd, side="right") - 1
+    months = index + ummalqura.HIJRI_OFFSET
+    return HijriArrays(months // 12 + 1, months % 12 + 1, rjd - month_starts[index] + 1)
+
+
+def hijri_range(start: datetime.date, end: datetime.date) -> HijriArrays:
+    """``to_hijri_arrays`` for every day in [start, end]."""
+    first, last = start.toordinal(), end.toordinal()
+    if np is None:
+        return to_hijri_arrays(range(first, last + 1))
+    return to_hijri_arrays(np.arange(first, last + 1, dtype=np.int64))
+
+
+def hijri_labels(
+    start: datetime.date, end: datetime.date, language: locales.Language | str = "en"
+) -> list[str]:
+    """``Hijri.label`` of every day in [start, end], without per-day objects.
+
+    Raises:
+        OverflowError: When a date is out of supported Gregorian range.
+    """
+    years, months, days = hijri_range(start, end)
+    label = locales.get_locale(language).hijri_label
+    weekday = start.isoweekday() - 1
+    return [
+        label(year, month, day, (weekday + i) % 7 + 1)
+        for i, (year, month, day) in enumerate(zip(years.tolist(), months.tolist(), days.tolist()))
+    ]
+
+
+def to_hijri_many(ordinals: Iterable[int]) -> list["Hijri"]:
+    """Return Hijri objects for many Gregorian ordinals (``date.toordinal()``).
+
+    Raises:
+        OverflowError: When a date is out of supported Gregorian range.
+    """
+    table = day_table()
+    result = []
+    for ordinal in ordinals:
+        index = ordinal - _MIN_ORDINAL
+        if not 0 <= index < len(table):
+            Gregorian.fromordinal(ordinal)._check_range()
+        result.append(Hijri(*_unpack(table[index]), validate=False))
+    return result
+
 
 class Hijri:
     """A Hijri object represents a date in lunar Hijri calendar.
@@ -165,6 +282,14 @@ class Hijri:
         """
         return locales.get_locale(language).day_name(self.isoweekday())
 
+    def label(self, language: locales.Language | str = "en") -> str:
+        """Return "<day name> <day> <month name> <year>".
+
+        Args:
+            language: Two-letter language code for localized names.
+        """
+        return locales.get_locale(language).hijri_label(self._year, self._month, self._day, self.isoweekday())
+
     @staticmethod
     def notation(language: locales.Language | str = "en") -> str:
         """Return calendar era notation.
@@ -291,17 +416,11 @@ class Gregorian(datetime.date):
         Raises:
             OverflowError: When date is out of supported Gregorian range.
         """
-        self._check_range()
-        jdn = self.to_julian()
-        rjd = helpers.jdn_to_rjd(jdn)
-        month_starts = ummalqura.MONTH_STARTS
-        index = bisect(month_starts, rjd) - 1
-        months = index + ummalqura.HIJRI_OFFSET
-        years = int(months / 12)
-        year = years + 1
-        month = months - (years * 12) + 1
-        day = rjd - month_starts[index] + 1
-        return Hijri(year, month, day, validate=False)
+        index = self.toordinal() - _MIN_ORDINAL
+        table = day_table()
+        if not 0 <= index < len(table):
+            self._check_range()
+        return Hijri(*_unpack(table[index]), validate=False)
 
     def _check_range(self) -> None:
         """Check if Gregorian date is within valid range."""
@@ -1,15 +1,24 @@
 """Localization for the Hijri month and day names."""
 
-from typing import ClassVar, Literal
+from functools import lru_cache
+from typing import ClassVar, Literal, get_args
 
 Language = Literal["en", "ar", "bn", "tr"]
 
+LANGUAGE_PATTERN = "^(" + "|".join(get_args(Language)) + ")$"
+"""Query-parameter / schema validation pattern for language codes."""
+
 _locale_map: dict[str, type["Locale"]] = {}
+_instances: dict[type["Locale"], "Locale"] = {}
 
 
+@lru_cache(maxsize=128)
 def get_locale(name: str) -> "Locale":
     """Return an appropriate :obj:`Locale` corresponding to a locale name.
 
+    Locales hold constant data only, so one instance per language is shared
+    by every caller.
+
     Args:
         name: name of the locale.
     """
@@ -20,7 +29,10 @@ def get_locale(name: str) -> "Locale":
         message = f"unsupported language: {language_tag}"
         raise ValueError(message)
 
-    return locale_cls()
+    locale = _instances.get(locale_cls)
+    if locale is None:
+        locale = _instances[locale_cls] = locale_cls()
+    return locale
 
 
 class Locale:
@@ -33,6 +45,13 @@ class Locale:
     notation: ClassVar[str]
     gregorian_notation: ClassVar[str]
 
+    def __init__(self) -> None:
+        # Pre-rendered "<day name> " / " <month name> " around the day and
+        # year of a Hijri label, for every (month, weekday).
+        self._label_parts = tuple(
+            (f"{day_name} ", f" {month_name} ") for month_name in self.month_names for day_name in self.day_names
+        )
+
     def __init_subclass__(cls) -> None:
         if cls.language_tag in _locale_map:
             message = f"duplicated language tag: {cls.language_tag}"
@@ -63,6 +82,18 @@ class Locale:
         """
         return self.day_names[day - 1]
 
+    def hijri_label(self, year: int, month: int, day: int, weekday: int) -> str:
+        """Return "<day name> <day> <month name> <year>" for a Hijri date.
+
+        Args:
+            year: Hijri year.
+            month: Hijri month, in range 1-12.
+            day: Hijri day of month.
+            weekday: day of week, where Monday is 1 and Sunday is 7.
+        """
+        head, middle = self._label_parts[(month - 1) * 7 + weekday - 1]
+        return f"{head}{day}{middle}{year}"
+
 
 class EnglishLocale(Locale):
     """An English Locale object represents English locale-specific data."""
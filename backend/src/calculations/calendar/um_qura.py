@@ -1,5 +1,7 @@
 """Umm al-Qura calendar constants."""
 
+from array import array
+
 DateTuple = tuple[int, int, int]
 
 GREGORIAN_RANGE: tuple[DateTuple, DateTuple] = ((1924, 8, 1), (2077, 11, 16))
@@ -12,7 +14,7 @@ HIJRI_OFFSET: int = 1342 * 12
 """Total Hijri months elapsed before the beginning of Hijri range."""
 
 # fmt: off
-MONTH_STARTS: tuple[int, ...] = (
+MONTH_STARTS: array = array("i", (
     23999, 24029, 24058, 24088, 24118, 24147, 24177, 24207, 24237, 24265, 24295, 24325,
     24355, 24384, 24413, 24443, 24472, 24502, 24531, 24561, 24590, 24620, 24649, 24679,
     24708, 24738, 24767, 24797, 24826, 24857, 24886, 24916, 24944, 24974, 25004, 25033,
@@ -171,7 +173,7 @@ MONTH_STARTS: tuple[int, ...] = (
     78926, 78956, 78985, 79015, 79044, 79074, 79104, 79133, 79163, 79192, 79222, 79251,
     79281, 79310, 79340, 79369, 79399, 79428, 79458, 79487, 79517, 79546, 79576, 79606,
     79635, 79665, 79695, 79724, 79753, 79783, 79812, 79841, 79871, 79900, 79930, 79960,
-    79990)
-"""Ordered list of Reduced Julian Day (RJD) numbers for the beginning of supported
+    79990))
+"""Ordered array of Reduced Julian Day (RJD) numbers for the beginning of supported
 Hijri months.
 """
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""High-latitude rules for Fajr and Isha.
+
+Far from the equator the Sun can stay above a method's twilight angle all
+night (northern Europe for weeks around the summer solstice), so the angle
+solver finds no Fajr or Isha. The engine then asks the configured rule:
+
+- ``middle_of_night``: Fajr / Isha at the middle of the night;
+- ``seventh_of_night`` (default): one seventh of the night before sunrise /
+  after sunset;
+- ``twilight_angle``: angle / 60 of the night, so deeper angles keep a
+  longer twilight;
+- ``nearest_latitude``: the time the angle is reached at NEAREST_LATITUDE_DEG
+  (same longitude and date), the latitude closest to the pole where the usual
+  18 degree angles still occur every night. Locations where even that latitude
+  has no solution use one seventh of the night.
+
+Rules only apply to days where the angle is never reached. Portions are plain
+arithmetic on the night length, so the same functions serve the scalar engine
+(floats) and the batch engine (NumPy arrays).
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+DEFAULT_RULE = "seventh_of_night"
+NEAREST_LATITUDE_DEG = 48.5
+
+
+def _middle_of_night(night, angle):
+    return night / 2.0
+
+
+def _seventh_of_night(night, angle):
+    return night / 7.0
+
+
+def _twilight_angle(night, angle):
+    return night * angle / 60.0
+
+
+@dataclass(frozen=True)
+class HighLatitudeRule:
+    """A fallback for unreachable twilight angles.
+
+    portion  : (night_minutes, angle_deg) -> minutes between sunrise and Fajr
+               (or sunset and Isha). Works on floats and arrays.
+    latitude : when set, first solve the angle at this latitude (same sign as
+               the location's) and only use ``portion`` if that fails too.
+    """
+
+    description: str
+    portion: Callable
+    latitude: Optional[float] = None
+
+
+HIGH_LATITUDE_RULES: dict[str, HighLatitudeRule] = {
+    "middle_of_night": HighLatitudeRule("Middle of the night", _middle_of_night),
+    "seventh_of_night": HighLatitudeRule("One seventh of the night", _seventh_of_night),
+    "twilight_angle": HighLatitudeRule("Twilight angle / 60 of the night", _twilight_angle),
+    "nearest_latitude": HighLatitudeRule(
+        f"Times at the nearest latitude ({NEAREST_LATITUDE_DEG} degrees)", _seventh_of_night, NEAREST_LATITUDE_DEG
+    ),
+}
+
+# Query-parameter / schema validation pattern.
+RULE_PATTERN = "^(" + "|".join(HIGH_LATITUDE_RULES) + ")$"
+
+
+def get_rule(name: str) -> HighLatitudeRule:
+    try:
+        return HIGH_LATITUDE_RULES[name]
+    except KeyError:
+        raise ValueError(f"Unknown high-latitude rule '{name}'") from None
+
+
+def get_available_rules() -> list[dict]:
+    """Return the available rules with their descriptions."""
+    return [{"rule": k, "description": v.description} for k, v in HIGH_LATITUDE_RULES.items()]
@@ -1,9 +1,86 @@
+"""Moonsighting Committee Fajr/Isha offsets.
+
+Fajr is a number of minutes before sunrise and Isha a number of minutes
+after sunset. Both are piecewise-linear in the day of the "season year"
+(days since the winter solstice of the location's hemisphere), with
+breakpoints scaled by the absolute latitude.
+
+The module-level functions are the hot path: they allocate nothing per day
+and work on plain floats or NumPy arrays alike. The season-day index is a
+per-year, per-hemisphere table built once. ``Fajr`` / ``Isha`` remain as thin
+object wrappers over the same functions.
+"""
+
 from datetime import date
+from functools import lru_cache
+
+DYY_NORTH_0 = (12, 21)
+DYY_SOUTH_0 = (6, 21)
+
+SHAFAQ_AHMER = "ahmer"
+SHAFAQ_ABYAD = "abyad"
+SHAFAQ_GENERAL = "general"
+
+
+@lru_cache(maxsize=256)
+def season_days(year: int, north: bool) -> tuple[int, ...]:
+    """Season-day index for every day of ``year`` (index 0 is January 1st)."""
+    month, day = DYY_NORTH_0 if north else DYY_SOUTH_0
+    zero = date(year, month, day).toordinal()
+    first = date(year, 1, 1).toordinal()
+    last = date(year, 12, 31).toordinal()
+    return tuple(o - zero if o - zero > 0 else 365 + o - zero for o in range(first, last + 1))
+
+
+def season_day(dt: date, latitude: float) -> int:
+    return season_days(dt.year, latitude >= 0)[dt.timetuple().tm_yday - 1]
+
+
+def fajr_coefficients(latitude):
+    """Breakpoint minutes (a, b, c, d) of the Fajr curve at ``latitude``."""
+    lat = abs(latitude)
+    return (75 + 28.65 / 55 * lat, 75 + 19.44 / 55 * lat, 75 + 32.74 / 55 * lat, 75 + 48.1 / 55 * lat)
+
+
+def isha_coefficients(latitude, shafaq: str = SHAFAQ_GENERAL):
+    """Breakpoint minutes (a, b, c, d) of the Isha curve at ``latitude``."""
+    lat = abs(latitude)
+    if shafaq == SHAFAQ_AHMER:
+        return (62 + 17.4 / 55.0 * lat, 62 - 7.16 / 55.0 * lat, 62 + 5.12 / 55.0 * lat, 62 + 19.44 / 55.0 * lat)
+    if shafaq == SHAFAQ_ABYAD:
+        return (75 + 25.6 / 55.0 * lat, 75 + 7.16 / 55.0 * lat, 75 + 36.84 / 55.0 * lat, 75 + 81.84 / 55.0 * lat)
+    return (75 + 25.6 / 55.0 * lat, 75 + 2.05 / 55.0 * lat, 75 - 9.21 / 55.0 * lat, 75 + 6.14 / 55.0 * lat)
+
+
+def interpolate(a: float, b: float, c: float, d: float, dyy: int) -> float:
+    """Piecewise-linear curve through a (solstice), b, c, d (opposite solstice) and back."""
+    if dyy < 91:
+        return a + (b - a) / 91 * dyy
+    elif dyy < 137:
+        return b + (c - b) / 46 * (dyy - 91)
+    elif dyy < 183:
+        return c + (d - c) / 46 * (dyy - 137)
+    elif dyy < 229:
+        return d + (c - d) / 46 * (dyy - 183)
+    elif dyy < 275:
+        return c + (b - c) / 46 * (dyy - 229)
+    else:
+        return b + (a - b) / 91 * (dyy - 275)
+
+
+def fajr_minutes(dt: date, latitude: float) -> int:
+    """Minutes before sunrise for Fajr."""
+    return round(interpolate(*fajr_coefficients(latitude), season_day(dt, latitude)))
+
+
+def isha_minutes(dt: date, latitude: float, shafaq: str = SHAFAQ_GENERAL) -> int:
+    """Minutes after sunset for Isha."""
+    return round(interpolate(*isha_coefficients(latitude, shafaq), season_day(dt, latitude)))
 
 
 class MoonSightingBase:
-    DYY_NORTH_0 = (12, 21)
-    DYY_SOUTH_0 = (6, 21)
+    DYY_NORTH_0 = DYY_NORTH_0
+    DYY_SOUTH_0 = DYY_SOUTH_0
 
     def __init__(self, dt: date, latitude: float):
         self.date = dt
@@ -12,47 +89,25 @@ class MoonSightingBase:
         self.a = self.b = self.c = self.d = 0
 
     def get_dyy(self) -> int:
-        year = self.date.year
-        if self.latitude >= 0:
-            month, day = self.DYY_NORTH_0
-        else:
-            month, day = self.DYY_SOUTH_0
-        dyy_zero = date(year, month, day)
-        diff = (self.date - dyy_zero).days
-        return diff if diff > 0 else 365 + diff
+        return season_day(self.date, self.latitude)
 
     def get_minutes(self) -> float:
-        d = self.dyy
-        if d < 91:
-            return self.a + (self.b - self.a) / 91 * d
-        elif d < 137:
-            return self.b + (self.c - self.b) / 46 * (d - 91)
-        elif d < 183:
-            return self.c + (self.d - self.c) / 46 * (d - 137)
-        elif d < 229:
-            return self.d + (self.c - self.d) / 46 * (d - 183)
-        elif d < 275:
-            return self.c + (self.b - self.c) / 46 * (d - 229)
-        else:
-            return self.b + (self.a - self.b) / 91 * (d - 275)
+        return interpolate(self.a, self.b, self.c, self.d, self.dyy)
 
 
 class Fajr(MoonSightingBase):
     def __init__(self, dt: date, latitude: float):
         super().__init__(dt, latitude)
-        self.a = 75 + 28.65 / 55 * abs(latitude)
-        self.b = 75 + 19.44 / 55 * abs(latitude)
-        self.c = 75 + 32.74 / 55 * abs(latitude)
-        self.d = 75 + 48.1 / 55 * abs(latitude)
+        self.a, self.b, self.c, self.d = fajr_coefficients(latitude)
 
     def minutes_before_sunrise(self) -> float:
         return round(self.get_minutes())
 
 
 class Isha(MoonSightingBase):
-    SHAFAQ_AHMER = "ahmer"
-    SHAFAQ_ABYAD = "abyad"
-    SHAFAQ_GENERAL = "general"
+    SHAFAQ_AHMER = SHAFAQ_AHMER
+    SHAFAQ_ABYAD = SHAFAQ_ABYAD
+    SHAFAQ_GENERAL = SHAFAQ_GENERAL
 
     def __init__(self, dt: date, latitude: float, shafaq: str = SHAFAQ_GENERAL):
         super().__init__(dt, latitude)
@@ -61,22 +116,7 @@ class Isha(MoonSightingBase):
 
     def set_shafaq(self, shafaq: str):
         self.shafaq = shafaq
-        lat = abs(self.latitude)
-        if shafaq == self.SHAFAQ_AHMER:
-            self.a = 62 + 17.4 / 55.0 * lat
-            self.b = 62 - 7.16 / 55.0 * lat
-            self.c = 62 + 5.12 / 55.0 * lat
-            self.d = 62 + 19.44 / 55.0 * lat
-        elif shafaq == self.SHAFAQ_ABYAD:
-            self.a = 75 + 25.6 / 55.0 * lat
-            self.b = 75 + 7.16 / 55.0 * lat
-            self.c = 75 + 36.84 / 55.0 * lat
-            self.d = 75 + 81.84 / 55.0 * lat
-        else:  # general
-            self.a = 75 + 25.6 / 55.0 * lat
-            self.b = 75 + 2.05 / 55.0 * lat
-            self.c = 75 - 9.21 / 55.0 * lat
-            self.d = 75 + 6.14 / 55.0 * lat
+        self.a, self.b, self.c, self.d = isha_coefficients(self.latitude, shafaq)
 
     def minutes_after_sunset(self) -> float:
         return round(self.get_minutes())
@@ -0,0 +1,127 @@
+"""Qibla direction and sun position tracks.
+
+- ``qibla_bearing`` / ``kaaba_distance_km``: initial great-circle bearing
+  (degrees clockwise from true north) and distance from a location to the
+  Kaaba, on a spherical Earth;
+- ``qibla_many``: the same for many coordinates at once;
+- ``sun_track`` / ``sun_tracks``: sun altitude and azimuth sampled over a UTC
+  day, from the engine's ephemeris (``PrayerTimes.sun_position``). Altitudes
+  are geometric (no refraction).
+
+The ``*_many`` / ``sun_tracks`` functions run as NumPy kernels when NumPy is
+installed and loop over the scalar functions otherwise; both paths return
+plain lists.
+"""
+
+import math
+from datetime import date
+from typing import NamedTuple, Sequence
+
+from . import batch
+from .adhan_calc import PrayerTimes
+from .batch import np
+
+KAABA_LAT = 21.422487
+KAABA_LON = 39.826206
+EARTH_RADIUS_KM = 6371.0088  # mean radius (IUGG)
+
+_KAABA_LAT_RAD = math.radians(KAABA_LAT)
+
+
+class SunTrack(NamedTuple):
+    """Sun position every ``step`` minutes from 00:00 UTC of a day."""
+
+    minutes: list[int]  # UTC minutes from midnight
+    altitude: list[float]  # degrees above the horizon
+    azimuth: list[float]  # degrees clockwise from true north
+
+
+def qibla_bearing(lat: float, lon: float) -> float:
+    """Initial bearing from (lat, lon) to the Kaaba, in [0, 360)."""
+    phi = math.radians(lat)
+    dlon = math.radians(KAABA_LON - lon)
+    y = math.sin(dlon) * math.cos(_KAABA_LAT_RAD)
+    x = math.cos(phi) * math.sin(_KAABA_LAT_RAD) - math.sin(phi) * math.cos(_KAABA_LAT_RAD) * math.cos(dlon)
+    return math.degrees(math.atan2(y, x)) % 360.0
+
+
+def kaaba_distance_km(lat: float, lon: float) -> float:
+    """Great-circle (haversine) distance from (lat, lon) to the Kaaba."""
+    phi = math.radians(lat)
+    h = (
+        math.sin((_KAABA_LAT_RAD - phi) / 2) ** 2
+        + math.cos(phi) * math.cos(_KAABA_LAT_RAD) * math.sin(math.radians(KAABA_LON - lon) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def qibla_many(lats: Sequence[float], lons: Sequence[float]) -> tuple[list[float], list[float]]:
+    """(bearings, distances_km) for every (lats[i], lons[i])."""
+    if len(lats) != len(lons):
+        raise ValueError("lats and lons must have the same length")
+    if np is None:
+        return [qibla_bearing(la, lo) for la, lo in zip(lats, lons)], [
+            kaaba_distance_km(la, lo) for la, lo in zip(lats, lons)
+        ]
+    phi = np.radians(np.asarray(lats, dtype=float))
+    dlon = np.radians(KAABA_LON - np.asarray(lons, dtype=float))
+    y = np.sin(dlon) * math.cos(_KAABA_LAT_RAD)
+    x = np.cos(phi) * math.sin(_KAABA_LAT_RAD) - np.sin(phi) * math.cos(_KAABA_LAT_RAD) * np.cos(dlon)
+    bearings = np.degrees(np.arctan2(y, x)) % 360.0
+    h = np.sin((_KAABA_LAT_RAD - phi) / 2) ** 2 + np.cos(phi) * math.cos(_KAABA_LAT_RAD) * np.sin(dlon / 2) ** 2
+    distances = 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(1.0, np.sqrt(h)))
+    return bearings.tolist(), distances.tolist()
+
+
+def sun_altitude_azimuth(jd: float, lat: float, lon: float) -> tuple[float, float]:
+    """(altitude_deg, azimuth_deg) of the Sun at Julian Day ``jd`` seen from (lat, lon)."""
+    dec, eqt = PrayerTimes.sun_position(jd)
+    # Hour angle from true solar time: the UTC minutes of the day plus the
+    # equation of time and 4 minutes per degree of longitude.
+    minutes = ((jd - 0.5) % 1.0) * 1440.0
+    h = math.radians((minutes + eqt + 4.0 * lon) / 4.0 - 180.0)
+    phi = math.radians(lat)
+    sin_alt = math.sin(phi) * math.sin(dec) + math.cos(phi) * math.cos(dec) * math.cos(h)
+    altitude = math.degrees(math.asin(max(-1.0, min(1.0, sin_alt))))
+    azimuth = math.atan2(
+        -math.cos(dec) * math.sin(h), math.sin(dec) * math.cos(phi) - math.cos(dec) * math.cos(h) * math.sin(phi)
+    )
+    return altitude, math.degrees(azimuth) % 360.0
+
+
+def _sample_minutes(step_minutes: int) -> list[int]:
+    if not 1 <= step_minutes <= 1440:
+        raise ValueError("step_minutes must be within 1-1440")
+    return list(range(0, 1440, step_minutes))
+
+
+def sun_track(base_date: date, lat: float, lon: float, step_minutes: int = 10) -> SunTrack:
+    """Sun altitude/azimuth over the UTC day ``base_date``, every ``step_minutes``."""
+    return sun_tracks(base_date, [lat], [lon], step_minutes)[0]
+
+
+def sun_tracks(
+    base_date: date, lats: Sequence[float], lons: Sequence[float], step_minutes: int = 10
+) -> list[SunTrack]:
+    """``sun_track`` for many locations; the ephemeris is evaluated once per sample."""
+    if len(lats) != len(lons):
+        raise ValueError("lats and lons must have the same length")
+    minutes = _sample_minutes(step_minutes)
+    jd0 = PrayerTimes.julian_day(base_date.year, base_date.month, base_date.day)
+    if np is None:
+        tracks = []
+        for lat, lon in zip(lats, lons):
+            positions = [sun_altitude_azimuth(jd0 + m / 1440.0, lat, lon) for m in minutes]
+            tracks.append(SunTrack(minutes, [p[0] for p in positions], [p[1] for p in positions]))
+        return tracks
+    samples = np.asarray(minutes, dtype=float)
+    dec, eqt = batch.sun_position(jd0 + samples / 1440.0)  # (samples,)
+    phi = np.radians(np.asarray(lats, dtype=float))[:, None]  # (locations, 1)
+    lon = np.asarray(lons, dtype=float)[:, None]
+    h = np.radians((samples + eqt + 4.0 * lon) / 4.0 - 180.0)
+    sin_alt = np.sin(phi) * np.sin(dec) + np.cos(phi) * np.cos(dec) * np.cos(h)
+    altitude = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+    azimuth = np.degrees(
+        np.arctan2(-np.cos(dec) * np.sin(h), np.sin(dec) * np.cos(phi) - np.cos(dec) * np.cos(h) * np.sin(phi))
+    ) % 360.0
+    return [SunTrack(minutes, alt.tolist(), az.tolist()) for alt, az in zip(altitude, azimuth)]
@@ -0,0 +1,70 @@
+"""Chunked computation of long date ranges.
+
+A range (a year, a multi-year mosque calendar, the same span for many cities)
+is split into fixed-size chunks of consecutive days. Each chunk goes through
+``PrayerTimes.compute_batch`` — the vectorized engine when NumPy is installed,
+the scalar one otherwise — either in-process or on a ``ProcessPoolExecutor``.
+
+Results are streamed back in input order. With a pool, only a bounded window
+of chunks is in flight at a time, so a consumer that writes days out as they
+arrive keeps memory flat regardless of the range length.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, Optional
+
+DEFAULT_CHUNK_DAYS = 31
+# Chunks queued per worker: enough to keep the pool busy, small enough to bound memory.
+_PREFETCH_PER_WORKER = 2
+
+Chunk = tuple[list[date], float, float]
+DayTimes = dict[str, Optional[datetime]]
+
+
+def iter_chunks(start: date, end: date, chunk_days: int = DEFAULT_CHUNK_DAYS) -> Iterator[list[date]]:
+    """Yield lists of at most ``chunk_days`` consecutive dates covering [start, end]."""
+    if chunk_days < 1:
+        raise ValueError("chunk_days must be >= 1")
+    day = start
+    while day <= end:
+        size = min(chunk_days, (end - day).days + 1)
+        yield [day + timedelta(days=i) for i in range(size)]
+        day += timedelta(days=size)
+
+
+def _compute_chunk(pt, days: list[date], lat: float, lon: float) -> list[DayTimes]:
+    # Module-level so it can be pickled to worker processes.
+    return pt.compute_batch(days, lat, lon)
+
+
+def run_chunks(pt, chunks: Iterable[Chunk], workers: Optional[int] = None) -> Iterator[tuple[date, DayTimes]]:
+    """Compute ``(days, lat, lon)`` chunks and yield ``(date, times)`` in order.
+
+    ``workers`` <= 1 (the default) computes in-process; otherwise chunks run on
+    a process pool of that size.
+    """
+    if not workers or workers <= 1:
+        for days, lat, lon in chunks:
+            yield from zip(days, _compute_chunk(pt, days, lat, lon))
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pending: deque = deque()
+        for days, lat, lon in chunks:
+            pending.append((days, ex.submit(_compute_chunk, pt, days, lat, lon)))
+            if len(pending) >= workers * _PREFETCH_PER_WORKER:
+                done_days, future = pending.popleft()
+                yield from zip(done_days, future.result())
+        while pending:
+            done_days, future = pending.popleft()
+            yield from zip(done_days, future.result())
+
+
+def compute_range(pt, start: date, end: date, lat: float, lon: float,
+                  workers: Optional[int] = None,
+                  chunk_days: int = DEFAULT_CHUNK_DAYS) -> Iterator[tuple[date, DayTimes]]:
+    """Stream ``(date, times)`` for every day in [start, end] at one location."""
+    chunks = ((days, lat, lon) for days in iter_chunks(start, end, chunk_days))
+    return run_chunks(pt, chunks, workers)
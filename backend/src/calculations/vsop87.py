@@ -0,0 +1,265 @@
+"""High-precision apparent Sun from a truncated VSOP87 series.
+
+Used by ``HighPrecisionPrayerTimes`` in place of the low-precision formulas
+shared with the Swift AstroEngine. The chain follows Meeus, *Astronomical
+Algorithms* (2nd ed.), chapters 10, 22, 25 and 28:
+
+- heliocentric Earth L/B/R from the abridged VSOP87D terms (Meeus
+  appendix III), flipped to geocentric and converted to FK5;
+- low-accuracy nutation (the four largest terms, ~0.5") and the true
+  obliquity;
+- annual aberration, -20.4898" / R;
+- the TT - UT offset (Delta T) from the Espenak & Meeus polynomials, since
+  the series run on dynamical time while prayer times are civil (UT).
+
+The result is good to about a second of arc in declination and a tenth of a
+second of time in the equation of time, against roughly half a minute of
+time for the low-precision formulas.
+
+The series cost ~200 trigonometric terms, so they are evaluated only at 0h UT
+of each day (memoized) and instants in between are interpolated from the
+four surrounding days; the interpolation error is far below the series'
+own truncation error.
+"""
+
+import math
+from functools import lru_cache
+
+from .batch import np
+
+# (A, B, C) terms of A * cos(B + C * tau), tau in Julian millennia from J2000 (TT), units 1e-8 rad / AU.
+L0 = (
+    (175347046, 0, 0), (3341656, 4.6692568, 6283.07585), (34894, 4.6261, 12566.1517),
+    (3497, 2.7441, 5753.3849), (3418, 2.8289, 3.5231), (3136, 3.6277, 77713.7715),
+    (2676, 4.4181, 7860.4194), (2343, 6.1352, 3930.2097), (1324, 0.7425, 11506.7698),
+    (1273, 2.0371, 529.691), (1199, 1.1096, 1577.3435), (990, 5.233, 5884.927),
+    (902, 2.045, 26.298), (857, 3.508, 398.149), (780, 1.179, 5223.694),
+    (753, 2.533, 5507.553), (505, 4.583, 18849.228), (492, 4.205, 775.523),
+    (357, 2.92, 0.067), (317, 5.849, 11790.629), (284, 1.899, 796.298),
+    (271, 0.315, 10977.079), (243, 0.345, 5486.778), (206, 4.806, 2544.314),
+    (205, 1.869, 5573.143), (202, 2.458, 6069.777), (156, 0.833, 213.299),
+    (132, 3.411, 2942.463), (126, 1.083, 20.775), (115, 0.645, 0.98),
+    (103, 0.636, 4694.003), (102, 0.976, 15720.839), (102, 4.267, 7.114),
+    (99, 6.21, 2146.17), (98, 0.68, 155.42), (86, 5.98, 161000.69),
+    (85, 1.3, 6275.96), (85, 3.67, 71430.7), (80, 1.81, 17260.15),
+    (79, 3.04, 12036.46), (75, 1.76, 5088.63), (74, 3.5, 3154.69),
+    (74, 4.68, 801.82), (70, 0.83, 9437.76), (62, 3.98, 8827.39),
+    (61, 1.82, 7084.9), (57, 2.78, 6286.6), (56, 4.39, 14143.5),
+    (56, 3.47, 6279.55), (52, 0.19, 12139.55), (52, 1.33, 1748.02),
+    (51, 0.28, 5856.48), (49, 0.49, 1194.45), (41, 5.37, 8429.24),
+    (41, 2.4, 19651.05), (39, 6.17, 10447.39), (37, 6.04, 10213.29),
+    (37, 2.57, 1059.38), (36, 1.71, 2352.87), (36, 1.78, 6812.77),
+    (33, 0.59, 17789.85), (30, 0.44, 83996.85), (30, 2.74, 1349.87),
+    (25, 3.16, 4690.48),
+)
+L1 = (
+    (628331966747, 0, 0), (206059, 2.678235, 6283.07585), (4303, 2.6351, 12566.1517),
+    (425, 1.59, 3.523), (119, 5.796, 26.298), (109, 2.966, 1577.344),
+    (93, 2.59, 18849.23), (72, 1.14, 529.69), (68, 1.87, 398.15),
+    (67, 4.41, 5507.55), (59, 2.89, 5223.69), (56, 2.17, 155.42),
+    (45, 0.4, 796.3), (36, 0.47, 775.52), (29, 2.65, 7.11),
+    (21, 5.34, 0.98), (19, 1.85, 5486.78), (19, 4.97, 213.3),
+    (17, 2.99, 6275.96), (16, 0.03, 2544.31), (16, 1.43, 2146.17),
+    (15, 1.21, 10977.08), (12, 2.83, 1748.02), (12, 3.26, 5088.63),
+    (12, 5.27, 1194.45), (12, 2.08, 4694.0), (11, 0.77, 553.57),
+    (10, 1.3, 6286.6), (10, 4.24, 1349.87), (9, 2.7, 242.73),
+    (9, 5.64, 951.72), (8, 5.3, 2352.87), (6, 2.65, 9437.76),
+    (6, 4.67, 4690.48),
+)
+L2 = (
+    (52919, 0, 0), (8720, 1.0721, 6283.0758), (309, 0.867, 12566.152),
+    (27, 0.05, 3.52), (16, 5.19, 26.3), (16, 3.68, 155.42),
+    (10, 0.76, 18849.23), (9, 2.06, 77713.77), (7, 0.83, 775.52),
+    (5, 4.66, 1577.34), (4, 1.03, 7.11), (4, 3.44, 5573.14),
+    (3, 5.14, 796.3), (3, 6.05, 5507.55), (3, 1.19, 242.73),
+    (3, 6.12, 529.69), (3, 0.31, 398.15), (3, 2.28, 553.57),
+    (2, 4.38, 5223.69), (2, 3.75, 0.98),
+)
+L3 = (
+    (289, 5.844, 6283.076), (35, 0, 0), (17, 5.49, 12566.15),
+    (3, 5.2, 155.42), (1, 4.72, 3.52), (1, 5.3, 18849.23),
+    (1, 5.97, 242.73),
+)
+L4 = ((114, 3.142, 0), (8, 4.13, 6283.08), (1, 3.84, 12566.15))
+L5 = ((1, 3.14, 0),)
+B0 = (
+    (280, 3.199, 84334.662), (102, 5.422, 5507.553), (80, 3.88, 5223.69),
+    (44, 3.7, 2352.87), (32, 4.0, 1577.34),
+)
+B1 = ((9, 3.9, 5507.55), (6, 1.73, 5223.69))
+R0 = (
+    (100013989, 0, 0), (1670700, 3.0984635, 6283.07585), (13956, 3.05525, 12566.1517),
+    (3084, 5.1985, 77713.7715), (1628, 1.1739, 5753.3849), (1576, 2.8469, 7860.4194),
+    (925, 5.453, 11506.77), (542, 4.564, 3930.21), (472, 3.661, 5884.927),
+    (346, 0.964, 5507.553), (329, 5.9, 5223.694), (307, 0.299, 5573.143),
+    (243, 4.273, 11790.629), (212, 5.847, 1577.344), (186, 5.022, 10977.079),
+    (175, 3.012, 18849.228), (110, 5.055, 5486.778), (98, 0.89, 6069.78),
+    (86, 5.69, 15720.84), (86, 1.27, 161000.69), (65, 0.27, 17260.15),
+    (63, 0.92, 529.69), (57, 2.01, 83996.85), (56, 5.24, 71430.7),
+    (49, 3.25, 2544.31), (47, 2.58, 775.52), (45, 5.54, 9437.76),
+    (43, 6.01, 6275.96), (39, 5.36, 4694.0), (38, 2.39, 8827.39),
+    (37, 0.83, 19651.05), (37, 4.9, 12139.55), (36, 1.67, 12036.46),
+    (35, 1.84, 2942.46), (33, 0.24, 7084.9), (32, 0.18, 5088.63),
+    (32, 1.78, 398.15), (28, 1.21, 6286.6), (28, 1.9, 6279.55),
+    (26, 4.59, 10447.39),
+)
+R1 = (
+    (103019, 1.10749, 6283.07585), (1721, 1.0644, 12566.1517), (702, 3.142, 0),
+    (32, 1.02, 18849.23), (31, 2.84, 5507.55), (25, 1.32, 5223.69),
+    (18, 1.42, 1577.34), (10, 5.91, 10977.08), (9, 1.42, 6275.96),
+    (9, 0.27, 5486.78),
+)
+R2 = (
+    (4359, 5.7846, 6283.0758), (124, 5.579, 12566.152), (12, 3.14, 0),
+    (9, 3.63, 77713.77), (6, 1.87, 5573.14), (3, 5.47, 18849.23),
+)
+R3 = ((145, 4.273, 6283.076), (7, 3.92, 12566.15))
+R4 = ((4, 2.56, 6283.08),)
+
+ARCSEC = math.pi / (180.0 * 3600.0)
+# Days memoized by the per-day series cache (~10 years).
+NODE_CACHE_SIZE = 4096
+
+
+def _series(groups, tau: float) -> float:
+    total, power = 0.0, 1.0
+    for terms in groups:
+        total += power * sum(a * math.cos(b + c * tau) for a, b, c in terms)
+        power *= tau
+    return total * 1e-8
+
+
+def delta_t(jd: float) -> float:
+    """TT - UT in seconds (Espenak & Meeus polynomials, 1900-2150; parabola outside)."""
+    y = 2000.0 + (jd - 2451545.0) / 365.25
+    if 2005 <= y < 2050:
+        t = y - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t * t
+    if 1986 <= y < 2005:
+        t = y - 2000
+        return 63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3 + 0.000651814 * t**4 + 0.00002373599 * t**5
+    if 1961 <= y < 1986:
+        t = y - 1975
+        return 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718
+    if 1941 <= y < 1961:
+        t = y - 1950
+        return 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+    if 1920 <= y < 1941:
+        t = y - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3
+    if 1900 <= y < 1920:
+        t = y - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4
+    u = (y - 1820) / 100
+    if 2050 <= y < 2150:
+        return -20 + 32 * u * u - 0.5628 * (2150 - y)
+    return -20 + 32 * u * u
+
+
+def nutation(T: float) -> tuple[float, float]:
+    """(delta_psi, delta_epsilon) in radians, low-accuracy terms; T in Julian centuries TT."""
+    omega = math.radians(125.04452 - 1934.136261 * T)
+    l_sun = math.radians(280.4665 + 36000.7698 * T)
+    l_moon = math.radians(218.3165 + 481267.8813 * T)
+    dpsi = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * l_sun)
+            - 0.23 * math.sin(2 * l_moon) + 0.21 * math.sin(2 * omega))
+    deps = (9.20 * math.cos(omega) + 0.57 * math.cos(2 * l_sun)
+            + 0.10 * math.cos(2 * l_moon) - 0.09 * math.cos(2 * omega))
+    return dpsi * ARCSEC, deps * ARCSEC
+
+
+def mean_obliquity(T: float) -> float:
+    """Mean obliquity of the ecliptic in radians (IAU 1980)."""
+    seconds = 21.448 - 46.8150 * T - 0.00059 * T * T + 0.001813 * T**3
+    return math.radians(23.0 + 26.0 / 60.0 + seconds / 3600.0)
+
+
+def apparent_sun(jde: float) -> tuple[float, float, float, float]:
+    """(lambda, beta, alpha, delta) in radians: apparent geocentric Sun at ``jde`` (TT)."""
+    tau = (jde - 2451545.0) / 365250.0
+    T = 10.0 * tau
+    L = _series((L0, L1, L2, L3, L4, L5), tau)
+    B = _series((B0, B1), tau)
+    R = _series((R0, R1, R2, R3, R4), tau)
+
+    theta = L + math.pi
+    beta = -B
+    # FK5 frame correction.
+    lam_p = theta - math.radians(1.397 * T + 0.00031 * T * T)
+    theta -= 0.09033 * ARCSEC
+    beta += 0.03916 * ARCSEC * (math.cos(lam_p) - math.sin(lam_p))
+
+    dpsi, deps = nutation(T)
+    eps = mean_obliquity(T) + deps
+    lam = theta + dpsi - 20.4898 * ARCSEC / R
+
+    alpha = math.atan2(math.sin(lam) * math.cos(eps) - math.tan(beta) * math.sin(eps), math.cos(lam))
+    delta = math.asin(math.sin(beta) * math.cos(eps) + math.cos(beta) * math.sin(eps) * math.sin(lam))
+    return lam % (2 * math.pi), beta, alpha % (2 * math.pi), delta
+
+
+def sun_position_exact(jd: float) -> tuple[float, float]:
+    """(declination_rad, eqt_minutes) at ``jd`` (UT), evaluating the full series."""
+    jde = jd + delta_t(jd) / 86400.0
+    tau = (jde - 2451545.0) / 365250.0
+    T = 10.0 * tau
+    _, _, alpha, delta = apparent_sun(jde)
+    dpsi, deps = nutation(T)
+    eps = mean_obliquity(T) + deps
+    # Sun's mean longitude (Meeus 28.2), then E = L0 - 0.0057183 - alpha + dpsi cos(eps).
+    l0 = (280.4664567 + 360007.6982779 * tau + 0.03032028 * tau**2
+          + tau**3 / 49931 - tau**4 / 15300 - tau**5 / 2000000)
+    e = l0 - 0.0057183 - math.degrees(alpha) + math.degrees(dpsi) * math.cos(eps)
+    e = (e + 180.0) % 360.0 - 180.0
+    return delta, e * 4.0
+
+
+_node = lru_cache(maxsize=NODE_CACHE_SIZE)(sun_position_exact)
+
+
+def sun_position(jd: float) -> tuple[float, float]:
+    """(declination_rad, eqt_minutes) at ``jd`` (UT), interpolated from memoized 0h UT nodes."""
+    x = jd - 0.5
+    i = math.floor(x)
+    f = x - i
+    n = i + 0.5
+    if f == 0.0:
+        return _node(n)
+    d0, e0 = _node(n - 1.0)
+    d1, e1 = _node(n)
+    d2, e2 = _node(n + 1.0)
+    d3, e3 = _node(n + 2.0)
+    # 4-point Lagrange weights at offset f in (0, 1) from node n.
+    fm1, fm2, fp1 = f - 1.0, f - 2.0, f + 1.0
+    a, b = f * fm1, fp1 * fm2
+    w0, w1, w2, w3 = -a * fm2 / 6.0, b * fm1 / 2.0, -b * f / 2.0, fp1 * a / 6.0
+    return w0 * d0 + w1 * d1 + w2 * d2 + w3 * d3, w0 * e0 + w1 * e1 + w2 * e2 + w3 * e3
+
+
+def sun_position_array(jd):
+    """Vectorized ``sun_position`` over a NumPy array of UT Julian days.
+
+    The series runs once per distinct day (through the same node cache as the
+    scalar path) and the interpolation is done on whole arrays. NaN inputs
+    (events that do not occur) give NaN outputs.
+    """
+    x = np.asarray(jd, dtype=float) - 0.5
+    nan = np.isnan(x)
+    if nan.all():
+        return x.copy(), x.copy()
+    i = np.floor(np.where(nan, np.nanmin(x), x))
+    f = x - i
+    first = int(i.min()) - 1
+    nodes = np.array([_node(k + 0.5) for k in range(first, int(i.max()) + 3)])
+    k = (i - first).astype(int)
+    fm1, fm2, fp1 = f - 1.0, f - 2.0, f + 1.0
+    a, b = f * fm1, fp1 * fm2
+    w = (-a * fm2 / 6.0, b * fm1 / 2.0, -b * f / 2.0, fp1 * a / 6.0)
+    dec = sum(wj * nodes[k + j - 1, 0] for j, wj in enumerate(w))
+    eqt = sum(wj * nodes[k + j - 1, 1] for j, wj in enumerate(w))
+    return dec, eqt
+
+
+def node_cache_info() -> dict:
+    info = _node.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
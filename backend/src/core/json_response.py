@@ -0,0 +1,87 @@
+"""Fast JSON responses for bulk payloads.
+
+Engine output is plain dicts/lists of str, int, float and None, so it is
+serialized directly instead of going through ``response_model`` validation
+and ``jsonable_encoder``: with orjson when it is installed, otherwise with
+pydantic-core's serializer (always available with FastAPI). Both produce
+the same compact UTF-8 JSON as ``json.dumps(..., separators=(",", ":"),
+ensure_ascii=False)``.
+
+Bodies above MIN_COMPRESS_BYTES are compressed for clients that accept it:
+brotli when the ``brotli`` package is installed, gzip otherwise.
+"""
+
+import gzip
+from typing import Any, Optional
+
+import pydantic_core
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speed-up
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional, gzip is always there
+    brotli = None
+
+MIN_COMPRESS_BYTES = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5  # close to gzip -6 in speed, ~15% smaller on timetables
+
+
+def dumps(payload: Any) -> bytes:
+    """Serialize trusted engine output to compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return pydantic_core.to_json(payload)
+
+
+def _accepted(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                if float(q[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: Optional[str], size: int) -> Optional[str]:
+    """Content coding to use for a body of ``size`` bytes, or None for identity."""
+    if not accept_encoding or size < MIN_COMPRESS_BYTES:
+        return None
+    accepted = _accepted(accept_encoding)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content coding '{encoding}'")
+
+
+def json_response(request: Request, payload: Any, headers: Optional[dict] = None) -> Response:
+    """Serialize and (when accepted) compress ``payload`` for a one-off response."""
+    body = dumps(payload)
+    encoding = negotiate_encoding(request.headers.get("accept-encoding"), len(body))
+    headers = dict(headers or {})
+    headers["Vary"] = "Accept-Encoding"
+    if encoding is not None:
+        body = compress(body, encoding)
+        headers["Content-Encoding"] = encoding
+    return Response(body, media_type="application/json", headers=headers)
@@ -1,6 +1,6 @@
 
-from src.adapters.sqlite import SQLiteCityRepository, SQLiteDeviceRepository, SQLiteSettingsRepository, SQLiteAudioRepository
-from src.adapters.postgres import PostgresCityRepository, PostgresDeviceRepository, PostgresSettingsRepository, PostgresAudioRepository
+from src.adapters.sqlite import SQLiteCityRepository, SQLiteDeviceRepository, SQLiteSettingsRepository, SQLiteAudioRepository, SQLiteTimetableRepository
+from src.adapters.postgres import PostgresCityRepository, PostgresDeviceRepository, PostgresSettingsRepository, PostgresAudioRepository, PostgresTimetableRepository
 
 from src.services.env_service import EnvService
 
@@ -29,6 +29,7 @@ class RepositoryContainer:
             self.device_repo = PostgresDeviceRepository(dsn)
             self.setting_repo = PostgresSettingsRepository(dsn)
             self.audio_repo = PostgresAudioRepository(dsn)
+            self.timetable_repo = PostgresTimetableRepository(dsn)
             
         else:
             db_path = EnvService.get("DB_PATH", "src/data/cities.db") 
@@ -37,6 +38,7 @@ class RepositoryContainer:
             self.device_repo = SQLiteDeviceRepository(db_path=dbs)
             self.setting_repo = SQLiteSettingsRepository(db_path=dbs)
             self.audio_repo = SQLiteAudioRepository(db_path=dbs)
+            self.timetable_repo = SQLiteTimetableRepository(db_path=dbs)
     
     def get_db_engine(self):
         return self.city_repo.engine  # Assuming all repos share the same engine
@@ -48,4 +50,5 @@ class RepositoryContainer:
             "device_repo": self.device_repo.get_health(),
             "setting_repo": self.setting_repo.get_health(),
             "audio_repo": self.audio_repo.get_health(),
+            "timetable_repo": self.timetable_repo.get_health(),
         }
\ No newline at end of file
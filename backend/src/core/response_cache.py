@@ -0,0 +1,249 @@
+"""Cache of serialized, deterministic API responses, with HTTP validators.
+
+Prayer-time payloads depend only on their (resolved) parameters and the
+engine version, so the serialized body is kept and served again as is. A
+bounded in-process LRU sits in front of an optional local-disk tier shared
+by every worker on the host (``RESPONSE_CACHE_DIR``). Each entry carries a
+strong ETag (hash of the body) and a Last-Modified date, so clients and
+proxies can revalidate with ``If-None-Match`` / ``If-Modified-Since`` and
+get a 304. Compressed representations are built once per entry, on first
+request, get their own ETag and count towards the memory budget.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Callable, NamedTuple, Optional
+
+from src.calculations.adhan_calc import ENGINE_VERSION
+from src.core.json_response import compress
+from src.schemas.log_config import LogConfig
+
+logger = LogConfig.get_logger()
+
+MEMORY_MAX_BYTES = 64 * 1024 * 1024
+DISK_MAX_ENTRIES = 20_000
+# Writes between two checks of the disk tier size.
+DISK_PRUNE_INTERVAL = 256
+# Disk tier file extension per media type (parameters such as charset are ignored).
+EXTENSIONS = {"application/json": "json", "text/calendar": "ics"}
+DEFAULT_MEDIA_TYPE = "application/json"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str  # strong validator of the identity body, quoted
+    last_modified: float  # POSIX timestamp
+    encoded: dict  # content coding -> compressed body, filled on first use
+    media_type: str = DEFAULT_MEDIA_TYPE
+
+    @property
+    def size(self) -> int:
+        """Bytes held by the entry: the body and every compressed variant built so far."""
+        return len(self.body) + sum(len(b) for b in self.encoded.values())
+
+    @property
+    def last_modified_http(self) -> str:
+        return formatdate(self.last_modified, usegmt=True)
+
+    def etag_for(self, encoding: Optional[str]) -> str:
+        """Strong ETag of one representation (each content coding gets its own)."""
+        return self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+
+    def body_for(self, encoding: Optional[str]) -> bytes:
+        if encoding is None:
+            return self.body
+        body = self.encoded.get(encoding)
+        if body is None:
+            body = self.encoded[encoding] = compress(self.body, encoding)
+        return body
+
+    def not_modified(self, if_none_match: Optional[str], if_modified_since: Optional[str],
+                     encoding: Optional[str] = None) -> bool:
+        """Whether a conditional request can be answered with 304 (RFC 9110, 13.2.2)."""
+        if if_none_match is not None:
+            tags = [t.strip() for t in if_none_match.split(",")]
+            etag = self.etag_for(encoding)
+            # If-None-Match uses the weak comparison: W/"x" matches "x".
+            return "*" in tags or any(t.removeprefix("W/") == etag for t in tags)
+        if if_modified_since is not None:
+            try:
+                return self.last_modified <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+def _entry(body: bytes, last_modified: float, media_type: str) -> CachedResponse:
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return CachedResponse(body, etag, last_modified, {}, media_type)
+
+
+class ResponseCache:
+    """Memory LRU (bounded in bytes) over an optional directory of bodies.
+
+    Keys are tuples of the resolved request parameters; the engine version is
+    part of every key, so bodies built by an older engine are never served.
+    """
+
+    def __init__(self, disk_dir: Optional[str] = None, max_bytes: int = MEMORY_MAX_BYTES,
+                 max_disk_entries: int = DISK_MAX_ENTRIES):
+        self.disk_dir = disk_dir or None
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self._writes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    @staticmethod
+    def key_for(*parts) -> str:
+        return hashlib.blake2b(repr((ENGINE_VERSION,) + parts).encode(), digest_size=20).hexdigest()
+
+    def get_or_build(self, key: str, build: Callable[[], bytes],
+                     media_type: str = DEFAULT_MEDIA_TYPE) -> CachedResponse:
+        """The cached response for ``key``, building (and storing) the body on a miss.
+
+        ``media_type`` is stored with the entry and names its disk file, so
+        it must be the same for every request of a key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+        entry = self._read_disk(key, media_type)
+        if entry is None:
+            entry = _entry(build(), _now(), media_type)
+            self._write_disk(key, entry)
+            with self._lock:
+                self.misses += 1
+        else:
+            with self._lock:
+                self.hits += 1
+        self._remember(key, entry)
+        return entry
+
+    def body_for(self, key: str, entry: CachedResponse, encoding: Optional[str]) -> bytes:
+        """``entry.body_for(encoding)``, charging a newly built variant to the memory budget."""
+        if encoding is None or encoding in entry.encoded:
+            return entry.body_for(encoding)
+        body = compress(entry.body, encoding)
+        with self._lock:
+            if encoding in entry.encoded:  # another request built it meanwhile
+                return entry.encoded[encoding]
+            entry.encoded[encoding] = body
+            if self._entries.get(key) is entry:
+                self._bytes += len(body)
+                self._evict()
+        return body
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        for path in self._disk_files():
+            _unlink(path)
+
+    def info(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "hits": self.hits, "misses": self.misses,
+                    "disk_dir": self.disk_dir}
+
+    def _remember(self, key: str, entry: CachedResponse) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._evict()
+
+    def _evict(self) -> None:
+        # Caller holds the lock.
+        while self._bytes > self.max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    # -----------------------------
+    # Disk tier
+    # -----------------------------
+    def _path(self, key: str, media_type: str) -> str:
+        extension = EXTENSIONS.get(media_type.split(";")[0].strip(), "bin")
+        return os.path.join(self.disk_dir, key[:2], f"{key}.{extension}")
+
+    def _read_disk(self, key: str, media_type: str) -> Optional[CachedResponse]:
+        if not self.disk_dir:
+            return None
+        path = self._path(key, media_type)
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+            return _entry(body, float(int(os.stat(path).st_mtime)), media_type)
+        except OSError:
+            return None
+
+    def _write_disk(self, key: str, entry: CachedResponse) -> None:
+        if not self.disk_dir:
+            return
+        path = self._path(key, entry.media_type)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(entry.body)
+            os.replace(tmp, path)  # atomic: readers in other workers never see a partial body
+        except OSError as e:
+            logger.warning(f"Response cache: could not write {path}: {e}")
+            _unlink(tmp)
+            return
+        with self._lock:
+            self._writes += 1
+            prune = self._writes % DISK_PRUNE_INTERVAL == 0
+        if prune:
+            self._prune_disk()
+
+    def _disk_files(self) -> list[str]:
+        if not self.disk_dir:
+            return []
+        files = []
+        for root, _, names in os.walk(self.disk_dir):
+            files += [os.path.join(root, n) for n in names if not n.endswith(".tmp")]
+        return files
+
+    def _prune_disk(self) -> None:
+        """Delete the least recently written bodies beyond ``max_disk_entries``."""
+        files = self._disk_files()
+        excess = len(files) - self.max_disk_entries
+        if excess <= 0:
+            return
+        for path in sorted(files, key=_mtime)[:excess]:
+            _unlink(path)
+
+
+def _now() -> float:
+    # Whole seconds: Last-Modified has no sub-second precision.
+    return float(int(time.time()))
+
+
+def _mtime(path: str) -> float:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return 0.0
+
+
+def _unlink(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
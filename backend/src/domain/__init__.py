@@ -1,4 +1,5 @@
 from .city_repository import CityRepository
 from .device_repository import DeviceRepository
 from .settings_repository import SettingsRepository
-from .audio_repository import AudioRepository
\ No newline at end of file
+from .audio_repository import AudioRepository
+from .timetable_repository import TimetableRepository
\ No newline at end of file
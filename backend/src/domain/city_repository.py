@@ -17,6 +17,14 @@ class CityRepository(ABC):
     def get_city(self, name: str) -> Optional[City]:
         ...
 
+    @abstractmethod
+    def get_city_by_id(self, city_id: int) -> Optional[City]:
+        ...
+
+    @abstractmethod
+    def get_cities_by_ids(self, city_ids: List[int]) -> List[City]:
+        ...
+
     @abstractmethod
     def add_city(self, city: City) -> None:
         ...
@@ -48,6 +48,8 @@ class Settings:
     enable_scheduler: bool = False
     selected_method: Optional[str] = None
     force_date: Optional[date] = None
+    # Fajr/Isha rule when the twilight angle is never reached; None = engine default.
+    high_latitude_rule: Optional[str] = None
     city_id: Optional[int] = None
     device_id: Optional[int] = None
     audio_id: Optional[int] = None
@@ -84,6 +86,7 @@ class Settings:
             "enable_scheduler": self.enable_scheduler,
             "selected_method": self.selected_method,
             "force_date": self.force_date.isoformat() if self.force_date else None,
+            "high_latitude_rule": self.high_latitude_rule,
             "city_id": self.city_id,
             "device_id": self.device_id,
             "audio_id": self.audio_id,
@@ -91,3 +94,30 @@ class Settings:
             "device": device_dict,
             "audio": audio_dict,
         }
+
+
+@dataclass(frozen=True)
+class TimetableKey:
+    """Identity of a persisted timetable: one location, configuration and year.
+
+    Coordinates are rounded to 4 decimals (~11 m) so requests for the same
+    city share an entry. The timezone is not part of the key: timetables hold
+    UTC minutes and are localized on read.
+    """
+
+    lat: float
+    lon: float
+    method: str
+    madhab: str
+    shafaq: str
+    precision: str
+    high_latitude_rule: str
+    year: int
+
+
+@dataclass
+class Timetable:
+    key: TimetableKey
+    engine_version: str
+    # ``PrayerTimes.compute_year_utc`` as native-endian float64 bytes.
+    minutes: bytes = b""
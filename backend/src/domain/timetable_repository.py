@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.models import Timetable, TimetableKey
+
+
+class TimetableRepository(ABC):
+
+    @abstractmethod
+    def get_timetable(self, key: TimetableKey) -> Optional[Timetable]:
+        ...
+
+    @abstractmethod
+    def save_timetable(self, timetable: Timetable) -> None:
+        """Insert, or replace the entry with the same key."""
+        ...
+
+    @abstractmethod
+    def delete_stale(self, engine_version: str) -> int:
+        """Delete entries built by another engine version; return how many."""
+        ...
@@ -13,6 +13,7 @@ from src.api.v1 import (
     devices_router,
     health_router,
     prayer_times_router,
+    qibla_router,
     settings_router,
     update_router,
 )
@@ -24,7 +25,7 @@ from src.utils.version import get_version
 
 # === Repositories & Services ===
 repos = RepositoryContainer()
-device_service = DeviceService(repos.device_repo, repos.setting_repo)
+device_service = DeviceService(repos.device_repo, repos.setting_repo, timetable_repository=repos.timetable_repo)
 dictConfig(LogConfig().model_dump())
 logger = LogConfig.get_logger()
 
@@ -42,6 +43,8 @@ async def lifespan(app: FastAPI):
     device_service.ensure_local_device()  # always-available 'this device' player
     response = device_service.schedule_prayers_for_all_devices()
     logger.info(f"Scheduled prayers for all devices: {response}")
+    # Fill the timetable cache off the request path.
+    device_service.scheduler.add_job(device_service.warm_timetables, id="warm_timetables", replace_existing=True)
     # Yield control to FastAPI to run the app
     yield
 
@@ -65,11 +68,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Validators and the live device time of the cached prayer-time payloads.
+    expose_headers=["ETag", "Last-Modified", "X-Device-Current-Time"],
 )
 
 # === API routes ===
 PREFIX = "/api/v1"
 app.include_router(prayer_times_router, prefix=PREFIX, tags=["Prayer Times"])
+app.include_router(qibla_router, prefix=PREFIX, tags=["Qibla"])
 app.include_router(devices_router, prefix=PREFIX, tags=["Sonos Devices"])
 app.include_router(cities_router, prefix=PREFIX, tags=["Cities"])
 app.include_router(settings_router, prefix=PREFIX, tags=["Settings"])
@@ -1,5 +1,10 @@
-from pydantic import BaseModel
-from typing import Optional, Dict
+from datetime import date
+from pydantic import BaseModel, Field
+from typing import Optional, Dict, List
+
+from src.calculations.calendar.locales import LANGUAGE_PATTERN
+from src.calculations.high_latitude import DEFAULT_RULE, RULE_PATTERN
+
 
 class PrayerTimesResponse(BaseModel):
     date: str
@@ -10,4 +15,41 @@ class PrayerTimesResponse(BaseModel):
     madhab: str
     times: Dict[str, Optional[str]]
     tz: Optional[str]
-    device_current_time: Optional[str]
+
+
+class GridSpec(BaseModel):
+    """Regular lat/lon grid, bounds inclusive, spacing in degrees."""
+    lat_min: float = Field(ge=-90, le=90)
+    lat_max: float = Field(ge=-90, le=90)
+    lon_min: float = Field(ge=-180, le=180)
+    lon_max: float = Field(ge=-180, le=180)
+    step: float = Field(gt=0)
+
+
+class PrayerGridRequest(BaseModel):
+    start: date
+    end: date
+    city_ids: Optional[List[int]] = None
+    grid: Optional[GridSpec] = None
+    method: Optional[str] = None
+    madhab: Optional[str] = None
+    tz: Optional[str] = None
+    precision: str = Field(default="standard", pattern="^(standard|high)$")
+    high_latitude_rule: str = Field(default=DEFAULT_RULE, pattern=RULE_PATTERN)
+
+
+class PrayerTimesQuery(BaseModel):
+    """Parameters of one ``/prayer-times`` call; unset fields take the same defaults."""
+    lat: float = Field(ge=-90, le=90)
+    lon: float = Field(ge=-180, le=180)
+    day: Optional[date] = None
+    method: Optional[str] = None
+    madhab: Optional[str] = None
+    tz: Optional[str] = None
+    precision: str = Field(default="standard", pattern="^(standard|high)$")
+    high_latitude_rule: str = Field(default=DEFAULT_RULE, pattern=RULE_PATTERN)
+    language: Optional[str] = Field(default=None, pattern=LANGUAGE_PATTERN)
+
+
+class PrayerBatchRequest(BaseModel):
+    queries: List[PrayerTimesQuery]
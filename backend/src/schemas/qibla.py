@@ -0,0 +1,30 @@
+from datetime import date
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class Coordinate(BaseModel):
+    lat: float = Field(ge=-90, le=90)
+    lon: float = Field(ge=-180, le=180)
+
+
+class QiblaRequest(BaseModel):
+    """Known cities (cached per id) and/or ad-hoc coordinates."""
+    city_ids: Optional[List[int]] = None
+    locations: Optional[List[Coordinate]] = None
+
+
+class QiblaResult(BaseModel):
+    id: Optional[int] = None
+    name: str = ""
+    lat: float
+    lon: float
+    country: str = ""
+    bearing: float
+    distance_km: float
+
+
+class SunTrackRequest(QiblaRequest):
+    day: date
+    step_minutes: int = Field(default=10, ge=1, le=1440)
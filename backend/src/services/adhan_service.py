@@ -1,11 +1,17 @@
 from calendar import monthrange
-from datetime import date, datetime
-from typing import Dict, List, Optional
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional
 
-from src.calculations.adhan_calc import PrayerTimes
-from src.calculations.calendar import Gregorian
+from src.calculations.adhan_calc import COORD_DECIMALS, HMS_FORMAT, ORDERED_KEYS, PRAYER_METHODS, PrayerRange, PrayerTimes
+from src.calculations.calendar import Gregorian, hijri_labels, hijri_range
+from src.calculations.high_latitude import DEFAULT_RULE, get_available_rules
+from src.domain.models import City
+from src.services.timetable_service import TimetableService
 from src.utils.date_utils import get_tz
 
+# Language of the Hijri labels in prayer-time payloads.
+DEFAULT_LANGUAGE = "ar"
+
 
 def get_prayer_datetimes(
     base_date: date,
@@ -14,36 +20,209 @@ def get_prayer_datetimes(
     method: str,
     madhab: str,
     tz: Optional[str],
-) -> Dict[str, Optional[datetime]]:
-    """Return prayer times as timezone-aware datetimes (for scheduling)."""
-    pt = PrayerTimes(method=method, madhab=madhab, tz=tz or get_tz())
-    return pt.compute_datetimes(base_date, lat, lon)
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+) -> Mapping[str, Optional[datetime]]:
+    """Return prayer times as timezone-aware datetimes (for scheduling).
 
+    With ``timetables``, the day is read from the persisted timetable cache
+    (as a ``PrayerDay``, which reads like the dict).
+    """
+    pt = PrayerTimes.for_config(
+        method=method, madhab=madhab, tz=tz or get_tz(),
+        precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    if timetables is not None:
+        return timetables.get_day(pt, base_date, lat, lon)
+    return pt.compute_cached(base_date, lat, lon)
 
-def get_prayer_times(
+
+def _hijri_label(base_date: date, language: str = DEFAULT_LANGUAGE) -> str:
+    """Localized Hijri label, or "" outside the supported Umm al-Qura range."""
+    try:
+        return Gregorian.fromdate(base_date).to_hijri().label(language)
+    except OverflowError:
+        return ""
+
+
+def get_hijri_labels(start: date, end: date, language: str = DEFAULT_LANGUAGE) -> List[str]:
+    """``_hijri_label`` of every day in [start, end], converted in one batch."""
+    try:
+        return hijri_labels(start, end, language)
+    except OverflowError:
+        return [_hijri_label(start + timedelta(days=i), language) for i in range((end - start).days + 1)]
+
+
+def get_hijri_range(start: date, end: date) -> Dict:
+    """Hijri dates of every day in [start, end], as parallel columns aligned with ``dates``.
+
+    Raises:
+        OverflowError: When a date is out of the supported Umm al-Qura range.
+    """
+    years, months, days = hijri_range(start, end)
+    return {
+        "dates": [(start + timedelta(days=i)).isoformat() for i in range(len(years))],
+        "year": years.tolist(),
+        "month": months.tolist(),
+        "day": days.tolist(),
+    }
+
+
+def _day_response(
     base_date: date,
+    hijri_date: str,
+    times: Mapping[str, Optional[datetime]],
     lat: float,
     lon: float,
     method: str,
     madhab: str,
-    tz: Optional[str]
+    tz: Optional[str],
 ) -> Dict:
-    pt = PrayerTimes(method=method, madhab=madhab, tz=tz or get_tz())
-    times = pt.compute(base_date, lat, lon)
-    hijri_date = Gregorian.fromdate(base_date).to_hijri()
     return {
         "date": base_date.isoformat(),
-        "hijri_date": f"""{hijri_date.day_name(language="ar") } {hijri_date.day} {hijri_date.month_name(language="ar")} {hijri_date.year}""",
+        "hijri_date": hijri_date,
         "latitude": lat,
         "longitude": lon,
         "method": method,
         "madhab": madhab,
-        "times": {k: (v if v else None) for k, v in times.items()},
+        "times": PrayerTimes.format_times(times),
         "tz": tz,
-        "device_current_time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
     }
 
 
+def device_current_time() -> str:
+    """The server's local wall time, sent alongside (not inside) cacheable payloads."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+def get_prayer_times(
+    base_date: date,
+    lat: float,
+    lon: float,
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+    language: str = DEFAULT_LANGUAGE,
+) -> Dict:
+    times = get_prayer_datetimes(base_date, lat, lon, method, madhab, tz, precision, high_latitude_rule, timetables)
+    return _day_response(base_date, _hijri_label(base_date, language), times, lat, lon, method, madhab, tz)
+
+
+class DayQuery(NamedTuple):
+    """One fully resolved ``get_prayer_times`` call (hashable, for de-duplication)."""
+
+    base_date: date
+    lat: float
+    lon: float
+    method: str
+    madhab: str
+    tz: Optional[str]
+    precision: str = "standard"
+    high_latitude_rule: str = DEFAULT_RULE
+    language: str = DEFAULT_LANGUAGE
+
+
+def get_prayer_times_batch(queries: List[DayQuery]) -> List[Dict]:
+    """``get_prayer_times`` for many queries, in request order.
+
+    Identical queries are computed once. The rest are grouped by date and
+    configuration, and each group's locations go through one
+    ``compute_batch`` call: one vectorized pass of the engine with NumPy, the
+    scalar path without it. Coordinates are rounded to COORD_DECIMALS like
+    the cached single-query path, and each Hijri label is converted once.
+    """
+    groups: Dict[tuple, List[DayQuery]] = {}
+    for q in dict.fromkeys(queries):
+        groups.setdefault((q.base_date, q.method, q.madhab, q.tz, q.precision, q.high_latitude_rule), []).append(q)
+    labels: Dict[tuple, str] = {}
+    results: Dict[DayQuery, Dict] = {}
+    for (base_date, method, madhab, tz, precision, high_latitude_rule), group in groups.items():
+        pt = PrayerTimes.for_config(
+            method=method, madhab=madhab, tz=tz or get_tz(),
+            precision=precision, high_latitude_rule=high_latitude_rule,
+        )
+        coords = list(dict.fromkeys((round(q.lat, COORD_DECIMALS), round(q.lon, COORD_DECIMALS)) for q in group))
+        lats, lons = zip(*coords)
+        times = dict(zip(coords, pt.compute_batch([base_date] * len(coords), lats, lons)))
+        for q in group:
+            label = labels.get((base_date, q.language))
+            if label is None:
+                label = labels[base_date, q.language] = _hijri_label(base_date, q.language)
+            coord = (round(q.lat, COORD_DECIMALS), round(q.lon, COORD_DECIMALS))
+            results[q] = _day_response(base_date, label, times[coord], q.lat, q.lon, method, madhab, tz)
+    return [results[q] for q in queries]
+
+
+def iter_prayer_times(
+    start: date,
+    end: date,
+    lat: float,
+    lon: float,
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+    language: str = DEFAULT_LANGUAGE,
+) -> Iterator[Dict]:
+    """Yield one ``get_prayer_times``-shaped dict per day in [start, end], lazily.
+
+    Nothing is materialized up front, so callers can stream multi-year
+    timetables in constant memory. ``timetables`` reads the days from the
+    persisted timetable cache instead of computing them.
+    """
+    pt = PrayerTimes.for_config(
+        method=method, madhab=madhab, tz=tz or get_tz(),
+        precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    if timetables is not None:
+        days = timetables.iter_range(pt, start, end, lat, lon)
+    else:
+        days = pt.iter_range(start, end, lat, lon)
+    for base_date, times in days:
+        yield _day_response(base_date, _hijri_label(base_date, language), times, lat, lon, method, madhab, tz)
+
+
+def get_prayer_days(
+    start: date,
+    end: date,
+    lat: float,
+    lon: float,
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+) -> PrayerRange:
+    """Every day in [start, end] as a compact ``PrayerRange`` (UTC minutes, localized on read)."""
+    pt = PrayerTimes.for_config(
+        method=method, madhab=madhab, tz=tz or get_tz(),
+        precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    if timetables is not None:
+        return timetables.get_days(pt, start, end, lat, lon)
+    return pt.compute_days(start, end, lat, lon)
+
+
+def _range_response(
+    days: PrayerRange,
+    lat: float,
+    lon: float,
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    language: str = DEFAULT_LANGUAGE,
+) -> List[Dict]:
+    labels = get_hijri_labels(days.start, days.start + timedelta(days=len(days) - 1), language)
+    return [_day_response(day.date, label, day, lat, lon, method, madhab, tz) for day, label in zip(days, labels)]
+
+
 def get_month_prayer_times(
     year: int,
     month: int,
@@ -51,14 +230,16 @@ def get_month_prayer_times(
     lon: float,
     method: str,
     madhab: str,
-    tz: Optional[str]
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+    language: str = DEFAULT_LANGUAGE,
 ) -> List[Dict]:
-    num_days = monthrange(year, month)[1]
-    results = []
-    for day in range(1, num_days + 1):
-        base_date = date(year, month, day)
-        results.append(get_prayer_times(base_date, lat, lon, method, madhab, tz))
-    return results
+    start = date(year, month, 1)
+    end = date(year, month, monthrange(year, month)[1])
+    days = get_prayer_days(start, end, lat, lon, method, madhab, tz, precision, high_latitude_rule, timetables)
+    return _range_response(days, lat, lon, method, madhab, tz, language)
 
 
 def get_year_prayer_times(
@@ -67,12 +248,101 @@ def get_year_prayer_times(
     lon: float,
     method: str,
     madhab: str,
-    tz: Optional[str]
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+    language: str = DEFAULT_LANGUAGE,
 ) -> List[Dict]:
-    results = []
-    for month in range(1, 13):
-        results.extend(get_month_prayer_times(year, month, lat, lon, method, madhab, tz))
-    return results
+    start, end = date(year, 1, 1), date(year, 12, 31)
+    days = get_prayer_days(start, end, lat, lon, method, madhab, tz, precision, high_latitude_rule, timetables)
+    return _range_response(days, lat, lon, method, madhab, tz, language)
+
+
+def grid_axis_size(low: float, high: float, step: float) -> int:
+    """Number of grid nodes from ``low`` to ``high`` (inclusive), tolerant of float steps like 0.1."""
+    return int((high - low) / step + 1e-9) + 1
+
+
+def grid_points(lat_min: float, lat_max: float, lon_min: float, lon_max: float, step: float) -> List[City]:
+    """Nodes of a regular lat/lon grid (bounds inclusive), row by row from the south-west."""
+    lats = [lat_min + i * step for i in range(grid_axis_size(lat_min, lat_max, step))]
+    lons = [lon_min + j * step for j in range(grid_axis_size(lon_min, lon_max, step))]
+    return [City(lat=round(la, 6), lon=round(lo, 6)) for la in lats for lo in lons]
+
+
+def get_prayer_grid(
+    start: date,
+    end: date,
+    locations: List[City],
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+) -> Dict:
+    """Prayer times for many locations over [start, end], as a columnar payload.
+
+    ``times[key][i][j]`` is the local "HH:MM:SS" of ``key`` at ``locations[i]``
+    on ``dates[j]`` (None when the event does not occur). Every cell is
+    computed in a single pass of the grid engine.
+    """
+    pt = PrayerTimes.for_config(
+        method=method, madhab=madhab, tz=tz or get_tz(),
+        precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    ranges = pt.compute_grid_days(start, end, [c.lat for c in locations], [c.lon for c in locations])
+    return {
+        "dates": [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)],
+        "locations": [c.get_dict() for c in locations],
+        "method": method,
+        "madhab": madhab,
+        "tz": tz,
+        "times": {key: [days.strings(key, HMS_FORMAT) for days in ranges] for key in ORDERED_KEYS},
+    }
+
+
+def get_method_comparison(
+    start: date,
+    end: date,
+    lat: float,
+    lon: float,
+    methods: Optional[List[str]],
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+) -> Dict:
+    """Method x prayer matrix for every day in [start, end].
+
+    ``matrix[method][prayer]`` is a list of formatted times aligned with
+    ``dates``. The method-independent events are solved once per day.
+    """
+    methods = list(dict.fromkeys(m.upper() for m in methods)) if methods else list(PRAYER_METHODS)
+    pt = PrayerTimes.for_config(
+        method=methods[0], madhab=madhab, tz=tz or get_tz(),
+        precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    dates = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+    matrix: Dict[str, Dict[str, List[Optional[str]]]] = {m: {} for m in methods}
+    for base_date in dates:
+        for method, times in pt.compare_methods(base_date, lat, lon, methods).items():
+            for key, value in PrayerTimes.format_times(times).items():
+                matrix[method].setdefault(key, []).append(value)
+    return {
+        "dates": [d.isoformat() for d in dates],
+        "latitude": lat,
+        "longitude": lon,
+        "madhab": madhab,
+        "tz": tz,
+        "methods": methods,
+        "matrix": matrix,
+    }
+
 
 def get_available_methods() -> List[dict]:
-    return PrayerTimes.get_available_methods()
\ No newline at end of file
+    return PrayerTimes.get_available_methods()
+
+
+def get_high_latitude_rules() -> List[dict]:
+    return get_available_rules()
@@ -0,0 +1,117 @@
+from calendar import monthrange
+from datetime import MAXYEAR, MINYEAR, date, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from src.calculations.calendar import Hijri, hijri_range
+from src.calculations.calendar.locales import get_locale
+from src.calculations.high_latitude import DEFAULT_RULE
+from src.services.adhan_service import DEFAULT_LANGUAGE, get_prayer_days
+from src.services.timetable_service import TimetableService
+
+CALENDAR_PATTERN = "^(hijri|gregorian)$"
+# (calendar, year, month, language, week start) layouts kept in memory (~20 KB each).
+LAYOUT_CACHE_SIZE = 512
+
+
+def _month_span(calendar: str, year: int, month: int) -> tuple[date, date]:
+    """First and last Gregorian dates of a Hijri or Gregorian month.
+
+    Raises:
+        OverflowError: When the month is out of the supported Umm al-Qura range.
+        ValueError: For an unknown calendar or month.
+    """
+    if calendar == "hijri":
+        first = Hijri(year, month, 1)
+        start = first.to_gregorian()
+        return start, start + timedelta(days=first.month_length() - 1)
+    if calendar == "gregorian":
+        if not MINYEAR <= year <= MAXYEAR:
+            raise OverflowError(f"Year {year} is out of range")
+        return date(year, month, 1), date(year, month, monthrange(year, month)[1])
+    raise ValueError(f"Unknown calendar '{calendar}'")
+
+
+@lru_cache(maxsize=LAYOUT_CACHE_SIZE)
+def month_layout(calendar: str, year: int, month: int, language: str = DEFAULT_LANGUAGE, week_start: int = 1) -> Dict:
+    """Grid of a Hijri or Gregorian month, with both calendars for every day.
+
+    ``offset`` is the number of blank cells before the first day in a week
+    starting on ``week_start`` (ISO weekday, Monday is 1). Each day carries
+    its Gregorian and Hijri dates, weekday, localized Hijri label and
+    ``*_month_start`` markers where either calendar begins a month. All days
+    are converted in one batch. Layouts are cached and shared: do not mutate.
+    """
+    if not 1 <= week_start <= 7:
+        raise ValueError("week_start must be an ISO weekday (1-7)")
+    locale = get_locale(language)
+    start, end = _month_span(calendar, year, month)
+    years, months, days = (column.tolist() for column in hijri_range(start, end))
+    cells = []
+    for i, (h_year, h_month, h_day) in enumerate(zip(years, months, days)):
+        day = start + timedelta(days=i)
+        weekday = day.isoweekday()
+        cells.append({
+            "gregorian": day.isoformat(),
+            "hijri": f"{h_year:04}-{h_month:02}-{h_day:02}",
+            "gregorian_day": day.day,
+            "hijri_day": h_day,
+            "weekday": weekday,
+            "label": locale.hijri_label(h_year, h_month, h_day, weekday),
+            "gregorian_month_start": day.day == 1,
+            "hijri_month_start": h_day == 1,
+        })
+    offset = (start.isoweekday() - week_start) % 7
+    return {
+        "calendar": calendar,
+        "year": year,
+        "month": month,
+        "month_name": locale.month_name(month) if calendar == "hijri" else locale.gregorian_month_name(month),
+        "language": language,
+        "week_start": week_start,
+        "offset": offset,
+        "weeks": -(-(offset + len(cells)) // 7),
+        "gregorian_months": _spanned_months(
+            [(start.year, start.month), (end.year, end.month)], locale.gregorian_month_name
+        ),
+        "hijri_months": _spanned_months([(years[0], months[0]), (years[-1], months[-1])], locale.month_name),
+        "days": cells,
+    }
+
+
+def _spanned_months(bounds: List[tuple[int, int]], name) -> List[Dict]:
+    """The one or two (year, month) a grid overlaps, with localized names."""
+    spanned = list(dict.fromkeys(bounds))
+    return [{"year": y, "month": m, "name": name(m)} for y, m in spanned]
+
+
+def get_month_calendar(
+    calendar: str,
+    year: int,
+    month: int,
+    language: str = DEFAULT_LANGUAGE,
+    week_start: int = 1,
+    lat: Optional[float] = None,
+    lon: Optional[float] = None,
+    method: str = "MWL",
+    madhab: str = "Shafi",
+    tz: Optional[str] = None,
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    timetables: Optional[TimetableService] = None,
+) -> Dict:
+    """``month_layout``, plus ``times`` aligned with ``days`` when a location is given."""
+    layout = month_layout(calendar, year, month, language, week_start)
+    if lat is None or lon is None:
+        return layout
+    start, end = _month_span(calendar, year, month)
+    days = get_prayer_days(start, end, lat, lon, method, madhab, tz, precision, high_latitude_rule, timetables)
+    return {
+        **layout,
+        "latitude": lat,
+        "longitude": lon,
+        "method": method,
+        "madhab": madhab,
+        "tz": tz,
+        "times": [day.strings() for day in days],
+    }
@@ -16,6 +16,13 @@ class CityService:
     def get_city(self, name: str) -> Optional[City]:
         return self.city_repo.get_city(name)
 
+    def get_city_by_id(self, city_id: int) -> Optional[City]:
+        return self.city_repo.get_city_by_id(city_id)
+
+    def get_cities_by_ids(self, city_ids: List[int]) -> List[City]:
+        """Look up many cities at once, in request order (unknown IDs are skipped)."""
+        return self.city_repo.get_cities_by_ids(city_ids)
+
     def nearest_city(self, lat: float, lon: float) -> Optional[City]:
         """Reverse-geocode a coordinate to the closest known city."""
         return self.city_repo.nearest_city(lat, lon)
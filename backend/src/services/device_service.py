@@ -8,8 +8,9 @@ from zoneinfo import ZoneInfo
 
 from apscheduler.schedulers.background import BackgroundScheduler
 
-from src.calculations.adhan_calc import SCHEDULABLE_KEYS
-from src.domain import DeviceRepository, SettingsRepository
+from src.calculations.adhan_calc import SCHEDULABLE_KEYS, PrayerTimes
+from src.calculations.high_latitude import DEFAULT_RULE
+from src.domain import DeviceRepository, SettingsRepository, TimetableRepository
 from src.domain.models import Audio, City, Device, Settings
 from src.schemas.device_info import DeviceInfo, NetAddress
 from src.schemas.log_config import LogConfig
@@ -19,6 +20,7 @@ from src.services.bluetooth_service import BluetoothService
 from src.services.freebox_service import FreeboxService
 from src.services.local_player_service import LocalPlayerService
 from src.services.soco_service import SoCoService
+from src.services.timetable_service import TimetableService
 from src.utils.date_utils import get_tz
 
 AUDIO_DIR = "src/data/audio"
@@ -38,17 +40,21 @@ logger = LogConfig.get_logger()
 DEFAULT_TZ = "Europe/Paris"
 class DeviceService:
     _instance = None
-    def __new__(cls,device_repository: DeviceRepository, settings_repository: SettingsRepository, debug: bool = False):
+    def __new__(cls,device_repository: DeviceRepository, settings_repository: SettingsRepository, debug: bool = False,
+                timetable_repository: Optional[TimetableRepository] = None):
         # True singleton: initialise once so a single BackgroundScheduler is
         # shared. Re-instantiating must not spawn a second scheduler.
         if cls._instance is None:
             cls._instance = super().__new__(cls)
-            cls._instance._init_props(device_repository, settings_repository, debug)
+            cls._instance._init_props(device_repository, settings_repository, debug, timetable_repository)
         return cls._instance
-    def _init_props(self, device_repository: DeviceRepository, settings_repository: SettingsRepository, debug: bool = False):
+    def _init_props(self, device_repository: DeviceRepository, settings_repository: SettingsRepository, debug: bool = False,
+                    timetable_repository: Optional[TimetableRepository] = None):
         """ Initialize class properties."""
         self.device_repository = device_repository
         self.settings_repository = settings_repository
+        # Persisted per-city timetables; None computes every refresh from scratch.
+        self.timetable_service = TimetableService(timetable_repository) if timetable_repository else None
         self.scheduler = BackgroundScheduler(timezone=DEFAULT_TZ)
         self.scheduler.start()
         self.debug = debug
@@ -257,6 +263,7 @@ class DeviceService:
             enable_scheduler=True,
             selected_method=(stored.selected_method if stored and stored.selected_method else DEFAULT_METHOD),
             volume=stored.volume if stored else 50,
+            high_latitude_rule=stored.high_latitude_rule if stored else None,
             city=City(name=LOCAL_DEVICE_NAME, lat=coord("lat", DEFAULT_LAT), lon=coord("lon", DEFAULT_LON)),
             audio=Audio(name=audio_name) if audio_name else None,
         )
@@ -439,6 +446,37 @@ class DeviceService:
             return None
 
     
+    #-------------------------------
+    # 🗓️ Timetable cache warmer
+    # ------------------------------
+    def warm_timetables(self) -> int:
+        """Fill the timetable cache for every configured device, this year and next.
+
+        Runs in the background at startup, so nightly refreshes (and the new
+        year's first one) read their day instead of computing it. Entries from
+        an older engine version are purged first.
+        """
+        if self.timetable_service is None:
+            return 0
+        self.timetable_service.purge_stale()
+        year = date.today().year
+        warmed = 0
+        for settings in self.settings_repository.list_settings():
+            if not (settings.city and settings.selected_method):
+                continue
+            city = settings.city
+            lat = city.get("lat") if isinstance(city, dict) else city.lat
+            lon = city.get("lon") if isinstance(city, dict) else city.lon
+            if lat is None or lon is None:
+                continue
+            pt = PrayerTimes.for_config(
+                method=settings.selected_method, madhab="Shafi", tz=get_tz(),
+                high_latitude_rule=settings.high_latitude_rule or DEFAULT_RULE,
+            )
+            warmed += self.timetable_service.warm(pt, (year, year + 1), [(lat, lon)])
+        logger.info(f"Warmed {warmed} timetable(s)")
+        return warmed
+
     #-------------------------------
     # 📅 Schedule Prayer Times for all devices
     # ------------------------------
@@ -507,6 +545,8 @@ class DeviceService:
             base_date=date.today(),
             tz=get_tz(),
             madhab="Shafi",
+            high_latitude_rule=settings.high_latitude_rule or DEFAULT_RULE,
+            timetables=self.timetable_service,
         )
         if not prayer_datetimes:
             return {"status": "error", "message": "Failed to get prayer times"}
@@ -0,0 +1,93 @@
+import csv
+import io
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from src.calculations.adhan_calc import HMS_FORMAT, ORDERED_KEYS, PrayerTimes
+from src.calculations.high_latitude import DEFAULT_RULE
+from src.core.json_response import dumps
+from src.domain.models import City
+from src.services.adhan_service import DEFAULT_LANGUAGE, get_hijri_labels
+from src.utils.date_utils import get_tz
+
+EXPORT_FORMAT_PATTERN = "^(ndjson|csv)$"
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+EXPORT_COLUMNS = ["city_id", "city", "country", "latitude", "longitude", "date", "hijri_date", *ORDERED_KEYS]
+# Days computed, serialized and sent at once per location (~5 KB of CSV):
+# bounds memory and the time to the first byte.
+EXPORT_CHUNK_DAYS = 31
+
+
+def iter_export_chunks(
+    start: date,
+    end: date,
+    locations: List[City],
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    language: str = DEFAULT_LANGUAGE,
+) -> Iterator[List[Dict]]:
+    """Yield flat rows (EXPORT_COLUMNS), one per location and day, a chunk at a time.
+
+    Locations come one after the other, each in chunks of at most
+    EXPORT_CHUNK_DAYS days, so memory stays flat whatever the range and the
+    first rows are ready after one chunk. Times are local "HH:MM:SS" (None
+    when the event does not occur).
+    """
+    pt = PrayerTimes.for_config(
+        method=method, madhab=madhab, tz=tz or get_tz(),
+        precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    for city in locations:
+        chunk_start = start
+        while chunk_start <= end:
+            chunk_end = min(end, chunk_start + timedelta(days=EXPORT_CHUNK_DAYS - 1))
+            days = pt.compute_days(chunk_start, chunk_end, city.lat, city.lon)
+            columns = [days.strings(key, HMS_FORMAT) for key in ORDERED_KEYS]
+            rows = []
+            for i, label in enumerate(get_hijri_labels(chunk_start, chunk_end, language)):
+                row = {
+                    "city_id": city.id,
+                    "city": city.name,
+                    "country": city.country,
+                    "latitude": city.lat,
+                    "longitude": city.lon,
+                    "date": (chunk_start + timedelta(days=i)).isoformat(),
+                    "hijri_date": label,
+                }
+                for key, column in zip(ORDERED_KEYS, columns):
+                    row[key] = column[i]
+                rows.append(row)
+            yield rows
+            chunk_start = chunk_end + timedelta(days=1)
+
+
+def ndjson_lines(chunks: Iterable[List[Dict]]) -> Iterator[bytes]:
+    """One JSON object per line, a chunk of lines at a time."""
+    for rows in chunks:
+        yield b"".join(dumps(row) + b"\n" for row in rows)
+
+
+def csv_lines(chunks: Iterable[List[Dict]]) -> Iterator[bytes]:
+    """RFC 4180 CSV with an EXPORT_COLUMNS header; missing times are empty cells."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerow(EXPORT_COLUMNS)
+    for rows in chunks:
+        writer.writerows([row[c] for c in EXPORT_COLUMNS] for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():  # no rows: the header alone
+        yield buffer.getvalue().encode("utf-8")
+
+
+def export_lines(fmt: str, chunks: Iterable[List[Dict]]) -> Iterator[bytes]:
+    """``iter_export_chunks`` output encoded as ``fmt`` (see MEDIA_TYPES)."""
+    if fmt == "ndjson":
+        return ndjson_lines(chunks)
+    if fmt == "csv":
+        return csv_lines(chunks)
+    raise ValueError(f"Unknown export format '{fmt}'")
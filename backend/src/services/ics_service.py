@@ -0,0 +1,130 @@
+import hashlib
+from calendar import monthrange
+from datetime import date, timezone
+from functools import lru_cache
+from typing import List, Optional
+
+from src.calculations.adhan_calc import SCHEDULABLE_KEYS, PrayerTimes
+from src.calculations.high_latitude import DEFAULT_RULE
+from src.utils.date_utils import get_tz
+
+PRODID = "-//aladhan_api//Prayer times//EN"
+# Months in a feed: the current one and the ones after it.
+ICS_WINDOW_MONTHS = 3
+MAX_ICS_WINDOW_MONTHS = 12
+# (location, config, month) VEVENT blocks kept in memory (~40 KB each).
+ICS_MONTH_CACHE_SIZE = 1024
+EVENT_DURATION = "PT15M"
+# How often calendar clients are asked to refresh the subscription.
+REFRESH_INTERVAL = "PT6H"
+
+
+def _escape(text: str) -> str:
+    """TEXT value escaping (RFC 5545, 3.3.11)."""
+    return text.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,").replace("\n", "\\n")
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets (RFC 5545, 3.1), without splitting UTF-8 sequences."""
+    if len(line.encode("utf-8")) <= 75:
+        return line + "\r\n"
+    parts, current, size = [], "", 0
+    for char in line:
+        width = len(char.encode("utf-8"))
+        if size + width > (75 if not parts else 74):
+            parts.append(current)
+            current, size = "", 0
+        current += char
+        size += width
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def window_months(today: date, months: int = ICS_WINDOW_MONTHS) -> List[tuple[int, int]]:
+    """(year, month) of the ``months`` months starting with the one of ``today``."""
+    index = today.year * 12 + today.month - 1
+    return [(i // 12, i % 12 + 1) for i in range(index, index + months)]
+
+
+@lru_cache(maxsize=ICS_MONTH_CACHE_SIZE)
+def month_events(
+    year: int,
+    month: int,
+    lat: float,
+    lon: float,
+    method: str,
+    madhab: str,
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    name: str = "",
+) -> str:
+    """Pre-rendered VEVENT blocks of SCHEDULABLE_KEYS for every day of a month.
+
+    Events are in UTC and the output only depends on the arguments (DTSTAMP
+    is the first of the month), so a rolling feed re-renders nothing but
+    the month entering its window, and every worker renders the same bytes.
+    The feed's timezone is not an argument: feeds for the same place share
+    their months whatever the subscriber's zone.
+    """
+    pt = PrayerTimes.for_config(
+        method=method, madhab=madhab, tz="UTC", precision=precision, high_latitude_rule=high_latitude_rule,
+    )
+    days = pt.compute_days(date(year, month, 1), date(year, month, monthrange(year, month)[1]), lat, lon)
+    columns = [days.datetimes(key) for key in SCHEDULABLE_KEYS]
+    config = repr((lat, lon, method, madhab, precision, high_latitude_rule)).encode()
+    uid = hashlib.blake2b(config, digest_size=8).hexdigest()
+    stamp = f"DTSTAMP:{year:04}{month:02}01T000000Z\r\n"
+    location = _fold(f"LOCATION:{_escape(name)}") if name else ""
+    geo = f"GEO:{lat};{lon}\r\n"
+    suffix = f" - {name}" if name else ""
+    blocks = []
+    for i, day in enumerate(days.dates()):
+        for key, column in zip(SCHEDULABLE_KEYS, columns):
+            when = column[i]
+            if when is None:
+                continue
+            blocks.append(
+                "BEGIN:VEVENT\r\n"
+                f"UID:{day:%Y%m%d}-{key.lower()}-{uid}@aladhan-api\r\n"
+                f"{stamp}"
+                f"DTSTART:{when.astimezone(timezone.utc):%Y%m%dT%H%M%SZ}\r\n"
+                f"DURATION:{EVENT_DURATION}\r\n"
+                f"{_fold(f'SUMMARY:{_escape(key + suffix)}')}"
+                f"{location}{geo}"
+                "TRANSP:TRANSPARENT\r\n"
+                "END:VEVENT\r\n"
+            )
+    return "".join(blocks)
+
+
+def get_prayer_calendar(
+    today: date,
+    lat: float,
+    lon: float,
+    method: str,
+    madhab: str,
+    tz: Optional[str],
+    precision: str = "standard",
+    high_latitude_rule: str = DEFAULT_RULE,
+    name: str = "",
+    months: int = ICS_WINDOW_MONTHS,
+) -> bytes:
+    """iCalendar feed of the prayers of the ``months`` months starting with the one of ``today``."""
+    tz = tz or get_tz()
+    title = f"Prayer times - {name}" if name else "Prayer times"
+    header = (
+        "BEGIN:VCALENDAR\r\n"
+        "VERSION:2.0\r\n"
+        f"PRODID:{PRODID}\r\n"
+        "CALSCALE:GREGORIAN\r\n"
+        "METHOD:PUBLISH\r\n"
+        f"{_fold(f'X-WR-CALNAME:{_escape(title)}')}"
+        f"X-WR-TIMEZONE:{tz}\r\n"
+        f"REFRESH-INTERVAL;VALUE=DURATION:{REFRESH_INTERVAL}\r\n"
+        f"X-PUBLISHED-TTL:{REFRESH_INTERVAL}\r\n"
+    )
+    events = [
+        month_events(y, m, lat, lon, method, madhab, precision, high_latitude_rule, name)
+        for y, m in window_months(today, months)
+    ]
+    return (header + "".join(events) + "END:VCALENDAR\r\n").encode("utf-8")
@@ -0,0 +1,93 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from src.calculations.qibla import SunTrack, qibla_many, sun_tracks
+from src.domain.city_repository import CityRepository
+from src.domain.models import City
+
+# Cities whose Qibla result is kept in memory (~200 bytes each).
+QIBLA_CACHE_SIZE = 100_000
+# (city, day, step) sun tracks kept in memory (~2 KB each at a 10 minute step).
+SUN_TRACK_CACHE_SIZE = 4096
+
+
+class QiblaService:
+    """Qibla bearings and sun tracks, cached per city id.
+
+    City coordinates do not change, so a city's Qibla result is computed
+    once; sun tracks are cached per (city id, day, step). Misses of a bulk
+    request are looked up and computed together in one vectorized pass. Ad-hoc
+    coordinates (no id) are computed on every call.
+    """
+
+    def __init__(self, city_repo: CityRepository):
+        self.city_repo = city_repo
+        self._qibla: "OrderedDict[int, Dict]" = OrderedDict()
+        self._tracks: "OrderedDict[Tuple[int, date, int], SunTrack]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def resolve(self, city_ids: List[int]) -> Tuple[List[City], List[int]]:
+        """(cities in request order, unknown ids)."""
+        cities = self.city_repo.get_cities_by_ids(city_ids)
+        missing = sorted(set(city_ids) - {c.id for c in cities})
+        return cities, missing
+
+    def get_qibla(self, locations: List[City]) -> List[Dict]:
+        """Bearing and distance to the Kaaba for each location, in order."""
+        results: List[Optional[Dict]] = [None] * len(locations)
+        todo = []
+        with self._lock:
+            for i, city in enumerate(locations):
+                cached = self._qibla.get(city.id) if city.id is not None else None
+                if cached is None:
+                    todo.append(i)
+                else:
+                    self._qibla.move_to_end(city.id)
+                    results[i] = cached
+        if todo:
+            bearings, distances = qibla_many([locations[i].lat for i in todo], [locations[i].lon for i in todo])
+            with self._lock:
+                for i, bearing, distance in zip(todo, bearings, distances):
+                    city = locations[i]
+                    results[i] = {
+                        **city.get_dict(),
+                        "bearing": round(bearing, 4),
+                        "distance_km": round(distance, 3),
+                    }
+                    if city.id is not None:
+                        self._qibla[city.id] = results[i]
+                        if len(self._qibla) > QIBLA_CACHE_SIZE:
+                            self._qibla.popitem(last=False)
+        return results
+
+    def get_sun_tracks(self, locations: List[City], day: date, step_minutes: int) -> List[SunTrack]:
+        """``sun_track`` of each location over the UTC day ``day``, in order."""
+        results: List[Optional[SunTrack]] = [None] * len(locations)
+        todo = []
+        with self._lock:
+            for i, city in enumerate(locations):
+                key = (city.id, day, step_minutes)
+                cached = self._tracks.get(key) if city.id is not None else None
+                if cached is None:
+                    todo.append(i)
+                else:
+                    self._tracks.move_to_end(key)
+                    results[i] = cached
+        if todo:
+            tracks = sun_tracks(day, [locations[i].lat for i in todo], [locations[i].lon for i in todo], step_minutes)
+            with self._lock:
+                for i, track in zip(todo, tracks):
+                    results[i] = track
+                    city_id = locations[i].id
+                    if city_id is not None:
+                        self._tracks[(city_id, day, step_minutes)] = track
+                        if len(self._tracks) > SUN_TRACK_CACHE_SIZE:
+                            self._tracks.popitem(last=False)
+        return results
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._qibla.clear()
+            self._tracks.clear()
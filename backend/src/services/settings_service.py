@@ -8,7 +8,9 @@ from src.services.device_service import DeviceService
 
 logger = LogConfig.get_logger()
 repository = RepositoryContainer()
-device_service = DeviceService(repository.device_repo, repository.setting_repo, debug=True)
+device_service = DeviceService(
+    repository.device_repo, repository.setting_repo, debug=True, timetable_repository=repository.timetable_repo
+)
 
 class SettingsService:
     def __init__(self, settings_repo: SettingsRepository):
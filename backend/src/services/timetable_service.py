@@ -0,0 +1,136 @@
+import threading
+from array import array
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Iterable, Iterator, Tuple
+
+from src.calculations.adhan_calc import (
+    COORD_DECIMALS,
+    ENGINE_VERSION,
+    ORDERED_KEYS,
+    PrayerDay,
+    PrayerRange,
+    PrayerTimes,
+)
+from src.domain.models import Timetable, TimetableKey
+from src.domain.timetable_repository import TimetableRepository
+from src.schemas.log_config import LogConfig
+
+logger = LogConfig.get_logger()
+# Decoded years kept in memory in front of the database (~32 KB each).
+MEMORY_CACHE_SIZE = 256
+
+
+class TimetableService:
+    """Read-through cache of whole-year timetables, persisted in the app database.
+
+    A year of one location and configuration is computed once
+    (``PrayerTimes.compute_year_utc``), stored as UTC minutes and localized on
+    read, so every timezone shares it. Entries built by another
+    ``ENGINE_VERSION`` are ignored and rebuilt on first use; ``purge_stale``
+    deletes them in bulk.
+
+    With ``persist=False`` (public endpoints, where callers choose arbitrary
+    coordinates) stored years are still read but misses only fill the
+    bounded memory tier, so requests cannot grow the database; the device
+    service persists the years of configured cities.
+    """
+
+    def __init__(self, timetable_repo: TimetableRepository, persist: bool = True):
+        self.timetable_repo = timetable_repo
+        self.persist = persist
+        self._years: "OrderedDict[TimetableKey, array]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(pt: PrayerTimes, year: int, lat: float, lon: float) -> TimetableKey:
+        return TimetableKey(
+            lat=round(lat, COORD_DECIMALS),
+            lon=round(lon, COORD_DECIMALS),
+            method=pt.method,
+            # Only the Asr shadow factor matters: "shafi", "Shafi" and "SHAFI" share a row.
+            madhab="Shafi" if pt.asr_factor == 1.0 else "Hanafi",
+            shafaq=pt.shafaq,
+            precision=pt.precision,
+            high_latitude_rule=pt.high_latitude_rule,
+            year=year,
+        )
+
+    def get_year(self, pt: PrayerTimes, year: int, lat: float, lon: float) -> array:
+        """``compute_year_utc`` for the key, from memory, the database or the engine."""
+        key = self.key_for(pt, year, lat, lon)
+        with self._lock:
+            minutes = self._years.get(key)
+            if minutes is not None:
+                self._years.move_to_end(key)
+                return minutes
+        stored = self.timetable_repo.get_timetable(key)
+        if stored is not None and stored.engine_version == ENGINE_VERSION:
+            minutes = array("d")
+            minutes.frombytes(stored.minutes)
+        else:
+            minutes = pt.compute_year_utc(year, key.lat, key.lon)
+            if self.persist:
+                self.timetable_repo.save_timetable(Timetable(key, ENGINE_VERSION, minutes.tobytes()))
+        with self._lock:
+            self._years[key] = minutes
+            if len(self._years) > MEMORY_CACHE_SIZE:
+                self._years.popitem(last=False)
+        return minutes
+
+    def get_day(self, pt: PrayerTimes, base_date: date, lat: float, lon: float) -> PrayerDay:
+        """``pt.compute_day`` served from the cached year."""
+        minutes = self.get_year(pt, base_date.year, lat, lon)
+        days = len(minutes) // len(ORDERED_KEYS)
+        return PrayerDay(pt, base_date, minutes[_day_index(base_date)::days])
+
+    def get_days(self, pt: PrayerTimes, start: date, end: date, lat: float, lon: float) -> PrayerRange:
+        """``pt.compute_days`` served from the cached years (spans may cross a year end)."""
+        parts = []
+        day = start
+        while day <= end:
+            last = min(end, date(day.year, 12, 31))
+            parts.append((self.get_year(pt, day.year, lat, lon), _day_index(day), _day_index(last) + 1))
+            day = last + timedelta(days=1)
+        if len(parts) == 1 and parts[0][1] == 0 and parts[0][2] * len(ORDERED_KEYS) == len(parts[0][0]):
+            return PrayerRange(pt, start, parts[0][0])  # a whole year: share the cached array
+        minutes = array("d")
+        for k in range(len(ORDERED_KEYS)):
+            for year_minutes, first, stop in parts:
+                offset = k * (len(year_minutes) // len(ORDERED_KEYS))
+                minutes.extend(year_minutes[offset + first:offset + stop])
+        return PrayerRange(pt, start, minutes)
+
+    def iter_range(self, pt: PrayerTimes, start: date, end: date, lat: float,
+                   lon: float) -> Iterator[Tuple[date, PrayerDay]]:
+        """Like ``pt.iter_range``: one cached year is loaded at a time."""
+        day = start
+        while day <= end:
+            last = min(end, date(day.year, 12, 31))
+            for prayer_day in self.get_days(pt, day, last, lat, lon):
+                yield prayer_day.date, prayer_day
+            day = last + timedelta(days=1)
+
+    def warm(self, pt: PrayerTimes, years: Iterable[int], locations: Iterable[Tuple[float, float]]) -> int:
+        """Make sure every (year, location) entry exists; return how many were loaded."""
+        count = 0
+        for lat, lon in locations:
+            for year in years:
+                self.get_year(pt, year, lat, lon)
+                count += 1
+        return count
+
+    def purge_stale(self) -> int:
+        """Delete entries built by another engine version."""
+        deleted = self.timetable_repo.delete_stale(ENGINE_VERSION)
+        if deleted:
+            logger.info(f"Deleted {deleted} stale timetable(s) (engine {ENGINE_VERSION})")
+        return deleted
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._years.clear()
+
+
+def _day_index(day: date) -> int:
+    return day.timetuple().tm_yday - 1
@@ -0,0 +1,188 @@
+"""Unit tests for the adhan service: day payloads and lazy range streaming."""
+import itertools
+from datetime import date
+
+import pytest
+from fastapi import HTTPException
+from pydantic import ValidationError
+from starlette.requests import Request
+
+from src.api.v1 import prayer_times_api as api
+from src.calculations import adhan_calc, batch
+from src.schemas.prayer_times import PrayerBatchRequest
+from src.services import adhan_service
+
+needs_numpy = pytest.mark.skipif(batch.np is None, reason="numpy not installed")
+
+PARIS = (48.8566, 2.3522)
+
+
+def test_iter_prayer_times_matches_single_day():
+    days = adhan_service.iter_prayer_times(date(2025, 10, 1), date(2025, 10, 3), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    payloads = list(days)
+    assert [p["date"] for p in payloads] == ["2025-10-01", "2025-10-02", "2025-10-03"]
+    single = adhan_service.get_prayer_times(date(2025, 10, 2), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert payloads[1]["times"] == single["times"]
+    assert payloads[1]["hijri_date"] == single["hijri_date"]
+
+
+def test_iter_prayer_times_is_lazy():
+    days = adhan_service.iter_prayer_times(date(2000, 1, 1), date(2099, 12, 31), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert len(list(itertools.islice(days, 2))) == 2
+
+
+def test_year_payload_is_deterministic():
+    """No live fields in the body, so it can be cached and validated by ETag."""
+    year = adhan_service.get_year_prayer_times(2024, *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert len(year) == 366
+    assert "device_current_time" not in year[0]
+    assert adhan_service.get_year_prayer_times(2024, *PARIS, "MWL", "Shafi", "Europe/Paris") == year
+
+
+def test_hijri_label_outside_supported_range_is_blank():
+    payload = adhan_service.get_prayer_times(date(1910, 1, 1), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert payload["hijri_date"] == ""
+    assert payload["times"]["Dhuhr"] is not None
+
+
+def test_range_labels_match_single_days():
+    month = adhan_service.get_month_prayer_times(2025, 3, *PARIS, "MWL", "Shafi", "Europe/Paris")
+    single = adhan_service.get_prayer_times(date(2025, 3, 15), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert month[14]["hijri_date"] == single["hijri_date"] != ""
+
+
+def test_hijri_label_language():
+    arabic = adhan_service.get_prayer_times(date(2025, 3, 1), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    english = adhan_service.get_prayer_times(date(2025, 3, 1), *PARIS, "MWL", "Shafi", "Europe/Paris", language="en")
+    assert arabic["hijri_date"] == "السبت 1 رمضان 1446"
+    assert english["hijri_date"] == "Saturday 1 Ramadan 1446"
+    month = adhan_service.get_month_prayer_times(2025, 3, *PARIS, "MWL", "Shafi", "Europe/Paris", language="en")
+    assert month[0]["hijri_date"] == english["hijri_date"]
+
+
+def test_hijri_range_columns():
+    payload = adhan_service.get_hijri_range(date(2025, 2, 28), date(2025, 3, 2))
+    assert payload == {
+        "dates": ["2025-02-28", "2025-03-01", "2025-03-02"],
+        "year": [1446, 1446, 1446],
+        "month": [8, 9, 9],
+        "day": [29, 1, 2],
+    }
+
+
+def test_grid_points_include_bounds():
+    points = adhan_service.grid_points(48.0, 49.0, 2.0, 2.5, 0.5)
+    assert [(p.lat, p.lon) for p in points] == [(48.0, 2.0), (48.0, 2.5), (48.5, 2.0), (48.5, 2.5), (49.0, 2.0), (49.0, 2.5)]
+
+
+def test_grid_axis_size_counts_grid_points():
+    # 0.3 / 0.1 is 2.9999999999999996: the size must still include the upper bound.
+    assert adhan_service.grid_axis_size(0.0, 0.3, 0.1) == 4
+    points = adhan_service.grid_points(0.0, 0.3, 10.0, 10.7, 0.1)
+    assert len(points) == adhan_service.grid_axis_size(0.0, 0.3, 0.1) * adhan_service.grid_axis_size(10.0, 10.7, 0.1) == 32
+
+
+def test_prayer_grid_is_columnar_and_matches_single_day():
+    locations = adhan_service.grid_points(48.0, 49.0, 2.0, 3.0, 1.0)
+    grid = adhan_service.get_prayer_grid(date(2025, 10, 1), date(2025, 10, 3), locations, "MWL", "Shafi", "Europe/Paris")
+    assert grid["dates"] == ["2025-10-01", "2025-10-02", "2025-10-03"]
+    assert len(grid["locations"]) == 4
+    assert all(len(rows) == 4 and all(len(row) == 3 for row in rows) for rows in grid["times"].values())
+    single = adhan_service.get_prayer_times(date(2025, 10, 2), 49.0, 3.0, "MWL", "Shafi", "Europe/Paris")
+    assert grid["times"]["Fajr"][3][1] == single["times"]["Fajr"].split()[0]
+
+
+def test_method_comparison_matrix():
+    result = adhan_service.get_method_comparison(date(2025, 10, 1), date(2025, 10, 2), *PARIS, ["mwl", "ISNA"], "Shafi", "Europe/Paris")
+    assert result["methods"] == ["MWL", "ISNA"]
+    assert all(len(column) == 2 for times in result["matrix"].values() for column in times.values())
+    single = adhan_service.get_prayer_times(date(2025, 10, 2), *PARIS, "ISNA", "Shafi", "Europe/Paris")
+    assert result["matrix"]["ISNA"]["Isha"][1] == single["times"]["Isha"]
+
+
+def test_method_comparison_deduplicates_methods():
+    result = adhan_service.get_method_comparison(date(2025, 10, 2), date(2025, 10, 2), *PARIS, ["MWL", "mwl", "isna"], "Shafi", "Europe/Paris")
+    assert result["methods"] == ["MWL", "ISNA"]
+    assert list(result["matrix"]) == ["MWL", "ISNA"]
+
+
+def test_compare_rejects_out_of_range_day():
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    with pytest.raises(HTTPException) as exc:
+        api.prayer_times_compare(request, *PARIS, day="0001-01-01")
+    assert exc.value.status_code == 400
+
+
+def test_precision_is_threaded_through():
+    standard = adhan_service.get_prayer_times(date(2025, 10, 2), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    high = adhan_service.get_prayer_times(date(2025, 10, 2), *PARIS, "MWL", "Shafi", "Europe/Paris", "high")
+    assert standard["times"]["Fajr"] == "06:06:18 (CEST)"
+    assert high["times"]["Fajr"] != standard["times"]["Fajr"]
+    month = adhan_service.get_month_prayer_times(2025, 10, *PARIS, "MWL", "Shafi", "Europe/Paris", "high")
+    assert month[1]["times"] == high["times"]
+
+
+def test_high_latitude_rule_is_threaded_through():
+    oslo = (59.91, 10.75)
+    seventh = adhan_service.get_prayer_times(date(2025, 6, 21), *oslo, "MWL", "Shafi", "Europe/Oslo")
+    middle = adhan_service.get_prayer_times(
+        date(2025, 6, 21), *oslo, "MWL", "Shafi", "Europe/Oslo", high_latitude_rule="middle_of_night"
+    )
+    assert middle["times"]["Fajr"] != seventh["times"]["Fajr"]
+    month = adhan_service.get_month_prayer_times(
+        2025, 6, *oslo, "MWL", "Shafi", "Europe/Oslo", high_latitude_rule="middle_of_night"
+    )
+    assert month[20]["times"] == middle["times"]
+    rules = {r["rule"] for r in adhan_service.get_high_latitude_rules()}
+    assert "seventh_of_night" in rules and "nearest_latitude" in rules
+
+
+BATCH_QUERIES = [
+    adhan_service.DayQuery(date(2025, 10, 3), *PARIS, "MWL", "Shafi", "Europe/Paris"),
+    adhan_service.DayQuery(date(2025, 10, 2), 21.4225, 39.8262, "MAKKAH", "Hanafi", "Asia/Riyadh", language="en"),
+    adhan_service.DayQuery(date(2025, 10, 2), *PARIS, "MWL", "Shafi", "Europe/Paris"),
+    adhan_service.DayQuery(date(2025, 10, 2), 59.91, 10.75, "MWL", "Shafi", "Europe/Paris"),
+    adhan_service.DayQuery(date(2025, 10, 3), *PARIS, "MWL", "Shafi", "Europe/Paris"),
+]
+
+
+def _check_batch(results):
+    assert results[0] is results[4]
+    for q, result in zip(BATCH_QUERIES, results):
+        assert result == adhan_service.get_prayer_times(
+            q.base_date, q.lat, q.lon, q.method, q.madhab, q.tz, language=q.language
+        )
+    assert results[2]["times"]["Fajr"] == "06:06:18 (CEST)"
+
+
+@needs_numpy
+def test_batch_solves_each_group_in_one_engine_call(monkeypatch):
+    calls = []
+    compute = adhan_service.PrayerTimes.compute_batch_utc
+    monkeypatch.setattr(
+        adhan_service.PrayerTimes, "compute_batch_utc",
+        lambda pt, dates, lats, lons: calls.append((pt.method, dates[0], len(lats))) or compute(pt, dates, lats, lons),
+    )
+    results = adhan_service.get_prayer_times_batch(BATCH_QUERIES)
+    # Paris on the 3rd (asked twice), Mecca, then Paris and Oslo together on the 2nd.
+    assert sorted(calls) == [
+        ("MAKKAH", date(2025, 10, 2), 1), ("MWL", date(2025, 10, 2), 2), ("MWL", date(2025, 10, 3), 1),
+    ]
+    _check_batch(results)
+
+
+def test_batch_falls_back_to_the_scalar_engine(monkeypatch):
+    monkeypatch.setattr(adhan_calc, "np", None)
+    labels = []
+    label = adhan_service._hijri_label
+    monkeypatch.setattr(adhan_service, "_hijri_label", lambda d, language: labels.append(d) or label(d, language))
+    results = adhan_service.get_prayer_times_batch(BATCH_QUERIES)
+    assert sorted(labels) == [date(2025, 10, 2)] * 2 + [date(2025, 10, 3)]  # once per date and language
+    monkeypatch.undo()
+    _check_batch(results)
+
+
+@pytest.mark.parametrize("lat, lon", [(120.0, 2.35), (48.85, -181.0)])
+def test_batch_rejects_out_of_range_coordinates(lat, lon):
+    with pytest.raises(ValidationError):
+        PrayerBatchRequest(queries=[{"lat": 48.85, "lon": 2.35}, {"lat": lat, "lon": lon}])
@@ -4,13 +4,27 @@ These guard the alignment with the canonical Swift AstroEngine. The numeric
 baseline locks the algorithm against accidental drift; the behavioural tests
 cover Maghrib config, the 1/7-night high-latitude fallback, and Jafari midnight.
 """
-from datetime import date, datetime
+from datetime import date, datetime, time, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 import pytest
 
-from src.calculations.adhan_calc import ORDERED_KEYS, PRAYER_METHODS, PrayerTimes
+from src.calculations import batch, range_engine
+from src.calculations.adhan_calc import (
+    HMS_FORMAT,
+    ORDERED_KEYS,
+    PRAYER_METHODS,
+    HighPrecisionPrayerTimes,
+    PrayerRange,
+    PrayerTimes,
+)
+from src.calculations.high_latitude import HIGH_LATITUDE_RULES, NEAREST_LATITUDE_DEG
 
 PARIS = (48.8566, 2.3522)
+# Mid-latitude, 1/7-night fallback, polar day and southern hemisphere.
+LOCATIONS = [PARIS, (59.91, 10.75), (69.65, 18.96), (-33.92, 18.42), (21.42, 39.83)]
+
+needs_numpy = pytest.mark.skipif(batch.np is None, reason="numpy not installed")
 
 
 def _hms(value: str) -> str:
@@ -70,6 +84,60 @@ def test_high_latitude_fallback():
     assert times["Isha"] is not None
 
 
+OSLO = (59.91, 10.75)
+
+
+@pytest.mark.parametrize("rule", sorted(HIGH_LATITUDE_RULES))
+def test_high_latitude_rules(rule):
+    """Each rule fills the unreachable Fajr/Isha of an Oslo summer night."""
+    pt = PrayerTimes("MWL", "Shafi", "UTC", high_latitude_rule=rule)
+    times = pt._compute_utc(date(2025, 6, 21), *OSLO)
+    night = times["Sunrise"] + 1440.0 - times["Sunset"]
+    if rule == "nearest_latitude":
+        at_limit = PrayerTimes("MWL", "Shafi", "UTC")._compute_utc(date(2025, 6, 21), NEAREST_LATITUDE_DEG, OSLO[1])
+        assert times["Fajr"] == pytest.approx(at_limit["Fajr"], abs=1e-9)
+        assert times["Isha"] == pytest.approx(at_limit["Isha"], abs=1e-9)
+    else:
+        portion = {"middle_of_night": night / 2, "seventh_of_night": night / 7, "twilight_angle": night * 18 / 60}[rule]
+        assert times["Fajr"] == pytest.approx(times["Sunrise"] - portion)
+        assert times["Isha"] == pytest.approx(times["Sunset"] + 17 * portion / 18 if rule == "twilight_angle"
+                                              else times["Sunset"] + portion)
+    # Days where the angle is reached are untouched.
+    assert pt._compute_utc(date(2025, 1, 15), *OSLO) == PrayerTimes("MWL")._compute_utc(date(2025, 1, 15), *OSLO)
+
+
+def test_high_latitude_rule_is_part_of_the_configuration():
+    import pickle
+
+    pt = PrayerTimes.for_config("MWL", "Shafi", "Europe/Oslo", high_latitude_rule="middle_of_night")
+    assert pt is not PrayerTimes.for_config("MWL", "Shafi", "Europe/Oslo")
+    clone = pickle.loads(pickle.dumps(pt))
+    assert clone.high_latitude_rule == "middle_of_night"
+    assert clone.compute(date(2025, 6, 21), *OSLO) == pt.compute(date(2025, 6, 21), *OSLO)
+    with pytest.raises(ValueError):
+        PrayerTimes("MWL", high_latitude_rule="nope")
+
+
+@needs_numpy
+@pytest.mark.parametrize("rule", sorted(HIGH_LATITUDE_RULES))
+@pytest.mark.parametrize("method", sorted(PRAYER_METHODS))
+def test_high_latitude_rules_batch_matches_scalar(rule, method):
+    pt = PrayerTimes(method, "Shafi", "Europe/Oslo", high_latitude_rule=rule)
+    days = [date(2025, 1, 1) + timedelta(days=i) for i in range(0, 365, 5)]
+    # Mid latitude, 1/7-night fallback, Reykjavik, Tierra del Fuego, polar day/night.
+    locations = [PARIS, OSLO, (64.14, -21.94), (-55.0, -68.0), (69.65, 18.96), (78.22, 15.65)]
+    grid = pt.compute_grid(days, [la for la, _ in locations], [lo for _, lo in locations])
+    for i, (lat, lon) in enumerate(locations):
+        for j, d in enumerate(days):
+            expected = pt.compute_datetimes(d, lat, lon)
+            for k in ORDERED_KEYS:
+                got = grid[k][i][j]
+                if expected[k] is None:
+                    assert got is None, (rule, d, lat, k)
+                else:
+                    assert abs((got - expected[k]).total_seconds()) < 1e-3, (rule, d, lat, k)
+
+
 def test_polar_day_returns_none():
     """Tromso in June: the sun never sets — events gracefully resolve to None."""
     times = PrayerTimes("MWL", "Shafi", "Europe/Oslo").compute(date(2025, 6, 21), 69.65, 18.96)
@@ -99,3 +167,313 @@ def test_unknown_method_raises():
 def test_available_methods_cover_registry():
     methods = {m["method"] for m in PrayerTimes.get_available_methods()}
     assert methods == set(PRAYER_METHODS)
+
+
+@needs_numpy
+@pytest.mark.parametrize("method", sorted(PRAYER_METHODS))
+def test_batch_matches_scalar(method):
+    """The vectorized engine must agree with the scalar path for every method."""
+    pt = PrayerTimes(method, "Hanafi", "Europe/Paris")
+    # Sunset-relative offsets (fixed Maghrib, Moonsighting) need a sunset on the scalar path.
+    cfg = PRAYER_METHODS[method]
+    locations = LOCATIONS
+    days = [date(2025, 1, 1) + timedelta(days=i) for i in range(0, 365, 11)]
+    pairs = [(d, lat, lon) for lat, lon in locations for d in days]
+
+    results = pt.compute_batch(*zip(*pairs))
+    assert len(results) == len(pairs)
+    for (d, lat, lon), got in zip(pairs, results):
+        expected = pt.compute_datetimes(d, lat, lon)
+        assert list(got) == ORDERED_KEYS
+        for k in ORDERED_KEYS:
+            if expected[k] is None:
+                assert got[k] is None, (d, lat, k)
+            else:
+                assert abs((got[k] - expected[k]).total_seconds()) < 1e-3, (d, lat, k)
+
+
+@needs_numpy
+def test_batch_paris_mwl_baseline():
+    """The batch path reproduces the locked Paris baseline, with a shared location."""
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    times = pt.compute_batch([date(2025, 10, 1), date(2025, 10, 2)], *PARIS)[1]
+    assert _hms(pt._format(times["Fajr"])) == "06:06:18"
+    assert _hms(pt._format(times["Dhuhr"])) == "13:40:00"
+    assert _hms(pt._format(times["Maghrib"])) == "19:27:19"
+
+
+def test_batch_scalar_fallback(monkeypatch):
+    """Without numpy, compute_batch degrades to the scalar engine."""
+    monkeypatch.setattr("src.calculations.adhan_calc.np", None)
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    assert pt.compute_batch([date(2025, 10, 2)], *PARIS) == [pt.compute_datetimes(date(2025, 10, 2), *PARIS)]
+    with pytest.raises(RuntimeError):
+        pt.compute_batch_utc([date(2025, 10, 2)], *PARIS)
+
+
+def test_iter_chunks_cover_range():
+    chunks = list(range_engine.iter_chunks(date(2024, 1, 1), date(2024, 12, 31), 31))
+    days = [d for chunk in chunks for d in chunk]
+    assert len(days) == 366
+    assert days == sorted(set(days))
+    assert all(len(chunk) <= 31 for chunk in chunks)
+
+
+def test_compute_range_matches_single_days():
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    days = list(pt.compute_range(date(2025, 3, 25), date(2025, 4, 3), *PARIS, chunk_days=4))
+    assert [d for d, _ in days] == [date(2025, 3, 25) + timedelta(days=i) for i in range(10)]
+    for d, times in days:
+        expected = pt.compute_datetimes(d, *PARIS)
+        assert all(
+            abs((times[k] - expected[k]).total_seconds()) < 1e-3 for k in ORDERED_KEYS
+        )
+
+
+def test_compute_range_process_pool_keeps_order():
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    start, end = date(2025, 1, 1), date(2025, 3, 31)
+    pooled = list(pt.compute_range(start, end, *PARIS, workers=2, chunk_days=10))
+    inline = list(pt.compute_range(start, end, *PARIS, chunk_days=10))
+    assert pooled == inline
+
+
+def test_compute_year_formats_every_day():
+    year = PrayerTimes("MWL", "Shafi", "Europe/Paris").compute_year(2024, *PARIS)
+    assert len(year) == 366
+    assert list(year[0]) == ORDERED_KEYS
+
+
+def test_ephemeris_cache_hits_on_repeat():
+    """A second computation of the same day/location is served from the cache."""
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    PrayerTimes.ephemeris_cache_clear()
+    first = pt.compute_datetimes(date(2025, 10, 2), *PARIS)
+    cold = PrayerTimes.ephemeris_cache_info()
+    assert cold["misses"] > 0
+    assert cold["hits"] > 0  # the midnight entry is shared by every event of the day
+
+    assert pt.compute_datetimes(date(2025, 10, 2), *PARIS) == first
+    warm = PrayerTimes.ephemeris_cache_info()
+    assert warm["misses"] == cold["misses"]
+    assert warm["size"] <= warm["maxsize"]
+
+
+def test_ephemeris_cache_matches_analytic():
+    jd = PrayerTimes.julian_day(2025, 10, 2) + 0.37
+    assert PrayerTimes._ephemeris(jd) == PrayerTimes.sun_position(jd)
+
+
+@pytest.mark.parametrize("tz", ["Europe/Paris", "America/New_York", "Australia/Lord_Howe"])
+def test_local_clock_matches_astimezone_across_dst(tz):
+    """The arithmetic fast path must agree with astimezone, fold included."""
+    pt = PrayerTimes("MWL", "Shafi", tz)
+    zone = ZoneInfo(tz)
+    for day in (date(2025, 1, 1) + timedelta(days=i) for i in range(365)):
+        for minutes in (-600.5, 0.0, 75.25, 130.0, 700.0, 1439.99, 1500.0, 2900.0):
+            got = pt._to_local_datetime(day, minutes)
+            utc = datetime.combine(day, time(0, 0), tzinfo=timezone.utc) + timedelta(minutes=minutes)
+            expected = utc.astimezone(zone)
+            assert (got, got.fold, got.tzname()) == (expected, expected.fold, expected.tzname())
+
+
+def test_empty_tz_returns_utc():
+    times = PrayerTimes("MWL", "Shafi", "").compute_datetimes(date(2025, 10, 2), *PARIS)
+    assert times["Dhuhr"].tzinfo is timezone.utc
+    assert times["Dhuhr"].strftime("%H:%M:%S") == "11:40:00"
+
+
+def test_for_config_shares_instances():
+    pt = PrayerTimes.for_config("mwl", "Shafi", "Europe/Paris")
+    assert pt is PrayerTimes.for_config("MWL", "Shafi", "Europe/Paris")
+    assert pt is not PrayerTimes.for_config("MWL", "Hanafi", "Europe/Paris")
+
+
+def test_instances_are_immutable():
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    with pytest.raises(AttributeError):
+        pt.method = "ISNA"
+    with pytest.raises(AttributeError):
+        pt.extra = 1
+
+
+def test_instances_pickle_by_configuration():
+    import pickle
+
+    pt = PrayerTimes("MOONSIGHTING", "Hanafi", "Europe/London", "ahmer")
+    clone = pickle.loads(pickle.dumps(pt))
+    assert repr(clone) == repr(pt)
+    assert clone.compute(date(2025, 10, 2), 51.5, -0.12) == pt.compute(date(2025, 10, 2), 51.5, -0.12)
+
+
+def test_compute_cached_rounds_coordinates():
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    first = pt.compute_cached(date(2025, 10, 2), 48.85661, 2.35221)
+    assert first == pt.compute_datetimes(date(2025, 10, 2), *PARIS)
+    again = pt.compute_cached(date(2025, 10, 2), 48.856598, 2.352198)
+    assert again == first and again is not first
+
+
+def test_iter_range_is_lazy_and_ordered():
+    import itertools
+
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    days = pt.iter_range(date(2025, 1, 1), date(2125, 1, 1), *PARIS)  # never materialized
+    first = list(itertools.islice(days, 3))
+    assert [d for d, _ in first] == [date(2025, 1, 1), date(2025, 1, 2), date(2025, 1, 3)]
+    assert first[1][1] == pt.compute_datetimes(date(2025, 1, 2), *PARIS)
+
+
+def test_compute_month_shape():
+    month = PrayerTimes("MWL", "Shafi", "Europe/Paris").compute_month(2024, 2, *PARIS)
+    assert len(month) == 29
+    assert month[0][0] == "2024-02-01"
+    assert list(month[0][1]) == ORDERED_KEYS
+
+
+# -----------------------------
+# Grid (locations x dates)
+# -----------------------------
+@pytest.mark.parametrize("use_numpy", [pytest.param(True, marks=needs_numpy), False])
+@pytest.mark.parametrize("method", ["MWL", "MOONSIGHTING", "TEHRAN"])
+def test_compute_grid_matches_scalar(method, use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr("src.calculations.adhan_calc.np", None)
+    pt = PrayerTimes(method, "Shafi", "Europe/Paris")
+    locations = [PARIS, (21.42, 39.83), (-33.92, 18.42)]
+    dates = [date(2025, 3, 28) + timedelta(days=i) for i in range(5)]  # spans the DST switch
+    grid = pt.compute_grid(dates, [la for la, _ in locations], [lo for _, lo in locations])
+    for i, loc in enumerate(locations):
+        for j, d in enumerate(dates):
+            expected = pt.compute_datetimes(d, *loc)
+            for k in ORDERED_KEYS:
+                assert abs((grid[k][i][j] - expected[k]).total_seconds()) < 1e-3
+
+
+@needs_numpy
+def test_compute_grid_utc_shape():
+    pt = PrayerTimes("MWL", "Shafi", "UTC")
+    dates = [date(2025, 1, 1) + timedelta(days=i) for i in range(7)]
+    grid = pt.compute_grid_utc(dates, [10.0, 20.0, 30.0, 40.0], [0.0, 5.0, 10.0, 15.0])
+    assert all(grid[k].shape == (4, 7) for k in ORDERED_KEYS)
+
+
+# -----------------------------
+# Method comparison
+# -----------------------------
+@pytest.mark.parametrize("loc", [PARIS, (59.91, 10.75), (21.42, 39.83)])
+def test_compare_methods_matches_each_method(loc):
+    pt = PrayerTimes("MWL", "Hanafi", "Europe/Paris")
+    matrix = pt.compare_methods(date(2025, 6, 21), *loc)
+    assert list(matrix) == list(PRAYER_METHODS)
+    for method, times in matrix.items():
+        assert times == PrayerTimes(method, "Hanafi", "Europe/Paris").compute_datetimes(date(2025, 6, 21), *loc)
+
+
+def test_compare_methods_subset():
+    matrix = PrayerTimes("MWL", "Shafi", "UTC").compare_methods(date(2025, 1, 1), *PARIS, ["isna", "France"])
+    assert list(matrix) == ["ISNA", "FRANCE"]
+
+
+# -----------------------------
+# High-precision mode
+# -----------------------------
+def test_for_config_precision():
+    pt = PrayerTimes.for_config("MWL", "Shafi", "Europe/Paris", precision="high")
+    assert isinstance(pt, HighPrecisionPrayerTimes) and pt.precision == "high"
+    assert pt is not PrayerTimes.for_config("MWL", "Shafi", "Europe/Paris")
+    with pytest.raises(ValueError):
+        PrayerTimes.for_config("MWL", "Shafi", "Europe/Paris", precision="ultra")
+
+
+def test_high_precision_pickles_by_configuration():
+    import pickle
+
+    pt = HighPrecisionPrayerTimes("MWL", "Shafi", "Europe/Paris")
+    clone = pickle.loads(pickle.dumps(pt))
+    assert type(clone) is HighPrecisionPrayerTimes
+    assert clone.compute(date(2025, 10, 2), *PARIS) == pt.compute(date(2025, 10, 2), *PARIS)
+
+
+@pytest.mark.parametrize("loc", [PARIS, (-33.92, 18.42), (21.42, 39.83)])
+def test_high_precision_close_to_standard(loc):
+    """The two models agree to well under a minute; the standard one is not touched."""
+    standard = PrayerTimes("MWL", "Hanafi", "UTC").compute_datetimes(date(2025, 3, 20), *loc)
+    high = HighPrecisionPrayerTimes("MWL", "Hanafi", "UTC").compute_datetimes(date(2025, 3, 20), *loc)
+    for key in ORDERED_KEYS:
+        assert abs((high[key] - standard[key]).total_seconds()) < 30
+
+
+@needs_numpy
+@pytest.mark.parametrize("loc", LOCATIONS)
+def test_high_precision_batch_matches_scalar(loc):
+    pt = HighPrecisionPrayerTimes("MWL", "Shafi", "UTC")
+    days = [date(2025, 1, 1) + timedelta(days=i) for i in range(0, 365, 7)]
+    for day, got in zip(days, pt.compute_batch(days, *loc)):
+        expected = pt.compute_datetimes(day, *loc)
+        for key in ORDERED_KEYS:
+            if expected[key] is None:
+                assert got[key] is None
+            else:
+                assert abs((got[key] - expected[key]).total_seconds()) < 0.01
+
+
+# -----------------------------
+# Compact day / range views
+# -----------------------------
+def _close(got, expected):
+    if expected is None:
+        return got is None
+    return abs((got - expected).total_seconds()) < 1e-3
+
+
+@pytest.mark.parametrize("loc", [PARIS, (69.65, 18.96)])
+def test_prayer_day_reads_like_compute_datetimes(loc):
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    day = pt.compute_day(date(2025, 6, 21), *loc)
+    expected = pt.compute_datetimes(date(2025, 6, 21), *loc)
+    assert list(day) == ORDERED_KEYS and len(day) == len(ORDERED_KEYS)
+    assert all(_close(day[k], expected[k]) for k in ORDERED_KEYS)
+    assert day.strings() == pt.compute(date(2025, 6, 21), *loc)
+
+
+@pytest.mark.parametrize("use_numpy", [pytest.param(True, marks=needs_numpy), False])
+def test_prayer_range_matches_single_days(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr("src.calculations.adhan_calc.np", None)
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    days = pt.compute_days(date(2025, 3, 28), date(2025, 4, 3), *PARIS)  # spans the DST switch
+    assert len(days) == 7 and days.dates()[0] == date(2025, 3, 28)
+    for day in days:
+        expected = pt.compute_datetimes(day.date, *PARIS)
+        assert all(_close(day[k], expected[k]) for k in ORDERED_KEYS)
+    assert days[-1].date == days[6].date == date(2025, 4, 3)
+    with pytest.raises(IndexError):
+        days[7]
+    with pytest.raises(ValueError):
+        PrayerRange(pt, date(2025, 1, 1), days.minutes[:-1])
+
+
+@pytest.mark.parametrize("tz", ["Europe/Paris", "America/New_York", "Australia/Lord_Howe", ""])
+def test_prayer_range_strings_match_datetimes(tz):
+    """The HH:MM:SS fast path must agree with strftime, DST days included."""
+    pt = PrayerTimes("MWL", "Shafi", tz)
+    days = pt.compute_days(date(2025, 1, 1), date(2025, 12, 31), 40.71, -74.0)
+    for key in ORDERED_KEYS:
+        datetimes = days.datetimes(key)
+        assert days.strings(key, HMS_FORMAT) == [dt.strftime(HMS_FORMAT) if dt else None for dt in datetimes]
+        assert days.strings(key) == [pt._format(dt) for dt in datetimes]
+
+
+@pytest.mark.parametrize("use_numpy", [pytest.param(True, marks=needs_numpy), False])
+def test_compute_grid_days_matches_compute_days(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr("src.calculations.adhan_calc.np", None)
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    locations = [PARIS, (21.42, 39.83), (-33.92, 18.42)]
+    ranges = pt.compute_grid_days(
+        date(2025, 1, 1), date(2025, 1, 10), [la for la, _ in locations], [lo for _, lo in locations]
+    )
+    for loc, got in zip(locations, ranges):
+        expected = pt.compute_days(date(2025, 1, 1), date(2025, 1, 10), *loc)
+        assert got.strings("Isha", HMS_FORMAT) == expected.strings("Isha", HMS_FORMAT)
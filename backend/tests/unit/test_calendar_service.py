@@ -0,0 +1,53 @@
+"""Month calendar grids: layout, both calendars per day, caching and prayer times."""
+from datetime import date
+
+import pytest
+
+from src.calculations.calendar import Gregorian, Hijri
+from src.services import adhan_service, calendar_service
+
+PARIS = (48.8566, 2.3522)
+
+
+def test_hijri_month_layout():
+    layout = calendar_service.month_layout("hijri", 1446, 9, "en")
+    assert layout["month_name"] == "Ramadan"
+    assert len(layout["days"]) == Hijri(1446, 9, 1).month_length() == 29
+    first = layout["days"][0]
+    assert first["gregorian"] == "2025-03-01" and first["hijri"] == "1446-09-01"
+    assert first["label"] == "Saturday 1 Ramadan 1446" and first["weekday"] == 6
+    assert layout["offset"] == 5 and layout["weeks"] == 5
+    assert [m["month"] for m in layout["gregorian_months"]] == [3]
+    assert [d["hijri_day"] for d in layout["days"]] == list(range(1, 30))
+
+
+def test_gregorian_month_marks_hijri_month_start():
+    layout = calendar_service.month_layout("gregorian", 2025, 3, "en", week_start=7)
+    assert layout["offset"] == 6  # March 1st 2025 is a Saturday
+    assert [(m["year"], m["month"]) for m in layout["hijri_months"]] == [(1446, 9), (1446, 10)]
+    starts = [d["gregorian"] for d in layout["days"] if d["hijri_month_start"]]
+    assert starts == ["2025-03-01", "2025-03-30"]
+    for day in layout["days"]:
+        hijri = Gregorian.fromisoformat(day["gregorian"]).to_hijri()
+        assert day["hijri"] == hijri.isoformat() and day["label"] == hijri.label("en")
+
+
+def test_layout_is_cached_per_month_and_language():
+    assert calendar_service.month_layout("hijri", 1446, 10, "ar") is calendar_service.month_layout("hijri", 1446, 10, "ar")
+    assert calendar_service.month_layout("hijri", 1446, 10, "en") is not calendar_service.month_layout("hijri", 1446, 10)
+
+
+def test_month_calendar_with_prayer_times():
+    payload = calendar_service.get_month_calendar("hijri", 1446, 9, "en", 1, *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert len(payload["times"]) == len(payload["days"])
+    day = adhan_service.get_prayer_times(date(2025, 3, 10), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert payload["times"][9] == day["times"]
+    assert "times" not in calendar_service.month_layout("hijri", 1446, 9, "en")
+
+
+@pytest.mark.parametrize(("calendar", "year", "month"), [
+    ("hijri", 1501, 1), ("hijri", 0, 1), ("gregorian", 2077, 11), ("gregorian", 0, 1), ("gregorian", 10000, 1),
+])
+def test_out_of_range_month(calendar, year, month):
+    with pytest.raises(OverflowError):
+        calendar_service.month_layout(calendar, year, month)
@@ -1,7 +1,9 @@
 from datetime import date
 
 import pytest
-from src.calculations.calendar import Gregorian, Hijri
+from src.calculations.calendar import Gregorian, Hijri, hijri_labels, hijri_range, to_hijri_arrays, to_hijri_many
+from src.calculations.calendar import hijri as hijri_module
+from src.calculations.calendar.hijri import day_table
 from src.calculations.calendar.um_qura import GREGORIAN_RANGE, HIJRI_RANGE
 
 h_min, h_max = HIJRI_RANGE
@@ -100,6 +102,10 @@ class TestHijri:
         assert self.hijri_date.day_name("en-US") == "Saturday"
         assert self.hijri_date.day_name("tr") == "Cumartesi"
 
+    def test_label(self):
+        assert self.hijri_date.label() == "Saturday 13 Sha'ban 1410"
+        assert self.hijri_date.label("tr") == "Cumartesi 13 Şaban 1410"
+
     def test_notation(self):
         assert self.hijri_date.notation() == "AH"
         assert self.hijri_date.notation("en") == "AH"
@@ -229,4 +235,44 @@ class TestGregorian:
     )
     def test_invalid_range(self, datetuple, err_message):
         with pytest.raises(OverflowError, match=err_message):
-            Gregorian(*datetuple)._check_range()
\ No newline at end of file
+            Gregorian(*datetuple)._check_range()
+
+
+def test_day_table_covers_gregorian_range():
+    first = date(*g_min).toordinal()
+    assert len(day_table()) == date(*g_max).toordinal() - first + 1
+    assert to_hijri_many([first, date(*g_max).toordinal()]) == [Hijri(*h_min), Hijri(*h_max)]
+
+
+def test_to_hijri_many_matches_to_hijri():
+    ordinals = range(date(2023, 12, 1).toordinal(), date(2025, 3, 1).toordinal())
+    assert to_hijri_many(ordinals) == [Gregorian.fromordinal(o).to_hijri() for o in ordinals]
+    assert [h.datetuple() for h in to_hijri_many([Hijri(1445, 6, 15).to_gregorian().toordinal()])] == [(1445, 6, 15)]
+
+
+@pytest.mark.parametrize("datetuple", [(1924, 7, 31), (2077, 11, 17)])
+def test_to_hijri_many_out_of_range(datetuple):
+    with pytest.raises(OverflowError, match="date must be in"):
+        to_hijri_many([date(2000, 1, 1).toordinal(), date(*datetuple).toordinal()])
+
+
+@pytest.mark.parametrize(
+    "use_numpy", [pytest.param(True, marks=pytest.mark.skipif(hijri_module.np is None, reason="numpy not installed")), False]
+)
+def test_hijri_range_matches_to_hijri_many(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr(hijri_module, "np", None)
+    start, end = date(*g_min), date(1926, 1, 1)
+    years, months, days = hijri_range(start, end)
+    expected = to_hijri_many(range(start.toordinal(), end.toordinal() + 1))
+    assert list(zip(years.tolist(), months.tolist(), days.tolist())) == [h.datetuple() for h in expected]
+    assert to_hijri_arrays([date(2077, 11, 16).toordinal()]).days.tolist() == [30]
+    with pytest.raises(OverflowError, match="got '2077-11-17'"):
+        to_hijri_arrays([date(2000, 1, 1).toordinal(), date(2077, 11, 17).toordinal()])
+
+
+@pytest.mark.parametrize("language", ["en", "ar"])
+def test_hijri_labels_match_label(language):
+    start, end = date(2025, 2, 20), date(2025, 3, 10)
+    expected = [h.label(language) for h in to_hijri_many(range(start.toordinal(), end.toordinal() + 1))]
+    assert hijri_labels(start, end, language) == expected
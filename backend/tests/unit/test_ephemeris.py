@@ -0,0 +1,119 @@
+"""Precomputed ephemeris table: format, interpolation and engine fallback."""
+from datetime import date
+
+import pytest
+
+from src.calculations import ephemeris
+from src.calculations.adhan_calc import ORDERED_KEYS, PrayerTimes
+
+PARIS = (48.8566, 2.3522)
+
+
+@pytest.fixture(scope="module")
+def table_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("ephemeris") / "ephemeris.bin"
+    jd_start = PrayerTimes.julian_day(2025, 1, 1) - 2
+    jd_end = PrayerTimes.julian_day(2025, 12, 31) + 4
+    ephemeris.build_table(path, PrayerTimes.sun_position, jd_start, jd_end)
+    return path
+
+
+@pytest.fixture
+def installed_table(table_path, monkeypatch):
+    """Install the test table as the engine's table, with a cold ephemeris cache."""
+    monkeypatch.setattr(ephemeris, "_table", ephemeris.EphemerisTable(table_path))
+    monkeypatch.setattr(ephemeris, "_table_loaded", True)
+    PrayerTimes.ephemeris_cache_clear()
+    yield
+    PrayerTimes.ephemeris_cache_clear()
+
+
+def test_samples_are_exact_at_midnight(table_path):
+    table = ephemeris.EphemerisTable(table_path)
+    jd0 = PrayerTimes.julian_day(2025, 10, 2)
+    assert table.lookup(jd0) == PrayerTimes.sun_position(jd0)
+
+
+@pytest.mark.parametrize("offset", [0.01, 0.1, 0.37, 0.5, 0.99, 1.7])
+def test_interpolation_matches_analytic(table_path, offset):
+    table = ephemeris.EphemerisTable(table_path)
+    jd = PrayerTimes.julian_day(2025, 6, 21) + offset
+    dec, eqt = table.lookup(jd)
+    ref_dec, ref_eqt = PrayerTimes.sun_position(jd)
+    assert dec == pytest.approx(ref_dec, abs=1e-10)
+    assert eqt == pytest.approx(ref_eqt, abs=1e-8)
+
+
+def test_out_of_range_returns_none(table_path):
+    table = ephemeris.EphemerisTable(table_path)
+    assert table.lookup(PrayerTimes.julian_day(2030, 1, 1)) is None
+    assert table.lookup(table.jd_start) is None
+
+
+def _track_mmaps(monkeypatch) -> list:
+    opened = []
+    real_mmap = ephemeris.mmap.mmap
+
+    def tracking_mmap(*args, **kwargs):
+        opened.append(real_mmap(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(ephemeris.mmap, "mmap", tracking_mmap)
+    return opened
+
+
+@pytest.mark.parametrize("content", [b"\0" * 64, b"ADHNEPH1"])
+def test_rejects_foreign_file(tmp_path, monkeypatch, content):
+    path = tmp_path / "bogus.bin"
+    path.write_bytes(content)
+    opened = _track_mmaps(monkeypatch)
+    with pytest.raises(ValueError, match="not an ephemeris file"):
+        ephemeris.EphemerisTable(path)
+    assert opened and all(mm.closed for mm in opened)
+
+
+def test_rejects_truncated_file(tmp_path, table_path, monkeypatch):
+    path = tmp_path / "truncated.bin"
+    path.write_bytes(table_path.read_bytes()[:-16])
+    opened = _track_mmaps(monkeypatch)
+    with pytest.raises(ValueError, match="truncated"):
+        ephemeris.EphemerisTable(path)
+    assert opened and all(mm.closed for mm in opened)
+
+
+def test_step_must_divide_a_day(tmp_path):
+    with pytest.raises(ValueError):
+        ephemeris.build_table(tmp_path / "x.bin", PrayerTimes.sun_position, 2460000.5, 2460001.5, step=0.3)
+
+
+@pytest.mark.usefixtures("installed_table")
+def test_engine_reads_table():
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    times = pt.compute(date(2025, 10, 2), *PARIS)
+    assert times["Fajr"].startswith("06:06:18")
+    assert times["Dhuhr"].startswith("13:40:00")
+    assert times["Maghrib"].startswith("19:27:19")
+
+
+def test_engine_falls_back_without_table(monkeypatch, tmp_path):
+    monkeypatch.setattr(ephemeris, "_table_loaded", False)
+    monkeypatch.setenv("EPHEMERIS_PATH", str(tmp_path / "missing.bin"))
+    assert ephemeris.get_table() is None
+    PrayerTimes.ephemeris_cache_clear()
+    times = PrayerTimes("MWL", "Shafi", "Europe/Paris").compute_datetimes(date(2025, 10, 2), *PARIS)
+    assert all(times[k] is not None for k in ORDERED_KEYS)
+
+
+def test_engine_falls_back_on_corrupt_table(monkeypatch, tmp_path, caplog):
+    path = tmp_path / "corrupt.bin"
+    path.write_bytes(b"NOTANEPH" + bytes(64))
+    monkeypatch.setattr(ephemeris, "_table", ephemeris._table)  # restored afterwards
+    monkeypatch.setattr(ephemeris, "_table_loaded", False)
+    monkeypatch.setenv("EPHEMERIS_PATH", str(path))
+    with caplog.at_level("WARNING", logger="adhan_api.ephemeris"):
+        assert ephemeris.get_table() is None
+        assert ephemeris.get_table() is None
+    assert len(caplog.records) == 1  # logged once, then remembered
+    PrayerTimes.ephemeris_cache_clear()
+    times = PrayerTimes("MWL", "Shafi", "Europe/Paris").compute(date(2025, 10, 2), *PARIS)
+    assert times["Fajr"].startswith("06:06:18")
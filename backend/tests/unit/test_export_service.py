@@ -0,0 +1,61 @@
+"""Streamed NDJSON/CSV exports: chunking, row contents and encodings."""
+import csv
+import io
+import json
+from datetime import date
+
+import pytest
+
+from src.domain.models import City
+from src.services import export_service
+from src.services.adhan_service import get_year_prayer_times
+from src.services.export_service import EXPORT_COLUMNS, export_lines, iter_export_chunks
+
+PARIS = City(id=7, name="Paris", lat=48.8566, lon=2.3522, country="FR")
+
+
+def _chunks(start, end, locations=(PARIS,)):
+    return iter_export_chunks(start, end, list(locations), "MWL", "Shafi", "Europe/Paris", language="en")
+
+
+def test_rows_match_the_daily_payloads():
+    rows = [row for chunk in _chunks(date(2025, 1, 1), date(2025, 12, 31)) for row in chunk]
+    days = get_year_prayer_times(2025, PARIS.lat, PARIS.lon, "MWL", "Shafi", "Europe/Paris", language="en")
+    assert len(rows) == len(days) == 365
+    for row, day in zip(rows, days):
+        assert list(row) == EXPORT_COLUMNS
+        assert (row["date"], row["hijri_date"], row["city"]) == (day["date"], day["hijri_date"], "Paris")
+        assert all(row[k] == (v and v[:8]) for k, v in day["times"].items())
+    oct_2 = rows[274]
+    assert (oct_2["date"], oct_2["Fajr"], oct_2["Dhuhr"], oct_2["Maghrib"]) == ("2025-10-02", "06:06:18", "13:40:00", "19:27:19")
+
+
+def test_chunks_are_bounded_and_ordered(monkeypatch):
+    monkeypatch.setattr(export_service, "EXPORT_CHUNK_DAYS", 10)
+    mecca = City(lat=21.4225, lon=39.8262)
+    chunks = list(_chunks(date(2024, 12, 25), date(2025, 1, 25), [PARIS, mecca]))
+    assert [len(c) for c in chunks] == [10, 10, 10, 2] * 2
+    rows = [row for chunk in chunks for row in chunk]
+    assert [r["date"] for r in rows[:32]] == [r["date"] for r in rows[32:]]
+    assert rows[0]["date"] == "2024-12-25" and rows[31]["date"] == "2025-01-25"
+    assert rows[32]["city_id"] is None and rows[32]["latitude"] == 21.4225
+
+
+def test_ndjson_lines():
+    body = b"".join(export_lines("ndjson", _chunks(date(2025, 3, 1), date(2025, 3, 3))))
+    lines = body.decode().splitlines()
+    assert [json.loads(line)["date"] for line in lines] == ["2025-03-01", "2025-03-02", "2025-03-03"]
+
+
+def test_csv_lines():
+    body = b"".join(export_lines("csv", _chunks(date(2025, 6, 20), date(2025, 6, 21), [City(lat=21.4225, lon=39.8262)])))
+    rows = list(csv.reader(io.StringIO(body.decode())))
+    assert rows[0] == EXPORT_COLUMNS and len(rows) == 3
+    assert rows[1][EXPORT_COLUMNS.index("date")] == "2025-06-20"
+    assert rows[1][EXPORT_COLUMNS.index("city_id")] == ""
+    assert b"".join(export_lines("csv", iter([]))) == (",".join(EXPORT_COLUMNS) + "\r\n").encode()
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        export_lines("xml", iter([]))
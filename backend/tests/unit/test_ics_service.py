@@ -0,0 +1,70 @@
+"""iCalendar feeds: window, event contents, RFC 5545 formatting and month caching."""
+from datetime import date
+
+from src.services import ics_service
+from src.services.ics_service import _fold, get_prayer_calendar, month_events, window_months
+
+PARIS = (48.8566, 2.3522, "MWL", "Shafi", "Europe/Paris")
+PARIS_EVENTS = PARIS[:4]
+
+
+def _lines(body: bytes) -> list[str]:
+    text = body.decode("utf-8")
+    assert text.endswith("\r\n") and "\n" not in text.replace("\r\n", "")
+    return text.replace("\r\n ", "").split("\r\n")[:-1]  # unfolded
+
+
+def test_window_months_cross_the_year_end():
+    assert window_months(date(2025, 11, 30)) == [(2025, 11), (2025, 12), (2026, 1)]
+    assert window_months(date(2025, 1, 1), 1) == [(2025, 1)]
+
+
+def test_feed_holds_five_prayers_a_day_in_utc():
+    lines = _lines(get_prayer_calendar(date(2025, 10, 2), *PARIS, name="Paris"))
+    assert lines[0] == "BEGIN:VCALENDAR" and lines[-1] == "END:VCALENDAR"
+    starts = [line for line in lines if line.startswith("DTSTART:")]
+    assert len(starts) == 5 * (31 + 30 + 31)
+    # Golden vector (local 06:06:18, 13:40:00 and 19:27:19 CEST).
+    assert {"DTSTART:20251002T040618Z", "DTSTART:20251002T114000Z", "DTSTART:20251002T172719Z"} <= set(starts)
+    uids = [line for line in lines if line.startswith("UID:")]
+    assert len(set(uids)) == len(uids)
+    assert "SUMMARY:Fajr - Paris" in lines
+
+
+def test_feed_is_deterministic():
+    first = get_prayer_calendar(date(2025, 10, 2), *PARIS)
+    month_events.cache_clear()
+    assert get_prayer_calendar(date(2025, 10, 30), *PARIS) == first
+
+
+def test_rolling_the_window_renders_one_month():
+    month_events.cache_clear()
+    get_prayer_calendar(date(2025, 10, 2), *PARIS)
+    get_prayer_calendar(date(2025, 11, 2), *PARIS)
+    info = month_events.cache_info()
+    assert (info.misses, info.hits) == (4, 2)
+
+
+def test_timezones_share_the_month_cache():
+    month_events.cache_clear()
+    paris = get_prayer_calendar(date(2025, 10, 2), *PARIS)
+    tokyo = get_prayer_calendar(date(2025, 10, 2), *PARIS_EVENTS, "Asia/Tokyo")
+    assert month_events.cache_info().misses == 3
+    assert tokyo.replace(b"X-WR-TIMEZONE:Asia/Tokyo", b"X-WR-TIMEZONE:Europe/Paris") == paris
+
+
+def test_long_lines_are_folded():
+    name = "Saint-Rémy-de-Provence, Bouches-du-Rhône; Provence-Alpes-Côte d'Azur"
+    block = month_events(2025, 10, *PARIS_EVENTS, name=name)
+    assert all(len(line.encode("utf-8")) <= 75 for line in block.split("\r\n"))
+    assert "LOCATION:Saint-Rémy-de-Provence\\, Bouches-du-Rhône\\; Provence-Alpes-Côte d'Azur" in _lines(
+        block.encode("utf-8")
+    )
+    folded = _fold("X" * 200)
+    assert folded.endswith("\r\n") and folded.replace("\r\n ", "") == "X" * 200 + "\r\n"
+
+
+def test_polar_days_skip_missing_events(monkeypatch):
+    monkeypatch.setattr(ics_service, "SCHEDULABLE_KEYS", ["Dhuhr", "Maghrib"])
+    block = month_events(2025, 6, 78.22, 15.65, "MWL", "Shafi")
+    assert block.count("-dhuhr-") == 30 and "-maghrib-" not in block  # midnight sun
@@ -0,0 +1,37 @@
+"""Bulk JSON responses: serializer parity and content-coding negotiation."""
+import gzip
+import json
+from datetime import date
+
+from src.core import json_response
+from src.core.json_response import MIN_COMPRESS_BYTES, compress, dumps, negotiate_encoding
+from src.services.adhan_service import get_month_prayer_times
+
+
+def test_dumps_matches_compact_json():
+    payload = get_month_prayer_times(2025, 10, 48.8566, 2.3522, "MWL", "Shafi", "Europe/Paris")
+    assert dumps(payload) == json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def test_dumps_without_orjson(monkeypatch):
+    monkeypatch.setattr(json_response, "orjson", None)
+    payload = {"dates": [date(2025, 1, 1).isoformat()], "label": "الأربعاء", "x": [1.5, None, True]}
+    assert dumps(payload) == json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def test_negotiate_encoding(monkeypatch):
+    big = MIN_COMPRESS_BYTES
+    assert negotiate_encoding(None, big) is None
+    assert negotiate_encoding("gzip", big - 1) is None
+    assert negotiate_encoding("gzip, deflate", big) == "gzip"
+    assert negotiate_encoding("gzip;q=0, identity", big) is None
+    assert negotiate_encoding("GZIP;q=0.5", big) == "gzip"
+    monkeypatch.setattr(json_response, "brotli", None)
+    assert negotiate_encoding("br, gzip", big) == "gzip"
+    assert negotiate_encoding("br", big) is None
+
+
+def test_gzip_is_deterministic():
+    body = b'{"a":1}' * 500
+    assert compress(body, "gzip") == compress(body, "gzip")
+    assert gzip.decompress(compress(body, "gzip")) == body
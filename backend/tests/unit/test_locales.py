@@ -59,4 +59,17 @@ class TestGettingLocale:
 
     def test_unsupported_language(self):
         with pytest.raises(ValueError, match="unsupported language: xy"):
-            locales.get_locale("xy")
\ No newline at end of file
+            locales.get_locale("xy")
+
+    def test_locales_are_shared(self):
+        assert locales.get_locale("en") is locales.get_locale("en-US")
+        assert locales.get_locale("ar") is not locales.get_locale("en")
+
+
+@pytest.mark.parametrize("tag", get_args(locales.Language))
+def test_hijri_label_matches_names(tag):
+    locale = locales.get_locale(tag)
+    for month in range(1, 13):
+        for weekday in range(1, 8):
+            expected = f"{locale.day_name(weekday)} 7 {locale.month_name(month)} 1446"
+            assert locale.hijri_label(1446, month, 7, weekday) == expected
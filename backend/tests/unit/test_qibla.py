@@ -0,0 +1,87 @@
+"""Qibla bearing/distance and sun tracks: reference values, batch vs scalar, per-city cache."""
+from datetime import date
+
+import pytest
+
+from src.calculations import batch, qibla
+from src.calculations.adhan_calc import PrayerTimes
+from src.domain.models import City
+from src.services.qibla_service import QiblaService
+
+PARIS = (48.8566, 2.3522)
+NEW_YORK = (40.7128, -74.0060)
+LOCATIONS = [PARIS, NEW_YORK, (-33.92, 18.42), (35.68, 139.69), (69.65, 18.96), (qibla.KAABA_LAT, qibla.KAABA_LON)]
+
+needs_numpy = pytest.mark.skipif(batch.np is None, reason="numpy not installed")
+
+
+class FakeCityRepository:
+    def __init__(self, cities):
+        self.cities = {c.id: c for c in cities}
+        self.lookups = 0
+
+    def get_cities_by_ids(self, city_ids):
+        self.lookups += 1
+        return [self.cities[i] for i in city_ids if i in self.cities]
+
+
+def test_reference_bearings_and_distances():
+    assert qibla.qibla_bearing(*PARIS) == pytest.approx(119.16, abs=0.01)
+    assert qibla.kaaba_distance_km(*PARIS) == pytest.approx(4496, abs=1)
+    assert qibla.qibla_bearing(*NEW_YORK) == pytest.approx(58.48, abs=0.01)
+    assert qibla.kaaba_distance_km(qibla.KAABA_LAT, qibla.KAABA_LON) == 0.0
+
+
+@pytest.mark.parametrize("use_numpy", [pytest.param(True, marks=needs_numpy), False])
+def test_qibla_many_matches_scalar(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr("src.calculations.qibla.np", None)
+    bearings, distances = qibla.qibla_many([la for la, _ in LOCATIONS], [lo for _, lo in LOCATIONS])
+    for (lat, lon), bearing, distance in zip(LOCATIONS, bearings, distances):
+        assert bearing == pytest.approx(qibla.qibla_bearing(lat, lon), abs=1e-9)
+        assert distance == pytest.approx(qibla.kaaba_distance_km(lat, lon), abs=1e-6)
+    with pytest.raises(ValueError):
+        qibla.qibla_many([1.0], [])
+
+
+@pytest.mark.parametrize("use_numpy", [pytest.param(True, marks=needs_numpy), False])
+def test_sun_tracks_match_scalar(use_numpy, monkeypatch):
+    if not use_numpy:
+        monkeypatch.setattr("src.calculations.qibla.np", None)
+    day = date(2025, 3, 20)
+    tracks = qibla.sun_tracks(day, [la for la, _ in LOCATIONS], [lo for _, lo in LOCATIONS], 30)
+    jd0 = PrayerTimes.julian_day(2025, 3, 20)
+    for (lat, lon), track in zip(LOCATIONS, tracks):
+        assert track.minutes == list(range(0, 1440, 30))
+        for m, alt, az in zip(track.minutes, track.altitude, track.azimuth):
+            expected = qibla.sun_altitude_azimuth(jd0 + m / 1440.0, lat, lon)
+            assert (alt, az) == pytest.approx(expected, abs=1e-6)
+
+
+def test_sun_track_noon_and_horizon():
+    """Near the solstice the Paris noon altitude is 90 - lat + 23.44; it sets in the north-west."""
+    day = PrayerTimes("MWL", "Shafi", "UTC").compute_day(date(2025, 6, 21), *PARIS)
+    track = qibla.sun_track(date(2025, 6, 21), *PARIS, step_minutes=1)
+    noon = round(day.utc("Dhuhr"))
+    assert track.altitude[noon] == pytest.approx(90 - PARIS[0] + 23.44, abs=0.1)
+    assert 175 < track.azimuth[noon] < 185
+    sunset = round(day.utc("Sunset"))
+    assert track.altitude[sunset] == pytest.approx(-0.83, abs=0.3)
+    assert 295 < track.azimuth[sunset] < 315
+    with pytest.raises(ValueError):
+        qibla.sun_track(date(2025, 6, 21), *PARIS, step_minutes=0)
+
+
+def test_service_caches_per_city_id():
+    repo = FakeCityRepository([City(id=1, name="Paris", lat=PARIS[0], lon=PARIS[1]), City(id=2, lat=10.0, lon=10.0)])
+    service = QiblaService(repo)
+    cities, missing = service.resolve([2, 1, 3])
+    assert [c.id for c in cities] == [2, 1] and missing == [3]
+    first = service.get_qibla(cities + [City(lat=NEW_YORK[0], lon=NEW_YORK[1])])
+    assert [r["id"] for r in first] == [2, 1, None]
+    assert first[1]["bearing"] == round(qibla.qibla_bearing(*PARIS), 4)
+    again = service.get_qibla(cities)
+    assert again[0] is first[0] and again[1] is first[1]
+    tracks = service.get_sun_tracks(cities, date(2025, 1, 1), 60)
+    assert service.get_sun_tracks(cities, date(2025, 1, 1), 60)[0] is tracks[0]
+    assert service.get_sun_tracks(cities, date(2025, 1, 2), 60)[0] is not tracks[0]
@@ -0,0 +1,121 @@
+"""Response cache: LRU bound, shared disk tier and HTTP validators."""
+import gzip
+from email.utils import formatdate
+
+from starlette.requests import Request
+
+from src.api.v1 import prayer_times_api as api
+from src.core import response_cache
+from src.core.response_cache import ResponseCache
+
+
+def _builder(body: bytes):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return body
+
+    return build, calls
+
+
+def test_memory_hit_builds_once():
+    cache = ResponseCache()
+    build, calls = _builder(b'{"a":1}')
+    key = ResponseCache.key_for("day", "2025-03-01", 48.85)
+    first = cache.get_or_build(key, build)
+    assert cache.get_or_build(key, build) is first
+    assert len(calls) == 1 and cache.info()["hits"] == 1
+    assert first.etag.startswith('"') and first.etag.endswith('"')
+
+
+def test_memory_is_bounded_in_bytes():
+    cache = ResponseCache(max_bytes=25)
+    for i in range(5):
+        cache.get_or_build(str(i), lambda: b"0123456789")
+    assert cache.info()["entries"] == 2 and cache.info()["bytes"] == 20
+    build, calls = _builder(b"0123456789")
+    cache.get_or_build("0", build)  # evicted: rebuilt
+    assert calls == [1]
+
+
+def test_disk_tier_is_shared(tmp_path):
+    build, calls = _builder(b'{"year":2025}')
+    first = ResponseCache(str(tmp_path)).get_or_build("k" * 40, build)
+    other_worker = ResponseCache(str(tmp_path))
+    second = other_worker.get_or_build("k" * 40, build)
+    assert calls == [1]
+    assert (second.body, second.etag, second.last_modified) == (first.body, first.etag, first.last_modified)
+    other_worker.clear()
+    assert not list(tmp_path.rglob("*.json"))
+
+
+def test_disk_tier_is_pruned(tmp_path, monkeypatch):
+    monkeypatch.setattr(response_cache, "DISK_PRUNE_INTERVAL", 1)
+    cache = ResponseCache(str(tmp_path), max_disk_entries=3)
+    for i in range(6):
+        cache.get_or_build(f"{i:02d}" * 20, lambda: b"{}")
+    assert len(list(tmp_path.rglob("*.json"))) == 3
+
+
+def test_engine_version_is_part_of_the_key(monkeypatch):
+    key = ResponseCache.key_for("year", 2025)
+    monkeypatch.setattr(response_cache, "ENGINE_VERSION", "0")
+    assert ResponseCache.key_for("year", 2025) != key
+
+
+def test_conditional_requests():
+    entry = ResponseCache().get_or_build("k", lambda: b"{}")
+    assert entry.not_modified(entry.etag, None)
+    assert entry.not_modified(f'"other", W/{entry.etag}', None)
+    assert entry.not_modified("*", None)
+    assert not entry.not_modified('"other"', None)
+    # If-None-Match wins over If-Modified-Since.
+    assert not entry.not_modified('"other"', entry.last_modified_http)
+    assert entry.not_modified(None, entry.last_modified_http)
+    assert not entry.not_modified(None, formatdate(entry.last_modified - 60, usegmt=True))
+    assert not entry.not_modified(None, "not a date")
+    assert not entry.not_modified(None, None)
+
+
+def test_each_content_coding_has_its_own_etag():
+    entry = ResponseCache().get_or_build("k", lambda: b'{"a":1}' * 400)
+    gz = entry.body_for("gzip")
+    assert entry.body_for("gzip") is gz and gzip.decompress(gz) == entry.body
+    assert entry.etag_for(None) == entry.etag
+    assert entry.etag_for("gzip") == entry.etag[:-1] + '-gzip"'
+    assert entry.not_modified(entry.etag_for("gzip"), None, "gzip")
+    assert not entry.not_modified(entry.etag, None, "gzip")
+
+
+def test_compressed_variants_count_towards_the_budget():
+    body = bytes(range(256)) * 4  # barely compressible: the variant is about as large as the body
+    cache = ResponseCache(max_bytes=3 * len(body))
+    first = cache.get_or_build("a", lambda: body)
+    cache.get_or_build("b", lambda: body)
+    gz = cache.body_for("a", first, "gzip")
+    assert cache.body_for("a", first, "gzip") is gz
+    assert cache.info()["bytes"] == 2 * len(body) + len(gz)
+    cache.get_or_build("c", lambda: body)  # over budget: "a" and its variant go first
+    assert cache.info()["entries"] == 2 and cache.info()["bytes"] == 2 * len(body)
+
+
+def test_disk_file_extension_follows_the_media_type(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+    cache.get_or_build("i" * 40, lambda: b"BEGIN:VCALENDAR\r\n", "text/calendar; charset=utf-8")
+    cache.get_or_build("j" * 40, lambda: b"{}")
+    assert sorted(p.suffix for p in tmp_path.rglob("*.*")) == [".ics", ".json"]
+    entry = ResponseCache(str(tmp_path)).get_or_build("i" * 40, lambda: b"", "text/calendar; charset=utf-8")
+    assert entry.body == b"BEGIN:VCALENDAR\r\n" and entry.media_type == "text/calendar; charset=utf-8"
+    cache.clear()
+    assert not list(tmp_path.rglob("*.*"))
+
+
+def test_cacheable_responses_do_not_carry_the_device_time(monkeypatch):
+    monkeypatch.setattr(api, "_response_cache", lambda: ResponseCache())
+    request = Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+    fixed = api._cached_json(request, ("day", "2025-10-02"), lambda: {"a": 1}, fixed=True)
+    today = api._cached_json(request, ("day", None), lambda: {"a": 1}, fixed=False)
+    assert fixed.headers["Cache-Control"] == api.CACHE_CONTROL_FIXED
+    assert api.DEVICE_TIME_HEADER not in fixed.headers
+    assert today.headers["Cache-Control"] == "no-cache" and api.DEVICE_TIME_HEADER in today.headers
@@ -0,0 +1,155 @@
+"""Persisted timetable cache: round trip, invalidation and service wiring."""
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.adapters.sqlite import SQLiteTimetableRepository
+from src.calculations.adhan_calc import ORDERED_KEYS, PrayerTimes
+from src.domain.models import Timetable
+from src.services import adhan_service, timetable_service
+from src.services.device_service import DeviceService
+from src.services.timetable_service import TimetableService
+
+PARIS = (48.8566, 2.3522)
+OSLO = (69.65, 18.96)  # Tromso: polar day and night, so None events round-trip too
+
+
+class CountingRepository(SQLiteTimetableRepository):
+    def __init__(self, db_path):
+        super().__init__(db_path)
+        self.reads = self.writes = 0
+
+    def get_timetable(self, key):
+        self.reads += 1
+        return super().get_timetable(key)
+
+    def save_timetable(self, timetable):
+        self.writes += 1
+        super().save_timetable(timetable)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    return CountingRepository(f"sqlite:///{tmp_path / 'timetables.db'}")
+
+
+def _assert_close(got, expected):
+    assert list(got) == ORDERED_KEYS
+    for k in ORDERED_KEYS:
+        if expected[k] is None:
+            assert got[k] is None, k
+        else:
+            assert abs((got[k] - expected[k]).total_seconds()) < 1e-3, k
+
+
+@pytest.mark.parametrize("loc", [PARIS, OSLO])
+def test_cached_days_match_engine(repo, loc):
+    service = TimetableService(repo)
+    pt = PrayerTimes("MWL", "Hanafi", "Europe/Oslo")
+    for day in (date(2024, 1, 1), date(2024, 2, 29), date(2024, 6, 21), date(2024, 12, 31)):
+        _assert_close(service.get_day(pt, day, *loc), pt.compute_datetimes(day, *loc))
+    assert repo.writes == 1
+
+
+def test_year_is_persisted_and_shared_across_timezones(repo):
+    TimetableService(repo).get_day(PrayerTimes("MWL", "Shafi", "Europe/Paris"), date(2025, 3, 1), *PARIS)
+    fresh = TimetableService(repo)  # empty memory tier: served from the database
+    pt = PrayerTimes("MWL", "Shafi", "UTC")
+    _assert_close(fresh.get_day(pt, date(2025, 7, 1), *PARIS), pt.compute_datetimes(date(2025, 7, 1), *PARIS))
+    assert repo.writes == 1 and repo.reads == 2
+    fresh.get_day(pt, date(2025, 7, 2), *PARIS)
+    assert repo.reads == 2  # memory tier
+
+
+def test_configuration_is_part_of_the_key(repo):
+    service = TimetableService(repo)
+    service.get_year(PrayerTimes("MWL", "Shafi", "UTC"), 2025, *PARIS)
+    service.get_year(PrayerTimes("MWL", "Hanafi", "UTC"), 2025, *PARIS)
+    service.get_year(PrayerTimes("MWL", "Shafi", "UTC", high_latitude_rule="middle_of_night"), 2025, *PARIS)
+    service.get_year(PrayerTimes("MWL", "Shafi", "UTC"), 2026, *PARIS)
+    service.get_year(PrayerTimes("MWL", "Shafi", "UTC"), 2025, 48.85661, 2.35221)  # same rounded location
+    assert repo.writes == 4
+
+
+def test_engine_version_change_invalidates(repo, monkeypatch):
+    pt = PrayerTimes("MWL", "Shafi", "UTC")
+    TimetableService(repo).get_year(pt, 2025, *PARIS)
+    monkeypatch.setattr(timetable_service, "ENGINE_VERSION", "next")
+    service = TimetableService(repo)
+    service.get_year(pt, 2025, *PARIS)
+    assert repo.writes == 2  # stale entry recomputed and replaced
+    TimetableService(repo).get_year(pt, 2026, *PARIS)
+    monkeypatch.setattr(timetable_service, "ENGINE_VERSION", "newer")
+    assert service.purge_stale() == 2
+
+
+def test_days_span_the_year_end(repo):
+    service = TimetableService(repo)
+    pt = PrayerTimes("MWL", "Shafi", "Europe/Paris")
+    days = service.get_days(pt, date(2024, 12, 30), date(2025, 1, 2), *PARIS)
+    assert days.dates() == [date(2024, 12, 30), date(2024, 12, 31), date(2025, 1, 1), date(2025, 1, 2)]
+    for day in days:
+        _assert_close(day, pt.compute_datetimes(day.date, *PARIS))
+    assert repo.writes == 2
+    year = service.get_days(pt, date(2025, 1, 1), date(2025, 12, 31), *PARIS)
+    assert year.minutes is service.get_year(pt, 2025, *PARIS)
+
+
+def test_warm_and_service_wiring(repo):
+    service = TimetableService(repo)
+    pt = PrayerTimes.for_config("MWL", "Shafi", "Europe/Paris")
+    assert service.warm(pt, (2025, 2026), [PARIS]) == 2
+    assert repo.writes == 2
+    month = adhan_service.get_month_prayer_times(2025, 12, *PARIS, "MWL", "Shafi", "Europe/Paris", timetables=service)
+    single = adhan_service.get_prayer_times(date(2025, 12, 31), *PARIS, "MWL", "Shafi", "Europe/Paris")
+    assert month[-1]["times"] == single["times"]
+    days = list(adhan_service.iter_prayer_times(date(2025, 12, 30), date(2026, 1, 2), *PARIS, "MWL", "Shafi",
+                                                "Europe/Paris", timetables=service))
+    assert [d["date"] for d in days] == ["2025-12-30", "2025-12-31", "2026-01-01", "2026-01-02"]
+    assert repo.writes == 2
+
+
+def test_public_service_reads_but_does_not_persist(repo):
+    pt = PrayerTimes.for_config("MWL", "Shafi", "UTC")
+    TimetableService(repo).get_year(pt, 2025, *PARIS)
+    public = TimetableService(repo, persist=False)
+    public.get_year(pt, 2025, *PARIS)
+    public.get_year(pt, 2025, 12.3456, 45.6789)
+    assert repo.writes == 1 and repo.reads == 3
+
+
+def test_equivalent_configurations_share_a_row(repo):
+    service = TimetableService(repo)
+    for madhab in ("Shafi", "shafi", "SHAFI"):
+        service.get_year(PrayerTimes("mwl", madhab, "UTC"), 2025, *PARIS)
+    service.get_year(PrayerTimes("MWL", "hanafi", "UTC"), 2025, *PARIS)
+    assert repo.writes == 2
+
+
+def test_concurrent_insert_replaces_the_row(repo, monkeypatch):
+    key = TimetableService.key_for(PrayerTimes("MWL", "Shafi", "UTC"), 2025, *PARIS)
+    repo.save_timetable(Timetable(key, "v1", b"first"))
+    update = SQLiteTimetableRepository._update
+    calls = []
+
+    def racing_update(session, columns, values):
+        # The first lookup misses: another writer inserts the key right after it.
+        calls.append(columns)
+        return len(calls) > 1 and update(session, columns, values)
+
+    monkeypatch.setattr(SQLiteTimetableRepository, "_update", staticmethod(racing_update))
+    repo.save_timetable(Timetable(key, "v2", b"second"))
+    assert len(calls) == 2
+    stored = repo.get_timetable(key)
+    assert (stored.engine_version, stored.minutes) == ("v2", b"second")
+
+
+def test_warm_timetables_keeps_zero_coordinates(repo, monkeypatch):
+    service = DeviceService(MagicMock(), MagicMock())
+    settings = SimpleNamespace(city={"lat": 0.0, "lon": 0.0}, selected_method="MWL", high_latitude_rule=None)
+    monkeypatch.setattr(service, "settings_repository", MagicMock(list_settings=MagicMock(return_value=[settings])))
+    monkeypatch.setattr(service, "timetable_service", TimetableService(repo))
+    assert service.warm_timetables() == 2
+    assert repo.writes == 2
@@ -0,0 +1,62 @@
+"""High-precision (VSOP87) solar position: reference values and interpolation."""
+import math
+
+import pytest
+
+from src.calculations import batch, vsop87
+
+# Meeus examples 25.b / 28.a: 1992 October 13.0 TD.
+JDE = 2448908.5
+ARCSEC_DEG = 1.0 / 3600.0
+
+needs_numpy = pytest.mark.skipif(batch.np is None, reason="numpy not installed")
+
+
+def test_apparent_sun_matches_meeus_example():
+    lam, beta, alpha, delta = vsop87.apparent_sun(JDE)
+    # Tolerances cover the low-accuracy nutation (~0.5").
+    assert math.degrees(lam) == pytest.approx(199.906060, abs=2 * ARCSEC_DEG)
+    assert math.degrees(beta) == pytest.approx(0.72 * ARCSEC_DEG, abs=0.1 * ARCSEC_DEG)
+    assert math.degrees(alpha) == pytest.approx(198.378121, abs=2 * ARCSEC_DEG)
+    assert math.degrees(delta) == pytest.approx(-7.783817, abs=2 * ARCSEC_DEG)
+
+
+def test_equation_of_time_matches_meeus_example():
+    jd_ut = JDE - vsop87.delta_t(JDE) / 86400.0
+    _, eqt = vsop87.sun_position_exact(jd_ut)
+    assert eqt == pytest.approx(13.71, abs=0.01)
+
+
+def test_delta_t_is_continuous_and_plausible():
+    assert vsop87.delta_t(2451545.0) == pytest.approx(63.9, abs=0.5)  # J2000
+    for year in (1920, 1941, 1961, 1986, 2005, 2050):
+        jd = 2451545.0 + (year - 2000) * 365.25
+        assert vsop87.delta_t(jd - 1e-3) == pytest.approx(vsop87.delta_t(jd + 1e-3), abs=1.0)
+
+
+def test_midnight_returns_exact_node():
+    jd = 2460950.5
+    assert vsop87.sun_position(jd) == vsop87.sun_position_exact(jd)
+
+
+@pytest.mark.parametrize("offset", [0.1, 0.37, 0.5, 0.93])
+def test_interpolation_matches_series(offset):
+    jd = 2460950.5 + offset
+    dec, eqt = vsop87.sun_position(jd)
+    exact_dec, exact_eqt = vsop87.sun_position_exact(jd)
+    assert dec == pytest.approx(exact_dec, abs=1e-8)
+    assert eqt == pytest.approx(exact_eqt, abs=1e-5)
+
+
+@needs_numpy
+def test_array_matches_scalar_and_keeps_nan():
+    np = batch.np
+    jd = np.array([[2460950.5, 2460951.27], [np.nan, 2460990.81]])
+    dec, eqt = vsop87.sun_position_array(jd)
+    assert np.isnan(dec[1, 0]) and np.isnan(eqt[1, 0])
+    for idx in [(0, 0), (0, 1), (1, 1)]:
+        expected = vsop87.sun_position(float(jd[idx]))
+        assert dec[idx] == pytest.approx(expected[0], abs=1e-12)
+        assert eqt[idx] == pytest.approx(expected[1], abs=1e-9)
+    all_nan, _ = vsop87.sun_position_array(np.full(3, np.nan))
+    assert np.isnan(all_nan).all()